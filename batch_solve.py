@@ -0,0 +1,55 @@
+# RCAIDE_GUI/batch_solve.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import argparse
+import multiprocessing
+import os
+import sys
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Headless batch solver
+# ----------------------------------------------------------------------------------------------------------------------
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Rebuild and solve RCAIDE GUI project files (saved with File > Save) without a display.")
+    parser.add_argument("files", nargs="+", help="Project JSON files to solve.")
+    parser.add_argument("-o", "--output-dir", default="batch_results",
+                        help="Directory receiving one sub-directory of results per project (default: batch_results).")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Number of projects solved in parallel (default: 1).")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="Wall-clock budget in seconds for each mission solve (default: unlimited).")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+
+    # Resolve paths before moving to the application directory, which the builders expect as working directory.
+    paths = [os.path.abspath(path) for path in arguments.files]
+    output_dir = os.path.abspath(arguments.output_dir)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    from tabs.solve.batch import run_batch
+
+    def report(summary):
+        print(f"[{summary['status']}] {summary['file']} ({summary['elapsed_seconds']:.1f} s)")
+        if summary["message"]:
+            print(summary["message"])
+
+    summaries = run_batch(paths, output_dir, jobs=arguments.jobs, time_budget=arguments.time_budget,
+                          on_summary=report)
+
+    failures = [summary for summary in summaries if summary["status"] != "finished"]
+    print(f"Solved {len(summaries) - len(failures)}/{len(summaries)} projects; results in {output_dir}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    # Solves run in spawned processes, which re-import this module.
+    multiprocessing.freeze_support()
+    sys.exit(main())
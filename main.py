@@ -1,12 +1,14 @@
 
-from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget, QFileDialog
+from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget, QFileDialog, QMessageBox
 from PyQt6.QtGui import QAction
 from PyQt6.QtCore import QFileInfo 
 from qt_material import apply_stylesheet
 import values
 from tabs import *
 from tabs.visualize_geometry import visualize_geometry
+from tabs.solve.results_store import open_results_store, remove_results_store, write_results_store
 
+import multiprocessing
 import sys
 import os 
 
@@ -81,6 +83,16 @@ class App(QMainWindow):
         file = open(name,'w')
         file.write(json_data)
         file.close()
+
+        # Keep the solved results next to the project so they can be plotted without re-solving; results of an
+        # earlier save would otherwise be loaded with a project that no longer has any.
+        try:
+            if values.rcaide_results is not None:
+                write_results_store(values.rcaide_results, name)
+            else:
+                remove_results_store(name)
+        except OSError as error:
+            QMessageBox.warning(self, "Save Results", f"The project was saved, but its results were not: {error}")
     
     def load_all(self):
         separator = os.path.sep
@@ -94,6 +106,8 @@ class App(QMainWindow):
         data_str = file.read()
         file.close()
         values.read_from_json(data_str)
+        # Results saved with the project are memory-mapped; arrays are only read when a plot uses them.
+        values.rcaide_results = open_results_store(name)
         # Recreate geometry tab on each load so the component tree doesn't append duplicates across reloads
         for i, (widget, tab_name) in enumerate(self.widgets):
             if tab_name == "Geometry Parameterization":
@@ -119,24 +133,28 @@ class App(QMainWindow):
             assert isinstance(widget, TabWidget)
             widget.load_from_values()
 
-app = QApplication(sys.argv)
-window = App()
-extra = {
-    'density_scale': '-2',
-    'delete': '#b0220c',
-    'save': '#0291de',
-    'menubar': '#021a32',
-    'font_size': '15px'
-}
-separator = os.path.sep
-apply_stylesheet(app, theme= "app_data" + separator + "style_sheets" + separator + 'rcaide_dark_theme.xml', extra=extra)
-custom_qss = app.styleSheet() + """
-    QPushButton {
-        border: 1px solid;
-        border-radius: 4px;
-        border-color: #ffffff;
+if __name__ == "__main__":
+    # Mission solves run in spawned processes, which re-import this module.
+    multiprocessing.freeze_support()
+
+    app = QApplication(sys.argv)
+    window = App()
+    extra = {
+        'density_scale': '-2',
+        'delete': '#b0220c',
+        'save': '#0291de',
+        'menubar': '#021a32',
+        'font_size': '15px'
     }
-"""
-app.setStyleSheet(custom_qss)
-window.show()
-sys.exit(app.exec())
\ No newline at end of file
+    separator = os.path.sep
+    apply_stylesheet(app, theme= "app_data" + separator + "style_sheets" + separator + 'rcaide_dark_theme.xml', extra=extra)
+    custom_qss = app.styleSheet() + """
+        QPushButton {
+            border: 1px solid;
+            border-radius: 4px;
+            border-color: #ffffff;
+        }
+    """
+    app.setStyleSheet(custom_qss)
+    window.show()
+    sys.exit(app.exec())
\ No newline at end of file
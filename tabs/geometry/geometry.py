@@ -12,14 +12,63 @@ from tabs.visualize_geometry.visualize_geometry import VisualizeGeometryWidget
 from utilities import set_data
 import values
 
+# Frame class for each entry of values.geometry_data (index 0 is the vehicle itself).
+GEOMETRY_FRAMES: list[Type[GeometryFrame]] = [VehicleFrame, BoomFrame, CargoBayFrame, FuselageFrame, LandingGearFrame,
+                                              PowertrainFrame, WingsFrame]
+# Index of the powertrain entry, whose components are energy networks.
+POWERTRAIN_TAB_INDEX = 5
+
+
+def apply_vehicle_data(vehicle, data):
+    """Copy the top-level vehicle fields saved by the VehicleFrame onto an RCAIDE vehicle."""
+    vehicle.tag = data["name"]
+    for data_unit_label in VehicleFrame.data_units_labels:
+        rcaide_label = data_unit_label[-1]
+        user_label   = data_unit_label[0]
+        set_data(vehicle, rcaide_label, data[user_label][0])
+
+
+def create_vehicle_component(tab_index, data):
+    """Build the RCAIDE component for one saved geometry entry by replaying it through its frame."""
+    frame : GeometryFrame = GEOMETRY_FRAMES[tab_index]()
+    frame.load_data(data, -1)
+    vehicle_component = frame.create_rcaide_structure()
+    frame.deleteLater()
+    return vehicle_component
+
+
+def append_vehicle_component(vehicle, tab_index, vehicle_component):
+    # Check if it is an energy network being added
+    if tab_index == POWERTRAIN_TAB_INDEX:
+        vehicle.append_energy_network(vehicle_component)
+    else:
+        vehicle.append_component(vehicle_component)
+
+
+def build_rcaide_vehicle(geometry_data):
+    """Build a new RCAIDE vehicle from saved geometry data, without a GeometryWidget.
+
+    The component frames are QWidgets, so a QApplication must exist (it may use the offscreen platform).
+    """
+    vehicle = RCAIDE.Vehicle()
+    for tab_index, data_list in enumerate(geometry_data):
+        if not data_list:
+            continue
+        if tab_index == 0:
+            apply_vehicle_data(vehicle, data_list)
+            continue
+        for data in data_list:
+            append_vehicle_component(vehicle, tab_index, create_vehicle_component(tab_index, data))
+    return vehicle
+
+
 class GeometryWidget(TabWidget):
     def __init__(self):
         """Create a widget for entering vehicle geometry."""
         super(GeometryWidget, self).__init__()
 
         # Define actions based on the selected index
-        self.frames: list[Type[GeometryFrame]] = [VehicleFrame, BoomFrame, CargoBayFrame, FuselageFrame, LandingGearFrame,
-                                                  PowertrainFrame, WingsFrame]
+        self.frames: list[Type[GeometryFrame]] = GEOMETRY_FRAMES
         self.tabs = ["", "Booms", "Cargo Bays", "Fuselages","Landing Gear" , "Powertrain", "Wings"]
 
         options = ["Add Vehicle Component", "Add Boom", "Add Cargo Bay", "Add Fuselage", "Add Landing Gear" , "Add Powertrain", "Add Wing"]
@@ -207,11 +256,7 @@ class GeometryWidget(TabWidget):
         assert tab_index >= 0
         if tab_index == 0:
             values.geometry_data[0] = data
-            values.vehicle.tag = data["name"]
-            for data_unit_label in VehicleFrame.data_units_labels:
-                rcaide_label = data_unit_label[-1]
-                user_label   = data_unit_label[0]
-                set_data(values.vehicle, rcaide_label, data[user_label][0])
+            apply_vehicle_data(values.vehicle, data)
         else:
             top_item = self.tree.topLevelItem(0)
             assert top_item is not None
@@ -235,10 +280,7 @@ class GeometryWidget(TabWidget):
                 if index == -1:
                     values.geometry_data[tab_index].append(data)
                 else:
-                    frame : GeometryFrame = self.frames[tab_index]()
-                    frame.load_data(data, -1)
-                    vehicle_component = frame.create_rcaide_structure()
-                    frame.deleteLater()
+                    vehicle_component = create_vehicle_component(tab_index, data)
 
                 child = QTreeWidgetItem([data["name"]])
                 component_item.addChild(child)
@@ -253,15 +295,11 @@ class GeometryWidget(TabWidget):
                     child.setText(0, data["name"])
 
         if vehicle_component:
-            # Check if it is an energy network being added
-            if tab_index == 5:
-                values.vehicle.append_energy_network(vehicle_component) 
-            else:
-                values.vehicle.append_component(vehicle_component)
+            append_vehicle_component(values.vehicle, tab_index, vehicle_component)
 
-        # Keep preview synced with current geometry edits.
+        # Keep preview synced with current geometry edits; meshing runs off the UI thread so Save stays responsive.
         if self._preview_updates_enabled:
-            self.preview_widget.run_solve()
+            self.preview_widget.request_update()
 
         self.tree.expandAll()
 
@@ -287,12 +325,12 @@ class GeometryWidget(TabWidget):
                     self.save_data(tab_index=tab_index, index=index, data=data, new=True)
         self._preview_updates_enabled = True
         # Single redraw after all loaded parts are in place.
-        self.preview_widget.run_solve()
+        self.preview_widget.request_update()
         self.tree.expandAll()
 
     def update_layout(self):
         # Refresh preview when this tab becomes active.
-        self.preview_widget.run_solve()
+        self.preview_widget.request_update()
 
     def eventFilter(self, watched, event):
         watched_preview = watched in {
@@ -342,6 +380,8 @@ class GeometryWidget(TabWidget):
             # Suppress VTK warnings during teardown path.
             vtk.vtkObject.GlobalWarningDisplayOff()
             if hasattr(self, "preview_widget") and self.preview_widget:
+                # Let a running preview rebuild finish before the render window goes away.
+                self.preview_widget.stop_updates()
                 # Hide first, then release GL/VTK resources.
                 self.preview_widget.hide()
                 self.preview_widget.vtkWidget.hide()
@@ -8,6 +8,7 @@ from PyQt6.QtWidgets import (
 
 from tabs.mission.widgets import MissionSegmentWidget
 from tabs.mission.widgets import MissionAnalysisWidget
+from tabs.mission.widgets.mission_segment_builder import build_rcaide_segment
 from tabs import TabWidget
 from tabs.aircraft_configs.aircraft_configs import AircraftConfigsWidget
 import values
@@ -905,7 +906,7 @@ class MissionWidget(TabWidget):
             if idx in self.disabled_segments:
                 continue
 
-            seg_data, _ = seg.get_data()
+            seg_data = seg.get_segment_data()
             seg_data["Segment Name"] = self.tree.topLevelItem(idx).text(0)
             values.mission_data.append(seg_data)
 
@@ -927,7 +928,7 @@ class MissionWidget(TabWidget):
             if idx in self.disabled_segments:
                 continue
 
-            _, rcaide_segment = seg.get_data()
+            rcaide_segment = build_rcaide_segment(seg.get_segment_data(), seg.config_selector.currentText())
 
             # Ensure analyses exist before assigning them to a segment
             if not values.rcaide_analyses:
@@ -0,0 +1,190 @@
+# RCAIDE_GUI/tabs/mission/widgets/mission_segment_builder.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import RCAIDE
+
+from tabs.mission.widgets.mission_segment_helper import segment_data_fields, segment_rcaide_classes
+from utilities import Units, set_data, convert_name, convert_to_si
+import values
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Field definitions shared with the mission segment widgets
+# ----------------------------------------------------------------------------------------------------------------------
+# Degrees of freedom solved for in a segment ("flight forces" in the saved data).
+DOF_FIELDS = [
+    ("Forces in X axis", Units.Boolean, "flight_dynamics.force_x"),
+    ("Moments about X axis", Units.Boolean, "flight_dynamics.moment_x"),
+    ("Forces in Y axis", Units.Boolean, "flight_dynamics.force_y"),
+    ("Moments about Y axis", Units.Boolean, "flight_dynamics.moment_y"),
+    ("Forces in Z axis", Units.Boolean, "flight_dynamics.force_z"),
+    ("Moments about Z axis", Units.Boolean, "flight_dynamics.moment_z"),
+]
+
+# Control variables the solver may use to trim a segment ("flight controls" in the saved data).
+FLIGHT_CONTROL_FIELDS = {
+    "Kinematics": [
+        ("Body Angle", Units.Boolean, "assigned_control_variables.body_angle.active"),
+        ("Bank Angle", Units.Boolean, "assigned_control_variables.bank_angle.active"),
+        ("Wind Angle", Units.Boolean, "assigned_control_variables.wind_angle.active"),
+        ("Velocity", Units.Boolean, "assigned_control_variables.velocity.active"),
+        ("Acceleration", Units.Boolean, "assigned_control_variables.acceleration.active"),
+        ("Altitude", Units.Boolean, "assigned_control_variables.altitude.active"),
+    ],
+    "Control Surfaces": [
+        ("Elevator Deflection", Units.Boolean, "assigned_control_variables.elevator_deflection.active"),
+        ("Rudder Deflection", Units.Boolean, "assigned_control_variables.rudder_deflection.active"),
+        ("Flap Deflection", Units.Boolean, "assigned_control_variables.flap_deflection.active"),
+        ("Slat Deflection", Units.Boolean, "assigned_control_variables.slat_deflection.active"),
+        ("Aileron Deflection", Units.Boolean, "assigned_control_variables.aileron_deflection.active"),
+    ],
+    "Propulsion": [
+        ("Throttle", Units.Boolean, "assigned_control_variables.throttle.active"),
+        ("Thrust Vector Angle", Units.Boolean, "assigned_control_variables.thrust_vector_angle.active"),
+        # ("Blade Pitch Angle", Units.Boolean, "assigned_control_variables.blade_pitch_angle.active"),
+    ],
+}
+
+# Number of control points used when a saved segment does not specify one.
+DEFAULT_CONTROL_POINTS = 16
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Helpers
+# ----------------------------------------------------------------------------------------------------------------------
+def config_names():
+    """Configuration names in the order used by the segment config selector."""
+    names = [c.get("config name", "") for c in values.config_data if isinstance(c, dict)]
+    if not names:
+        cfg_container = getattr(values, "rcaide_configs", None)
+        if isinstance(cfg_container, dict):
+            names = list(cfg_container.keys())
+    return [n for n in names if n]
+
+
+def fallback_propulsor_names():
+    """Unique propulsor tags across all RCAIDE configurations."""
+    names = []
+
+    # Get RCAIDE aircraft configurations
+    cfgs = getattr(values, "rcaide_configs", None)
+
+    # Exit if configurations are missing or invalid
+    if not isinstance(cfgs, dict):
+        return names
+
+    # Collect unique propulsor tags from every network of every configuration
+    for cfg in cfgs.values():
+        for network in getattr(cfg, "networks", []):
+            for propulsor in getattr(network, "propulsors", []):
+                tag = getattr(propulsor, "tag", None)
+                if tag and tag not in names:
+                    names.append(tag)
+
+    return names
+
+
+def segment_analyses(config_name):
+    """Analyses of the given configuration, falling back to the first non-empty set."""
+    analyses = values.rcaide_analyses.get(convert_name(config_name))
+    if analyses is None or (hasattr(analyses, "__len__") and len(analyses) == 0):
+        fallback = None
+        for candidate in values.rcaide_analyses.values():
+            if hasattr(candidate, "__len__") and len(candidate) > 0:
+                fallback = candidate
+                break
+        if fallback is not None:
+            analyses = fallback
+        else:
+            raise RuntimeError(
+                "No RCAIDE analyses available. "
+                "Go to Mission tab and press 'Save Analyses'."
+            )
+    return analyses
+
+
+def set_control_variables(segment, flight_controls):
+    """Apply saved flight control toggles, propulsor assignment and default guesses to a segment."""
+    for fields in FLIGHT_CONTROL_FIELDS.values():
+        for user_label, _, rcaide_label in fields:
+            set_data(segment, rcaide_label, flight_controls[user_label][0])
+
+    # Assign all active propulsors to the throttle control variable
+    assigned = values.propulsor_names
+    available = fallback_propulsor_names()
+    if not assigned or not assigned[0]:
+        assigned = [available]
+        values.propulsor_names = assigned
+    elif available and not set(assigned[0]).issubset(set(available)):
+        assigned = [available]
+        values.propulsor_names = assigned
+
+    segment.assigned_control_variables.throttle.assigned_propulsors = assigned
+
+    # Provide a default throttle guess if throttle control is enabled and none is set
+    throttle = segment.assigned_control_variables.throttle
+    if getattr(throttle, "active", False) and hasattr(throttle, "initial_guess_values"):
+        if not throttle.initial_guess_values:
+            throttle.initial_guess_values = [[0.7]]
+
+    # Provide a default body angle guess if body angle control is enabled and none is set
+    body_angle = segment.assigned_control_variables.body_angle
+    if getattr(body_angle, "active", False) and hasattr(body_angle, "initial_guess_values"):
+        if not body_angle.initial_guess_values:
+            body_angle.initial_guess_values = [[0.0]]
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Builders
+# ----------------------------------------------------------------------------------------------------------------------
+def build_rcaide_segment(seg_data, config_name=None):
+    """Create an RCAIDE segment from one entry of ``values.mission_data``.
+
+    Args:
+        seg_data: Saved segment dictionary, as produced by ``MissionSegmentWidget.get_segment_data()``.
+        config_name: Configuration to fly the segment in; defaults to the saved "config" index.
+    """
+    top = seg_data["top dropdown"]
+    sub = seg_data["nested dropdown"]
+
+    seg = segment_rcaide_classes[top][sub]()
+    seg.tag = seg_data["Segment Name"]
+
+    if hasattr(seg, "state") and hasattr(seg.state, "numerics"):
+        solver = "root_finder" if seg_data.get("Solver", "root") == "root" else "optimize"
+        # Force cruise to use root_finder for better trim convergence
+        if top == 1:
+            solver = "root_finder"
+        if hasattr(seg.state.numerics, "solver"):
+            seg.state.numerics.solver.type = solver
+
+    # Subsegment inputs are saved as (value, unit index) and converted to SI by table lookup.
+    for label, unit_class, rcaide_label in segment_data_fields[top][sub]:
+        value, unit_index = seg_data[label]
+        set_data(seg, rcaide_label, convert_to_si(unit_class, value, unit_index))
+
+    flight_forces = seg_data["flight forces"]
+    for label, _, rcaide_label in DOF_FIELDS:
+        set_data(seg, rcaide_label, flight_forces[label][0])
+
+    if config_name is None:
+        names = config_names()
+        config_index = seg_data.get("config", 0)
+        config_name = names[config_index] if 0 <= config_index < len(names) else ""
+
+    seg.analyses.extend(segment_analyses(config_name))
+    set_control_variables(seg, seg_data["flight controls"])
+    seg.control_points = int(seg_data.get("Control Points", DEFAULT_CONTROL_POINTS))
+
+    return seg
+
+
+def build_rcaide_mission(mission_data, tag=None):
+    """Create a sequential RCAIDE mission from ``values.mission_data``."""
+    mission = RCAIDE.Framework.Mission.Sequential_Segments()
+    if tag:
+        mission.tag = tag
+    for seg_data in mission_data:
+        mission.append_segment(build_rcaide_segment(seg_data))
+    return mission
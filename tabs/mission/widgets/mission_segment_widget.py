@@ -5,13 +5,10 @@ from PyQt6.QtWidgets import (
 )
 
 from tabs.mission.widgets.flight_controls_widget import FlightControlsWidget
-from tabs.mission.widgets.mission_segment_helper import (
-    segment_data_fields,
-    segment_rcaide_classes,
-)
-from utilities import Units, set_data, convert_name
+from tabs.mission.widgets.mission_segment_builder import DOF_FIELDS, build_rcaide_segment, config_names
+from tabs.mission.widgets.mission_segment_helper import segment_data_fields
+from utilities import convert_name
 import values
-import RCAIDE
 from widgets import DataEntryWidget
 
 
@@ -88,17 +85,8 @@ class MissionSegmentWidget(QWidget):
         self.details_layout.addWidget(self.nested_dropdown)
 
         self.details_layout.addWidget(QLabel("Vehicle Configuration:"))
-        config_names = [
-            c.get("config name", "")
-            for c in values.config_data
-            if isinstance(c, dict)
-        ]
         self.details_layout.addWidget(QLabel("Segment Details:"))
-        if not config_names:
-            cfg_container = getattr(values, "rcaide_configs", None)
-            if isinstance(cfg_container, dict):
-                config_names = list(cfg_container.keys())
-        self.config_selector.addItems([n for n in config_names if n])
+        self.config_selector.addItems(config_names())
         self.details_layout.addWidget(self.config_selector)
 
         self.segment_layout.addWidget(self.details_group)
@@ -110,16 +98,7 @@ class MissionSegmentWidget(QWidget):
         self.dof_group.setStyleSheet(self._box_style())
         dof_layout = QVBoxLayout(self.dof_group)
 
-        dof_fields = [
-            ("Forces in X axis", Units.Boolean, "flight_dynamics.force_x"),
-            ("Moments about X axis", Units.Boolean, "flight_dynamics.moment_x"),
-            ("Forces in Y axis", Units.Boolean, "flight_dynamics.force_y"),
-            ("Moments about Y axis", Units.Boolean, "flight_dynamics.moment_y"),
-            ("Forces in Z axis", Units.Boolean, "flight_dynamics.force_z"),
-            ("Moments about Z axis", Units.Boolean, "flight_dynamics.moment_z"),
-        ]
-
-        self.dof_entry_widget = DataEntryWidget(dof_fields)
+        self.dof_entry_widget = DataEntryWidget(DOF_FIELDS)
         dof_layout.addWidget(self.dof_entry_widget)
         self.segment_layout.addWidget(self.dof_group)
 
@@ -307,6 +286,10 @@ class MissionSegmentWidget(QWidget):
     # Save / Load
     # ============================================================
     def get_data(self):
+        data = self.get_segment_data()
+        return data, build_rcaide_segment(data, self.config_selector.currentText())
+
+    def get_segment_data(self):
         data = {
             "Segment Name": self.segment_name_input.text(),
             "top dropdown": self.top_dropdown.currentIndex(),
@@ -318,7 +301,7 @@ class MissionSegmentWidget(QWidget):
             "flight controls": self.flight_controls_widget.get_data(),
         }
         data.update(self.subsegment_entry_widget.get_values())
-        return data, self.create_rcaide_segment()
+        return data
 
     def load_data(self, data):
         self._suppress_defaults = True
@@ -346,54 +329,5 @@ class MissionSegmentWidget(QWidget):
     # RCAIDE Segment Creation
     # ============================================================
     def create_rcaide_segment(self):
-        top = self.top_dropdown.currentIndex()
-        sub = self.nested_dropdown.currentText()
-
-        seg = segment_rcaide_classes[top][sub]()
-        seg.tag = self.segment_name_input.text()
-
-        if hasattr(seg, "state") and hasattr(seg.state, "numerics"):
-            solver = (
-                "root_finder"
-                if self.solver_root.isChecked()
-                else "optimize"
-            )
-            # Force cruise to use root_finder for better trim convergence
-            if top == 1:
-                solver = "root_finder"
-            if hasattr(seg.state.numerics, "solver"):
-                seg.state.numerics.solver.type = solver
-
-        vals_si = self.subsegment_entry_widget.get_values_si()
-        for label, _, rcaide_label in (
-            self.subsegment_entry_widget.data_units_labels
-        ):
-            set_data(seg, rcaide_label, vals_si[label][0])
-
-        dof_vals = self.dof_entry_widget.get_values()
-        for label, _, rcaide_label in (
-            self.dof_entry_widget.data_units_labels
-        ):
-            set_data(seg, rcaide_label, dof_vals[label][0])
-
-        cfg = convert_name(self.config_selector.currentText())
-        analyses = values.rcaide_analyses.get(cfg)
-        if analyses is None or (hasattr(analyses, "__len__") and len(analyses) == 0):
-            fallback = None
-            for candidate in values.rcaide_analyses.values():
-                if hasattr(candidate, "__len__") and len(candidate) > 0:
-                    fallback = candidate
-                    break
-            if fallback is not None:
-                analyses = fallback
-            else:
-                raise RuntimeError(
-                    "No RCAIDE analyses available. "
-                    "Go to Mission tab and press 'Save Analyses'."
-                )
-
-        seg.analyses.extend(analyses)
-        self.flight_controls_widget.set_control_variables(seg)
-        seg.control_points = int(self.ctrl_points.text())
-
-        return seg
+        # Build from the same plain data that is saved, so saved missions rebuild identically.
+        return build_rcaide_segment(self.get_segment_data(), self.config_selector.currentText())
@@ -0,0 +1,202 @@
+# RCAIDE_GUI/tabs/solve/batch.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import json
+import multiprocessing
+import os
+import pickle
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+# File names written for every solved project.
+RESULTS_FILE_NAME = "results.pkl"
+SUMMARY_FILE_NAME = "summary.json"
+BATCH_SUMMARY_FILE_NAME = "batch_summary.json"
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Project rebuild
+# ----------------------------------------------------------------------------------------------------------------------
+# QApplication created for headless runs. It must stay referenced: a dropped instance is deleted at once.
+_qt_app = None
+
+
+def _ensure_qt_application():
+    # Geometry and analysis builders are QWidgets; run them on the offscreen platform so no display is needed.
+    global _qt_app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    _qt_app = QApplication.instance() or QApplication([])
+    # Without an application the first QWidget aborts the process, before any failure can be recorded.
+    if QApplication.instance() is None:
+        raise RuntimeError("Could not create a QApplication for the headless solve.")
+    return _qt_app
+
+
+def load_project(path):
+    """Reset the shared ``values`` state and load a file written by ``values.write_to_json()``."""
+    with open(path, "r") as file:
+        load_project_data(json.loads(file.read()))
+
+
+def load_project_data(data):
+    """Reset the shared ``values`` state and load project data (the dictionary ``values.write_to_json()`` dumps)."""
+    import RCAIDE
+    import values
+
+    values.read_from_json(json.dumps(data))
+
+    # Drop objects built for a previously loaded project.
+    values.vehicle = RCAIDE.Vehicle()
+    values.rcaide_configs = RCAIDE.Library.Components.Configs.Config.Container()
+    values.rcaide_analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+    values.rcaide_mission = RCAIDE.Framework.Mission.Sequential_Segments()
+    values.rcaide_results = None
+
+
+def build_mission_from_values():
+    """Rebuild vehicle, configs, analyses and mission from the loaded ``values`` data. Returns the mission."""
+    import values
+    from tabs.aircraft_configs.aircraft_configs import build_rcaide_configs_from_geometry
+    from tabs.geometry.geometry import build_rcaide_vehicle
+    from tabs.mission.widgets.mission_analysis_widget import MissionAnalysisWidget
+    from tabs.mission.widgets.mission_segment_builder import build_rcaide_mission
+
+    if not values.mission_data:
+        raise RuntimeError("Project has no mission segments.")
+
+    _ensure_qt_application()
+
+    # Vehicle and one RCAIDE config per saved configuration.
+    values.vehicle = build_rcaide_vehicle(values.geometry_data)
+    values.rcaide_configs = build_rcaide_configs_from_geometry()
+
+    # Analyses per config, from the saved analysis settings.
+    MissionAnalysisWidget().load_from_values()
+
+    # Mission segments, in saved order, built from plain data.
+    mission = build_rcaide_mission(values.mission_data)
+
+    values.rcaide_mission = mission
+    return mission
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Solve
+# ----------------------------------------------------------------------------------------------------------------------
+def _last_value(conditions, chain, row=-1):
+    # Final (or ``row``) value of a conditions array, or None when the segment does not carry it.
+    obj = conditions
+    for key in chain:
+        obj = getattr(obj, key, None)
+        if obj is None:
+            return None
+    try:
+        return float(obj[row, 0])
+    except (IndexError, TypeError, ValueError):
+        return None
+
+
+def summarize_results(results):
+    """Small JSON-friendly digest of solved mission results for regression checks."""
+    segments = []
+    for segment in results.segments.values():
+        conditions = segment.state.conditions
+        solver = getattr(segment.state.numerics, "solver", None)
+        segments.append({
+            "tag": segment.tag,
+            "converged": bool(getattr(solver, "converged", False)),
+            "final_time": _last_value(conditions, ("frames", "inertial", "time")),
+            "final_range": _last_value(conditions, ("frames", "inertial", "aircraft_range")),
+            "final_altitude": _last_value(conditions, ("freestream", "altitude")),
+            "final_mass": _last_value(conditions, ("weights", "total_mass")),
+        })
+    return segments
+
+
+def mission_metrics(results):
+    """Whole-mission figures of merit (SI units) used to compare solved variants."""
+    segments = list(results.segments.values())
+    first = segments[0].state.conditions
+    last = segments[-1].state.conditions
+    initial_mass = _last_value(first, ("weights", "total_mass"), row=0)
+    final_mass = _last_value(last, ("weights", "total_mass"))
+    return {
+        "converged": all(bool(getattr(getattr(segment.state.numerics, "solver", None), "converged", False))
+                         for segment in segments),
+        "flight_time": _last_value(last, ("frames", "inertial", "time")),
+        "range": _last_value(last, ("frames", "inertial", "aircraft_range")),
+        "final_altitude": _last_value(last, ("freestream", "altitude")),
+        "final_mass": final_mass,
+        "mass_burned": initial_mass - final_mass if initial_mass is not None and final_mass is not None else None,
+    }
+
+
+def solve_project_file(path, output_dir, time_budget=None):
+    """Rebuild and solve one saved project; write its results and summary under ``output_dir``.
+
+    Returns the summary dictionary. Errors are reported in the summary rather than raised so one bad
+    file does not stop a batch.
+    """
+    from tabs.solve.solve_process import MissionSolveProcess
+    from tabs.solve.solve_profiler import write_profile
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    project_dir = os.path.join(output_dir, name)
+    os.makedirs(project_dir, exist_ok=True)
+
+    summary = {"file": path, "status": "failed", "message": "", "elapsed_seconds": 0.0, "segments": []}
+    start_time = time.monotonic()
+    try:
+        load_project(path)
+        mission = build_mission_from_values()
+
+        solve_process = MissionSolveProcess(mission)
+        solve_process.start()
+        status, payload = solve_process.wait(time_budget)
+        summary["status"] = status
+        if solve_process.profile is not None:
+            write_profile(solve_process.profile, project_dir)
+        if status == "finished":
+            with open(os.path.join(project_dir, RESULTS_FILE_NAME), "wb") as file:
+                pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+            summary["segments"] = summarize_results(payload)
+        else:
+            summary["message"] = payload
+    except Exception:
+        summary["message"] = traceback.format_exc()
+
+    summary["elapsed_seconds"] = time.monotonic() - start_time
+    with open(os.path.join(project_dir, SUMMARY_FILE_NAME), "w") as file:
+        json.dump(summary, file, indent=4)
+    return summary
+
+
+def run_batch(paths, output_dir, jobs=1, time_budget=None, on_summary=None):
+    """Solve every project in ``paths``, ``jobs`` files at a time. Returns the list of summaries."""
+    os.makedirs(output_dir, exist_ok=True)
+
+    summaries = []
+    if jobs <= 1:
+        for path in paths:
+            summary = solve_project_file(path, output_dir, time_budget)
+            summaries.append(summary)
+            if on_summary is not None:
+                on_summary(summary)
+    else:
+        # Spawned workers each rebuild their own project state, so files never share ``values``.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+            futures = [executor.submit(solve_project_file, path, output_dir, time_budget) for path in paths]
+            for future in futures:
+                summary = future.result()
+                summaries.append(summary)
+                if on_summary is not None:
+                    on_summary(summary)
+
+    with open(os.path.join(output_dir, BATCH_SUMMARY_FILE_NAME), "w") as file:
+        json.dump(summaries, file, indent=4)
+    return summaries
@@ -0,0 +1,244 @@
+# RCAIDE_GUI/tabs/solve/payload_range.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import hashlib
+import json
+import multiprocessing
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from tabs.solve.sweep import apply_sweep_point, as_completed_until_cancelled, init_pool_worker, pool_cancel_event, \
+    SweepParameter
+from utilities import Units, convert_to_si
+
+# VehicleFrame fields holding the weights that define the diagram.
+WEIGHT_FIELDS = {
+    "max_takeoff": "Max Takeoff Weight",
+    "max_payload": "Maximum Payload Weight",
+    "max_fuel": "Max Fuel Weight",
+    "operating_empty": "Operating Empty Weight",
+}
+# Range solves stop once fuel burned is within this fraction of the usable fuel.
+FUEL_TOLERANCE = 0.005
+# Mission solves allowed per corner while matching the fuel burn.
+MAX_RANGE_ITERATIONS = 6
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Corner points
+# ----------------------------------------------------------------------------------------------------------------------
+def vehicle_weights(project_data):
+    """Weights of ``WEIGHT_FIELDS`` from the saved vehicle, in kg."""
+    vehicle = project_data["geometry_data"][0]
+    if not vehicle:
+        raise RuntimeError("No vehicle saved. Save the vehicle in the Geometry tab first.")
+    weights = {}
+    for key, label in WEIGHT_FIELDS.items():
+        value, unit_index = vehicle[label]
+        weights[key] = convert_to_si(Units.Mass, value, unit_index)
+    return weights
+
+
+def corner_points(weights):
+    """Corner points of the payload-range diagram as dictionaries with "name", "payload" and "fuel" (kg).
+
+    A: maximum payload, no fuel. B: maximum payload, fuel up to the maximum takeoff weight.
+    C: maximum fuel, payload up to the maximum takeoff weight. D: maximum fuel, no payload (ferry).
+    """
+    useful_load = weights["max_takeoff"] - weights["operating_empty"]
+    if useful_load <= 0:
+        raise RuntimeError("Max Takeoff Weight must exceed Operating Empty Weight.")
+
+    max_payload = min(weights["max_payload"], useful_load)
+    fuel_at_max_payload = min(useful_load - max_payload, weights["max_fuel"])
+    max_fuel = min(weights["max_fuel"], useful_load)
+    payload_at_max_fuel = useful_load - max_fuel
+
+    corners = [
+        {"name": "A", "payload": max_payload, "fuel": 0.0},
+        {"name": "B", "payload": max_payload, "fuel": fuel_at_max_payload},
+    ]
+    # C coincides with B when the payload at maximum fuel is not below the maximum payload.
+    if payload_at_max_fuel < max_payload and max_fuel > fuel_at_max_payload:
+        corners.append({"name": "C", "payload": payload_at_max_fuel, "fuel": max_fuel})
+    corners.append({"name": "D", "payload": 0.0, "fuel": max_fuel})
+    return corners
+
+
+def cruise_segment_index(project_data):
+    """Index of the mission segment whose distance is stretched to burn the fuel: the longest with a Distance."""
+    best_index, best_distance = None, -1.0
+    for index, segment in enumerate(project_data["mission_data"]):
+        saved = segment.get("Distance")
+        if not isinstance(saved, list):
+            continue
+        distance = convert_to_si(Units.Length, saved[0], saved[1])
+        if distance > best_distance:
+            best_index, best_distance = index, distance
+    if best_index is None:
+        raise RuntimeError("Payload-range needs a mission segment with a Distance input (e.g. a cruise segment).")
+    return best_index
+
+
+def corner_key(project_data, corner, reserve_fraction):
+    """Hash of every input that determines the range of a corner."""
+    data = {"project": project_data, "payload": corner["payload"], "fuel": corner["fuel"],
+            "reserve_fraction": reserve_fraction}
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Range solves
+# ----------------------------------------------------------------------------------------------------------------------
+def _corner_parameters(cruise_index):
+    # Takeoff, payload and fuel weights plus the cruise distance, all written in SI (unit index 0).
+    return [
+        SweepParameter("geometry", "Takeoff Weight"),
+        SweepParameter("geometry", "Payload Weight"),
+        SweepParameter("geometry", "Fuel Weight"),
+        SweepParameter("mission", "Distance", segment_index=cruise_index),
+    ]
+
+
+def _si_variant(project_data, parameters, coordinates):
+    variant = apply_sweep_point(project_data, parameters, coordinates)
+    for parameter in parameters:
+        saved = parameter.entry(variant)[parameter.label]
+        if isinstance(saved, list):
+            saved[1] = 0
+    return variant
+
+
+def _solve_variant(variant, time_budget, cancel_event=None):
+    # Mission metrics of one variant; raises on failure.
+    from tabs.solve.batch import build_mission_from_values, load_project_data, mission_metrics
+    from tabs.solve.solve_process import MissionSolveProcess
+
+    load_project_data(variant)
+    solve_process = MissionSolveProcess(build_mission_from_values())
+    solve_process.start()
+    status, payload = solve_process.wait(time_budget, cancel_event=cancel_event)
+    if status != "finished":
+        raise RuntimeError(payload)
+    metrics = mission_metrics(payload)
+    if metrics["range"] is None or metrics["mass_burned"] is None:
+        raise RuntimeError("Mission results carry no range or mass history.")
+    return metrics
+
+
+def _unsolved_corner(corner, status, message):
+    return dict(corner, range=0.0, status=status, iterations=0, message=message, elapsed_seconds=0.0)
+
+
+def solve_corner_range(project_data, corner, operating_empty, reserve_fraction=0.0, time_budget=None,
+                       cancel_event=None):
+    """Range flown by a corner: the cruise distance is adjusted until the mission burns the usable fuel.
+
+    Runs in a payload-range pool worker. Each iteration is one full mission solve, limited to ``time_budget``
+    seconds; the cruise distance is updated with a secant step on (distance, fuel burned). ``cancel_event``
+    (by default the pool's) stops the running solve and any further iterations. Returns ``corner`` updated
+    with "range" (m), "status", "iterations", "message" and "elapsed_seconds".
+    """
+    cancel_event = pool_cancel_event() if cancel_event is None else cancel_event
+    result = _unsolved_corner(corner, "finished", "")
+    start_time = time.monotonic()
+    usable_fuel = corner["fuel"] * (1.0 - reserve_fraction)
+    if usable_fuel <= 0.0:
+        return result
+
+    try:
+        cruise_index = cruise_segment_index(project_data)
+        parameters = _corner_parameters(cruise_index)
+        saved_distance = project_data["mission_data"][cruise_index]["Distance"]
+        distance = convert_to_si(Units.Length, saved_distance[0], saved_distance[1])
+        takeoff = operating_empty + corner["payload"] + corner["fuel"]
+
+        history = []
+        for iteration in range(MAX_RANGE_ITERATIONS):
+            if cancel_event is not None and cancel_event.is_set():
+                result["status"] = "cancelled"
+                result["message"] = f"Payload-range cancelled after {iteration} mission solves."
+                break
+            variant = _si_variant(project_data, parameters, (takeoff, corner["payload"], corner["fuel"], distance))
+            metrics = _solve_variant(variant, time_budget, cancel_event)
+            history.append((distance, metrics["mass_burned"], metrics["range"]))
+            result["iterations"] = iteration + 1
+            result["range"] = metrics["range"]
+
+            error = usable_fuel - metrics["mass_burned"]
+            if abs(error) <= FUEL_TOLERANCE * usable_fuel:
+                break
+            if len(history) > 1 and history[-1][0] != history[-2][0]:
+                burn_rate = (history[-1][1] - history[-2][1]) / (history[-1][0] - history[-2][0])
+            else:
+                # First step: assume fuel is burned uniformly over the range flown.
+                burn_rate = metrics["mass_burned"] / max(metrics["range"], 1.0)
+            if burn_rate <= 0.0:
+                raise RuntimeError("Fuel burned does not increase with cruise distance.")
+            distance = max(distance + error / burn_rate, 1.0)
+        else:
+            result["message"] = f"Fuel burn not matched within {MAX_RANGE_ITERATIONS} solves."
+    except Exception as error:
+        if cancel_event is not None and cancel_event.is_set():
+            result["status"] = "cancelled"
+            result["message"] = str(error)
+        else:
+            result["status"] = "failed"
+            result["message"] = traceback.format_exc()
+
+    result["elapsed_seconds"] = time.monotonic() - start_time
+    return result
+
+
+def run_payload_range(project_data, reserve_fraction=0.0, jobs=None, cache=None, time_budget=None,
+                      on_corner=None, cancel_event=None):
+    """Solve the corner points concurrently and return them in diagram order (A, B, C, D).
+
+    ``cache`` maps ``corner_key`` to a solved corner; hits are returned without solving and new results are
+    added to it. Every mission solve is limited to ``time_budget`` seconds; setting ``cancel_event`` stops the
+    corners being solved and drops the rest, which are returned with status "cancelled".
+    """
+    weights = vehicle_weights(project_data)
+    corners = corner_points(weights)
+    cache = {} if cache is None else cache
+
+    solved = {}
+    pending = []
+    for corner in corners:
+        key = corner_key(project_data, corner, reserve_fraction)
+        if key in cache:
+            solved[corner["name"]] = cache[key]
+            if on_corner is not None:
+                on_corner(cache[key])
+        else:
+            pending.append((key, corner))
+
+    if pending:
+        context = multiprocessing.get_context("spawn")
+        worker_cancel_event = context.Event()
+        with ProcessPoolExecutor(max_workers=min(jobs or len(pending), len(pending)), mp_context=context,
+                                 initializer=init_pool_worker, initargs=(worker_cancel_event,)) as executor:
+            futures = {
+                executor.submit(solve_corner_range, project_data, corner, weights["operating_empty"],
+                                reserve_fraction, time_budget): (key, corner)
+                for key, corner in pending
+            }
+            for future in as_completed_until_cancelled(futures, cancel_event, worker_cancel_event):
+                key, corner = futures[future]
+                try:
+                    result = future.result()
+                except BrokenProcessPool:
+                    # A worker died in native code; the corner is reported as failed, not raised.
+                    result = _unsolved_corner(corner, "failed", traceback.format_exc())
+                if result["status"] == "finished":
+                    cache[key] = result
+                solved[result["name"]] = result
+                if on_corner is not None:
+                    on_corner(result)
+
+    return [solved.get(corner["name"]) or _unsolved_corner(corner, "cancelled", "Payload-range cancelled.")
+            for corner in corners]
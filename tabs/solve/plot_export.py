@@ -0,0 +1,158 @@
+# RCAIDE_GUI/tabs/solve/plot_export.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import colorsys
+import html
+import json
+import multiprocessing
+import os
+import re
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgb
+from matplotlib.figure import Figure
+
+EXPORT_FORMATS = ("png", "svg", "pdf")
+REPORT_INDEX_JSON = "index.json"
+REPORT_INDEX_HTML = "index.html"
+# Raster resolution of exported figures.
+EXPORT_DPI = 150
+# Curves with more points than this are exported without markers.
+EXPORT_MARKER_POINT_LIMIT = 400
+
+# pyqtgraph marker symbols and their matplotlib equivalents.
+_MATPLOTLIB_MARKERS = {
+    'o': 'o', 's': 's', 't': 'v', 't1': '^', 't2': '>', 't3': '<', 'd': 'd', '+': '+', 'x': 'x',
+    'p': 'p', 'h': 'h', 'star': '*', '|': '|', '_': '_',
+}
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Snapshots
+# ----------------------------------------------------------------------------------------------------------------------
+def curve_snapshot(x, y, color, width, symbol=None, name=None):
+    """Plain copy of one curve: arrays and style only, so it can be sent to an export worker."""
+    return {
+        "x": np.array(x, dtype=float).reshape(-1),
+        "y": np.array(y, dtype=float).reshape(-1),
+        "color": color,
+        "width": float(width),
+        "symbol": symbol,
+        "name": name,
+    }
+
+
+def figure_snapshot(title, x_label, y_label, curves):
+    return {"title": title, "x_label": x_label, "y_label": y_label, "curves": curves}
+
+
+def _plain_title(title):
+    # Plot titles may carry rich-text markup.
+    return re.sub(r"<[^>]*>", "", str(title or "")).strip()
+
+
+def _file_stem(index, title):
+    name = _plain_title(title)
+    name = re.sub(r"[^A-Za-z0-9._ -]", "_", name)
+    name = re.sub(r"\s+", "_", name).strip("_") or "plot"
+    return f"{index:02d}_{name}"
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Rendering
+# ----------------------------------------------------------------------------------------------------------------------
+def render_figure(figure, directory, stem, formats=EXPORT_FORMATS):
+    """Draw one figure snapshot with matplotlib and write it in every format. Runs in an export worker.
+
+    Returns a report entry with "title", "files" (format -> file name), "status" and "message".
+    """
+    entry = {"title": _plain_title(figure["title"]), "files": {}, "status": "finished", "message": ""}
+    try:
+        # A bare Figure on an Agg canvas: no pyplot state and no GUI backend in the worker.
+        fig = Figure(figsize=(6.2, 3.8))
+        FigureCanvasAgg(fig)
+        axis = fig.add_subplot()
+        has_labels = False
+        for curve in figure["curves"]:
+            color = curve["color"]
+            # Light curves of the dark theme would vanish on white paper; print them black.
+            if colorsys.rgb_to_hls(*to_rgb(color))[1] > 220 / 255:
+                color = "black"
+            marker = None
+            if curve["symbol"] is not None and curve["x"].size <= EXPORT_MARKER_POINT_LIMIT:
+                marker = _MATPLOTLIB_MARKERS.get(curve["symbol"], "o")
+            axis.plot(curve["x"], curve["y"], color=color, linewidth=curve["width"] * 0.75, marker=marker,
+                      markersize=4, label=curve["name"])
+            has_labels = has_labels or bool(curve["name"])
+        axis.set_title(entry["title"])
+        axis.set_xlabel(figure["x_label"])
+        axis.set_ylabel(figure["y_label"])
+        axis.grid(True, alpha=0.3)
+        if has_labels:
+            axis.legend(fontsize=7, loc="best")
+        fig.tight_layout()
+        for file_format in formats:
+            file_name = f"{stem}.{file_format}"
+            fig.savefig(os.path.join(directory, file_name), format=file_format, dpi=EXPORT_DPI)
+            entry["files"][file_format] = file_name
+    except Exception:
+        entry["status"] = "failed"
+        entry["message"] = traceback.format_exc()
+    return entry
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Report
+# ----------------------------------------------------------------------------------------------------------------------
+def write_report_index(entries, directory):
+    """Write ``index.json`` and an ``index.html`` page linking every exported figure."""
+    with open(os.path.join(directory, REPORT_INDEX_JSON), "w") as file:
+        json.dump({"figures": entries}, file, indent=2)
+
+    sections = []
+    for entry in entries:
+        title = html.escape(entry["title"])
+        if entry["status"] != "finished":
+            sections.append(f"<section><h2>{title}</h2><p>Export failed.</p></section>")
+            continue
+        files = entry["files"]
+        image = files.get("svg") or files.get("png")
+        preview = f'<img src="{html.escape(image)}" alt="{title}">' if image else ""
+        links = " ".join(f'<a href="{html.escape(name)}">{file_format.upper()}</a>'
+                         for file_format, name in files.items())
+        sections.append(f"<section><h2>{title}</h2>{preview}<p>{links}</p></section>")
+    page = ("<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\"><title>Mission Plots</title></head>\n"
+            "<body><h1>Mission Plots</h1>\n" + "\n".join(sections) + "\n</body></html>\n")
+    with open(os.path.join(directory, REPORT_INDEX_HTML), "w") as file:
+        file.write(page)
+
+
+def export_report(figures, directory, formats=EXPORT_FORMATS, jobs=None, on_figure=None):
+    """Render figure snapshots in parallel worker processes into ``directory`` and index them.
+
+    ``on_figure(done, total, entry)`` is called as figures finish. Returns the report entries in figure order.
+    """
+    os.makedirs(directory, exist_ok=True)
+    entries = [None] * len(figures)
+    if figures:
+        jobs = min(jobs or max((os.cpu_count() or 2) - 1, 1), len(figures))
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as executor:
+            futures = {
+                executor.submit(render_figure, figure, directory, _file_stem(index + 1, figure["title"]),
+                                formats): index
+                for index, figure in enumerate(figures)
+            }
+            done = 0
+            for future in as_completed(futures):
+                entry = future.result()
+                entries[futures[future]] = entry
+                done += 1
+                if on_figure is not None:
+                    on_figure(done, len(figures), entry)
+    write_report_index(entries, directory)
+    return entries
@@ -0,0 +1,38 @@
+# RCAIDE_GUI/tabs/solve/plot_registry.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  PlotRegistry
+# ----------------------------------------------------------------------------------------------------------------------
+class PlotRegistry:
+    """Plot widgets of the Solve tab that currently show a plot, in registration order.
+
+    The base plots are registered once; dynamic plot widgets while they are attached to a plot slot.
+    Settings and theming are applied to these widgets only.
+    """
+
+    def __init__(self):
+        # Insertion-ordered set of widgets.
+        self._widgets = {}
+
+    def __len__(self):
+        return len(self._widgets)
+
+    def __contains__(self, widget):
+        return widget in self._widgets
+
+    def register(self, widget):
+        self._widgets[widget] = None
+
+    def unregister(self, widget):
+        self._widgets.pop(widget, None)
+
+    def widgets(self):
+        return list(self._widgets)
+
+    def curves(self):
+        """(widget, PlotDataItem) of every curve of the registered widgets."""
+        for widget in self._widgets:
+            for curve in widget.listDataItems():
+                yield widget, curve
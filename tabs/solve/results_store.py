@@ -0,0 +1,191 @@
+# RCAIDE_GUI/tabs/solve/results_store.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import json
+import os
+import shutil
+
+import numpy as np
+from RCAIDE.Framework.Core import ContainerOrdered, Data
+
+# Layout version written into every index.
+STORE_VERSION = 1
+# Results of ``project.json`` are stored in ``project.results/``.
+STORE_SUFFIX = ".results"
+INDEX_FILE_NAME = "index.json"
+ARRAYS_FILE_NAME = "arrays.bin"
+# Byte alignment of every array in the arrays file.
+ARRAY_ALIGNMENT = 64
+# Parts of ``segment.state`` that are stored; conditions feed the plots, the rest warm starts and summaries.
+STATE_KEYS = ("conditions", "numerics", "unknowns", "residuals")
+# Marker key of an array entry in the index.
+_ARRAY_KEY = "__array__"
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Paths
+# ----------------------------------------------------------------------------------------------------------------------
+def results_store_path(project_path):
+    """Directory holding the results saved alongside ``project_path``."""
+    return os.path.splitext(project_path)[0] + STORE_SUFFIX
+
+
+def has_results_store(project_path):
+    return os.path.isfile(os.path.join(results_store_path(project_path), INDEX_FILE_NAME))
+
+
+def remove_results_store(project_path):
+    """Delete the results saved alongside ``project_path``, if any."""
+    store = results_store_path(project_path)
+    if os.path.isdir(store):
+        shutil.rmtree(store)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Write
+# ----------------------------------------------------------------------------------------------------------------------
+class _ArrayWriter:
+    # Appends arrays to the arrays file and returns their index entries.
+
+    def __init__(self, file):
+        self.file = file
+        self.offset = 0
+
+    def write(self, array):
+        array = np.ascontiguousarray(array)
+        padding = -self.offset % ARRAY_ALIGNMENT
+        if padding:
+            self.file.write(b"\0" * padding)
+            self.offset += padding
+        entry = {_ARRAY_KEY: [self.offset, array.dtype.str, list(array.shape)]}
+        self.file.write(array.tobytes())
+        self.offset += array.nbytes
+        return entry
+
+
+def _encode(value, writer):
+    # Index entry of one node of a conditions tree; None for values that cannot be stored.
+    if isinstance(value, np.ndarray):
+        return writer.write(value) if value.dtype != object else None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, dict):
+        encoded = {}
+        for key, item in value.items():
+            entry = _encode(item, writer)
+            if entry is not None or item is None:
+                encoded[str(key)] = entry
+        return encoded
+    return None
+
+
+def _mapped_file(array):
+    # Path of the file an array is memory-mapped from, or None for an in-memory array.
+    base = array
+    while base is not None and not isinstance(base, np.memmap):
+        base = getattr(base, "base", None)
+    if base is None or base.filename is None:
+        return None
+    return os.path.abspath(base.filename)
+
+
+def _materialize(tree, path):
+    # Replace the arrays of a conditions tree that are mapped from ``path`` with in-memory copies.
+    for key, value in tree.items():
+        if isinstance(value, np.ndarray):
+            if _mapped_file(value) == path:
+                tree[key] = np.array(value)
+        elif isinstance(value, dict):
+            _materialize(value, path)
+
+
+def write_results_store(results, project_path):
+    """Store solved mission ``results`` next to ``project_path``: one array per conditions leaf."""
+    return save_results(results, results_store_path(project_path))
+
+
+def save_results(results, store):
+    """Write ``results`` into the ``store`` directory. Results loaded from the same store are left untouched."""
+    if getattr(results, "results_store", None) == os.path.abspath(store):
+        return store
+    os.makedirs(store, exist_ok=True)
+
+    # Write beside the live files and swap them in, so a store that is currently mapped stays readable.
+    arrays_path = os.path.join(store, ARRAYS_FILE_NAME)
+    index_path = os.path.join(store, INDEX_FILE_NAME)
+    segments = []
+    with open(arrays_path + ".tmp", "wb") as file:
+        writer = _ArrayWriter(file)
+        for segment in results.segments:
+            state = {key: _encode(segment.state[key], writer) for key in STATE_KEYS if key in segment.state}
+            segments.append({"tag": segment.tag, "state": state})
+    with open(index_path + ".tmp", "w") as file:
+        json.dump({"version": STORE_VERSION, "tag": getattr(results, "tag", ""), "segments": segments}, file)
+
+    # A mapped file cannot be replaced on Windows: copy out any arrays still mapped from the live one, which
+    # releases the map once nothing else refers to it.
+    for segment in results.segments:
+        _materialize(segment.state, os.path.abspath(arrays_path))
+    try:
+        os.replace(arrays_path + ".tmp", arrays_path)
+        os.replace(index_path + ".tmp", index_path)
+    except OSError:
+        for path in (arrays_path + ".tmp", index_path + ".tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    return store
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Read
+# ----------------------------------------------------------------------------------------------------------------------
+def _decode(entry, buffer):
+    if isinstance(entry, dict):
+        if _ARRAY_KEY in entry:
+            offset, dtype, shape = entry[_ARRAY_KEY]
+            # A view on the memory map: nothing is read until the array is used.
+            return np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=buffer, offset=offset)
+        data = Data()
+        for key, item in entry.items():
+            data[key] = _decode(item, buffer)
+        return data
+    return entry
+
+
+def open_results_store(project_path):
+    """Results saved next to ``project_path``, with every array memory-mapped, or None if there are none.
+
+    The returned object has the layout the Solve tab renderers use: ``results.segments`` in mission order,
+    each with ``tag``, ``conditions`` and ``state``.
+    """
+    if not has_results_store(project_path):
+        return None
+    return load_results(results_store_path(project_path))
+
+
+def load_results(store):
+    """Memory-mapped results of the ``store`` directory (see ``open_results_store``), or None for another version."""
+    with open(os.path.join(store, INDEX_FILE_NAME), "r") as file:
+        index = json.load(file)
+    if index.get("version") != STORE_VERSION:
+        return None
+
+    arrays_path = os.path.join(store, ARRAYS_FILE_NAME)
+    # Copy-on-write, so renderers that modify arrays in place never touch the file.
+    buffer = np.memmap(arrays_path, dtype=np.uint8, mode="c") if os.path.getsize(arrays_path) else b""
+
+    results = Data()
+    results.tag = index.get("tag", "")
+    results.results_store = os.path.abspath(store)
+    results.segments = ContainerOrdered()
+    for saved in index["segments"]:
+        segment = Data()
+        segment.tag = saved["tag"]
+        segment.state = _decode(saved["state"], buffer)
+        segment.conditions = segment.state.get("conditions", Data())
+        results.segments.append(segment)
+    return results
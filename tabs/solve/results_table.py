@@ -0,0 +1,186 @@
+# RCAIDE_GUI/tabs/solve/results_table.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import numpy as np
+from RCAIDE.Framework.Core import Units
+
+# Named columns: (path under segment.conditions, column of the 2-D array).
+COLUMNS = {
+    "time": (("frames", "inertial", "time"), 0),
+    "altitude": (("freestream", "altitude"), 0),
+    "velocity": (("freestream", "velocity"), 0),
+    "density": (("freestream", "density"), 0),
+    "mach_number": (("freestream", "mach_number"), 0),
+    "range": (("frames", "inertial", "aircraft_range"), 0),
+    "position_x": (("frames", "inertial", "position_vector"), 0),
+    "position_y": (("frames", "inertial", "position_vector"), 1),
+    "position_z": (("frames", "inertial", "position_vector"), 2),
+    "alpha": (("aerodynamics", "angles", "alpha"), 0),
+    "phi": (("aerodynamics", "angles", "phi"), 0),
+    "CL": (("aerodynamics", "coefficients", "lift", "total"), 0),
+    "CD": (("aerodynamics", "coefficients", "drag", "total"), 0),
+    "power": (("energy", "power"), 0),
+    "thrust": (("frames", "body", "thrust_force_vector"), 0),
+    "wind_force_x": (("frames", "wind", "force_vector"), 0),
+    "wind_force_z": (("frames", "wind", "force_vector"), 2),
+    "total_force_x": (("frames", "wind", "total_force_vector"), 0),
+    "total_force_y": (("frames", "wind", "total_force_vector"), 1),
+    "total_force_z": (("frames", "wind", "total_force_vector"), 2),
+    "total_moment_x": (("frames", "wind", "total_moment_vector"), 0),
+    "total_moment_y": (("frames", "wind", "total_moment_vector"), 1),
+    "total_moment_z": (("frames", "wind", "total_moment_vector"), 2),
+    "total_mass": (("weights", "total_mass"), 0),
+    "vehicle_mass_rate": (("weights", "vehicle_mass_rate"), 0),
+    "cumulative_fuel_consumption": (("energy", "cumulative_fuel_consumption"), 0),
+    "Cm": (("static_stability", "coefficients", "M"), 0),
+    "static_margin": (("static_stability", "static_margin"), 0),
+    "elevator_deflection": (("control_surfaces", "elevator", "deflection"), 0),
+    "aileron_deflection": (("control_surfaces", "aileron", "deflection"), 0),
+    "rudder_deflection": (("control_surfaces", "rudder", "deflection"), 0),
+}
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  ResultsTable
+# ----------------------------------------------------------------------------------------------------------------------
+def _lookup(conditions, chain):
+    value = conditions
+    for key in chain:
+        value = value[key] if isinstance(value, dict) else getattr(value, key)
+    return value
+
+
+def _column_of(value, index):
+    array = np.asarray(value)
+    return array[:, index] if array.ndim > 1 else array.reshape(-1)
+
+
+class ResultsTable:
+    """All segments of a results object concatenated into one contiguous array per quantity.
+
+    ``offsets[i]:offsets[i + 1]`` are the rows of segment ``i``. Columns are extracted once, on first use or
+    by ``extract_all``, and renderers slice views out of them instead of walking the segments again.
+    A column missing from any segment raises RuntimeError, which the Solve tab reports as a skipped plot.
+    """
+
+    def __init__(self, results):
+        segments = list(results.segments)
+        self.tags = [segment.tag for segment in segments]
+        self._conditions = [segment.conditions for segment in segments]
+        self._columns = {}
+        self._derived = {}
+        self._throttles = None
+
+        time = [_column_of(conditions.frames.inertial.time, 0) for conditions in self._conditions]
+        self.offsets = np.concatenate(([0], np.cumsum([column.size for column in time]))).astype(int)
+        self._columns[COLUMNS["time"]] = np.concatenate(time) if time else np.zeros(0)
+        self.time_minutes = self._columns[COLUMNS["time"]] / Units.min
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __getitem__(self, name):
+        chain, index = COLUMNS[name]
+        return self.column(chain, index)
+
+    def segment_slice(self, i):
+        return slice(self.offsets[i], self.offsets[i + 1])
+
+    def column(self, chain, index=0, fill=None):
+        """Concatenated column ``index`` of ``conditions.<chain>``.
+
+        Segments without the quantity are filled with ``fill``; with ``fill=None`` the column is missing.
+        """
+        key = (tuple(chain), index) if fill is None else (tuple(chain), index, fill)
+        if key not in self._columns:
+            self._columns[key] = self._extract(chain, index, fill)
+        column = self._columns[key]
+        if column is None:
+            raise RuntimeError(f"no {'.'.join(chain)} data")
+        return column
+
+    def _extract(self, chain, index, fill):
+        # Concatenated column, or None when a segment lacks it and there is no fill value.
+        parts = []
+        for i, conditions in enumerate(self._conditions):
+            try:
+                part = _column_of(_lookup(conditions, chain), index)
+            except (AttributeError, KeyError, IndexError, TypeError):
+                if fill is None:
+                    return None
+                part = np.full(self.offsets[i + 1] - self.offsets[i], fill, dtype=float)
+            parts.append(part)
+        return np.concatenate(parts).astype(float, copy=False) if parts else np.zeros(0)
+
+    def derived(self, key, fn):
+        """``fn(table)``, computed once per table and cached under ``key``."""
+        if key not in self._derived:
+            self._derived[key] = fn(self)
+        return self._derived[key]
+
+    def segment_values(self, chain):
+        """Scalar ``conditions.<chain>`` of every segment (the last row of array values)."""
+        key = (tuple(chain), "segment")
+        if key not in self._columns:
+            try:
+                self._columns[key] = np.array([
+                    np.asarray(_lookup(conditions, chain), dtype=float).reshape(-1)[-1]
+                    for conditions in self._conditions
+                ])
+            except (AttributeError, KeyError, IndexError, TypeError):
+                self._columns[key] = None
+        values = self._columns[key]
+        if values is None:
+            raise RuntimeError(f"no {'.'.join(chain)} data")
+        return values
+
+    def segment_ends(self, column):
+        """Last row of every segment of a column."""
+        return column[self.offsets[1:] - 1]
+
+    def component_tags(self, chain):
+        """Keys of the ``conditions.<chain>`` containers of all segments, in order of first appearance.
+
+        Only entries that are containers themselves (buses, battery modules, propulsors, ...) are listed.
+        """
+        tags = []
+        for conditions in self._conditions:
+            try:
+                container = _lookup(conditions, chain)
+            except (AttributeError, KeyError, TypeError):
+                continue
+            for tag, value in container.items():
+                if isinstance(value, dict) and tag not in tags:
+                    tags.append(tag)
+        return tags
+
+    def has(self, name):
+        try:
+            self[name]
+        except RuntimeError:
+            return False
+        return True
+
+    def propulsor_throttles(self):
+        """Throttle of every propulsor as (tag, column); NaN where a segment has no such propulsor."""
+        if self._throttles is None:
+            tags = self.component_tags(("energy", "propulsors"))
+            if not tags:
+                raise RuntimeError("no energy.propulsors data")
+            self._throttles = [
+                (tag, self.column(("energy", "propulsors", tag, "throttle"), 0, fill=np.nan)) for tag in tags
+            ]
+        return self._throttles
+
+    def extract_all(self):
+        """Extract every named column available in the results; run once after a solve."""
+        for name in COLUMNS:
+            self.has(name)
+        try:
+            self.propulsor_throttles()
+        except RuntimeError:
+            pass
+        return self
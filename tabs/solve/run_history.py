@@ -0,0 +1,155 @@
+# RCAIDE_GUI/tabs/solve/run_history.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+from RCAIDE.Framework.Core import ContainerOrdered, Data
+
+from .results_store import load_results, save_results
+
+# Runs kept in the history; older ones are deleted.
+DEFAULT_MAX_RUNS = 10
+# Memory held by in-memory runs before the least recently used are spilled to disk.
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Lightweight copies
+# ----------------------------------------------------------------------------------------------------------------------
+def _copy_tree(value):
+    # Arrays and plain values of a conditions tree; everything else (analyses, surrogates, ...) is dropped.
+    if isinstance(value, np.ndarray):
+        return np.array(value) if value.dtype != object else None
+    if isinstance(value, (bool, int, float, str, np.generic)) or value is None:
+        return value
+    if isinstance(value, dict):
+        data = Data()
+        for key, item in value.items():
+            copied = _copy_tree(item)
+            if copied is not None or item is None:
+                data[key] = copied
+        return data
+    return None
+
+
+def _tree_nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(_tree_nbytes(item) for item in value.values())
+    return 0
+
+
+def lightweight_results(results):
+    """Copy of the segment tags and conditions of ``results``, without vehicle, analyses or processes."""
+    light = Data()
+    light.tag = getattr(results, "tag", "")
+    light.segments = ContainerOrdered()
+    for segment in results.segments:
+        copy = Data()
+        copy.tag = segment.tag
+        copy.state = Data()
+        copy.state.conditions = _copy_tree(segment.conditions)
+        copy.conditions = copy.state.conditions
+        light.segments.append(copy)
+    return light
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Run history
+# ----------------------------------------------------------------------------------------------------------------------
+class RunRecord:
+    """One solved run: a label, and its results either in memory or in a store directory on disk."""
+
+    def __init__(self, run_id, label, results, nbytes):
+        self.run_id = run_id
+        self.label = label
+        self.created = datetime.now()
+        self.segment_count = len(results.segments)
+        self.results = results
+        self.nbytes = nbytes
+        self.store = None
+
+    @property
+    def in_memory(self):
+        return self.results is not None
+
+
+class RunHistory:
+    """The last ``max_runs`` solves, holding at most ``memory_budget`` bytes of conditions in memory.
+
+    Only tags and conditions are kept. When the budget is exceeded, the least recently used runs are written
+    to a temporary store and reloaded memory-mapped on access, so retained runs cost disk, not process memory.
+    """
+
+    def __init__(self, max_runs=DEFAULT_MAX_RUNS, memory_budget=DEFAULT_MEMORY_BUDGET):
+        self.max_runs = max_runs
+        self.memory_budget = memory_budget
+        # run_id -> RunRecord, least recently used first.
+        self._records = OrderedDict()
+        self._next_id = 1
+        self._spill_dir = None
+
+    def records(self):
+        """Runs in the order they were added."""
+        return sorted(self._records.values(), key=lambda record: record.run_id)
+
+    def memory_in_use(self):
+        return sum(record.nbytes for record in self._records.values() if record.in_memory)
+
+    def add(self, results, label=None):
+        """Record a lightweight copy of ``results``. Returns its ``RunRecord``."""
+        light = lightweight_results(results)
+        run_id = self._next_id
+        self._next_id += 1
+        nbytes = sum(_tree_nbytes(segment.conditions) for segment in light.segments)
+        record = RunRecord(run_id, label or f"Run {run_id}", light, nbytes)
+        self._records[run_id] = record
+
+        while len(self._records) > self.max_runs:
+            self._delete(next(iter(self._records)))
+        self._enforce_budget()
+        return record
+
+    def get(self, run_id):
+        """Results of a run, reloaded memory-mapped if it was spilled. Marks the run as recently used."""
+        record = self._records[run_id]
+        self._records.move_to_end(run_id)
+        if record.in_memory:
+            return record.results
+        # Memory-mapped reloads are not counted against the budget; the OS pages them in and out.
+        return load_results(record.store)
+
+    def clear(self):
+        for run_id in list(self._records):
+            self._delete(run_id)
+
+    def _enforce_budget(self):
+        # Spill least recently used runs, but always keep the newest one in memory.
+        for run_id in list(self._records)[:-1]:
+            if self.memory_in_use() <= self.memory_budget:
+                break
+            record = self._records[run_id]
+            if record.in_memory:
+                record.store = save_results(record.results, os.path.join(self._spill_directory(), f"run_{run_id}"))
+                record.results = None
+
+    def _delete(self, run_id):
+        record = self._records.pop(run_id)
+        if record.store is not None:
+            shutil.rmtree(record.store, ignore_errors=True)
+
+    def _spill_directory(self):
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="rcaide_gui_runs_")
+            # Remove spilled runs when the history goes away or the application exits.
+            weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+        return self._spill_dir
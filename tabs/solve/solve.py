@@ -5,7 +5,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QTreeWidget, QPushButton, QTreeWidgetItem, QHeaderView, QLabel, QScrollArea, QProgressDialog, QMessageBox
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QTreeWidget, QPushButton, QTreeWidgetItem, QHeaderView, QLabel, QScrollArea, QProgressDialog, QMessageBox, QCheckBox
 from PyQt6.QtCore import Qt, QSize, QObject, QThread, QTimer, pyqtSignal
 import pyqtgraph as pg
 
@@ -18,24 +18,84 @@ from datetime import datetime
 
 # gui imports 
 from tabs import TabWidget
-from .plots.create_plot_widgets import create_plot_widgets
+from .plots.create_plot_widgets import create_plot_widgets
+from .solve_cache import SegmentResultCache, segment_fingerprints
+from .solve_process import MissionSolveProcess
+from .plot_export import EXPORT_FORMATS, curve_snapshot, export_report, figure_snapshot
+from .plot_registry import PlotRegistry
+from .results_table import ResultsTable
+from .run_history import RunHistory
+from .solve_profiler import write_profile
+from .warm_start import evaluation_savings, warm_start_seeds
+from .widgets import PayloadRangeWidget, PlotCurve, PlotSlot, RunHistoryWidget, SolveProfileWidget, SweepWidget, set_level_of_detail, trim_curves, update_curve
+from .widgets.plot_slot import PLOT_SIZE
 
 
 class _SolveWorker(QObject):
     finished = pyqtSignal(object, str)
     failed = pyqtSignal(str)
+    cancelled = pyqtSignal(str)
+    segment_started = pyqtSignal(int, str)
+    segment_finished = pyqtSignal(int, str, object)
+    profiled = pyqtSignal(object)
 
-    def __init__(self, mission):
+    def __init__(self, mission, time_budget=None, warm_starts=None):
         super().__init__()
-        self._mission = mission
+        self._solve_process = MissionSolveProcess(mission, warm_starts)
+        self._time_budget = time_budget
 
     def run(self):
+        # The thread only waits on the solve process, so the Qt event loop keeps the GIL to itself.
         try:
-            # Let solver output stream directly to terminal so native progress bar rendering is preserved.
-            results = self._mission.evaluate()
-            self.finished.emit(results, "")
+            self._solve_process.start()
+            status, payload = self._solve_process.wait(self._time_budget, self._forward_progress)
         except Exception:
+            self._solve_process.terminate()
             self.failed.emit(traceback.format_exc())
+            return
+
+        # Step timings arrive before the outcome, so they are shown whether or not the solve succeeded.
+        if self._solve_process.profile is not None:
+            self.profiled.emit(self._solve_process.profile)
+
+        if status == "finished":
+            self.finished.emit(payload, "")
+        elif status == "cancelled":
+            self.cancelled.emit(payload)
+        else:
+            self.failed.emit(payload)
+
+    def cancel(self):
+        # Called from the GUI thread while run() is blocked waiting on the process.
+        self._solve_process.cancel()
+
+    def _forward_progress(self, message):
+        if message[0] == "segment_started":
+            self.segment_started.emit(message[1], message[2])
+        elif message[0] == "segment_finished":
+            self.segment_finished.emit(message[1], message[2], message[3])
+
+
+class _PlotExportWorker(QObject):
+    figure_finished = pyqtSignal(int, int)
+    finished = pyqtSignal(object, str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, figures, directory, formats):
+        super().__init__()
+        self._figures = figures
+        self._directory = directory
+        self._formats = formats
+
+    def run(self):
+        # Figures are drawn in worker processes; this thread only waits for them and writes the index.
+        try:
+            entries = export_report(self._figures, self._directory, self._formats,
+                                    on_figure=lambda done, total, entry: self.figure_finished.emit(done, total))
+        except Exception:
+            self.failed.emit(traceback.format_exc())
+            return
+        self.finished.emit(entries, self._directory)
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  SolveWidget
@@ -56,6 +116,19 @@ class SolveWidget(TabWidget):
         "Plot Flight Forces and Moments": "_render_flight_forces_moments_pg",
         "Plot Longitudinal Stability": "_render_longitudinal_stability_pg",
         "Plot Lateral Stability": "_render_lateral_stability_pg",
+        "Plot Battery Pack Conditions": "_render_battery_pack_conditions_pg",
+        "Plot Battery Module Conditions": "_render_battery_module_conditions_pg",
+        "Plot Battery Cell Conditions": "_render_battery_cell_conditions_pg",
+        "Plot Battery C-Rates": "_render_battery_c_rates_pg",
+        "Plot Battery Temperature": "_render_battery_temperature_pg",
+        "Plot Battery Degradation": "_render_battery_degradation_pg",
+        "Plot Battery Ragone Diagram": "_render_battery_ragone_pg",
+        "Plot Electric Propulsor Efficiencies": "_render_propulsor_efficiencies_pg",
+        "Plot Wavy Channel Conditions": "_render_wavy_channel_pg",
+        "Plot Cross Flow Heat Exchanger Conditions": "_render_cross_flow_hex_pg",
+        "Plot Reservoir Conditions": "_render_reservoir_pg",
+        "Plot Air Cooled Conditions": "_render_air_cooled_pg",
+        "Plot Emissions": "_render_emissions_pg",
     }
     # Aliases for options that intentionally reuse an existing renderer.
     _PLOT_OPTION_ALIASES = {
@@ -76,6 +149,47 @@ class SolveWidget(TabWidget):
         ("CDform", ("form", "total")),
         ("CD", ("total",)),
     )
+    # Coolant line components: (name, field only this kind of component has, plots as (title, y label, field, scale)).
+    _COOLANT_COMPONENTS = {
+        "wavy_channel": ("Wavy Channel", "heat_removed", (
+            ("Coolant Temperature", "Coolant Temp. (K)", "outlet_coolant_temperature", 1.0),
+            ("Coolant Flow", "Coolant mdot (kg/s)", "coolant_mass_flow_rate", 1.0),
+            ("Power", "HAS Power (W)", "power", 1.0),
+        )),
+        "cross_flow_hex": ("Heat Exchanger", "effectiveness_HEX", (
+            ("Effectiveness", "Effectiveness", "effectiveness_HEX", 1.0),
+            ("Air Temperature", "Air Temp. (K)", "inlet_air_temperature", 1.0),
+            ("Coolant Flow", "Coolant mdot (kg/s)", "coolant_mass_flow_rate", 1.0),
+            ("Air Flow", "Air mdot (kg/s)", "air_mass_flow_rate", 1.0),
+            ("Power", "HEX Power (kW)", "power", 1e-3),
+            ("Air Pressure", "Air Pres. (MPa)", "air_inlet_pressure", 1e-6),
+        )),
+        "reservoir": ("Reservoir", "coolant_temperature", (
+            ("Coolant Temperature", "Coolant Temp. (K)", "coolant_temperature", 1.0),
+        )),
+        "air_cooled": ("Air Cooled", "total_heat_removed", (
+            ("Effectiveness", "Effectiveness", "effectiveness", 1.0),
+            ("Heat Removed", "Total Heat Removed (W)", "total_heat_removed", 1.0),
+        )),
+    }
+    # Species of the emission index plot.
+    _EMISSION_SPECIES = ("CO2", "CO", "NOx", "H2O", "SO2")
+    # Wall-clock budget (seconds) after which a running solve is terminated.
+    _SOLVE_TIME_BUDGET = 30 * 60
+    # Plots within this many screens of the viewport get a plot widget; beyond the release distance it is taken back.
+    _PLOT_PREFETCH_SCREENS = 1
+    _PLOT_RELEASE_SCREENS = 3
+    # Detached plot widgets kept for reuse.
+    _MAX_FREE_PLOT_WIDGETS = 6
+    # RGBA pen colors (0-1) of overlaid runs, cycled in the order the runs were solved.
+    _RUN_COLORS = (
+        (1.0, 1.0, 1.0, 1.0),
+        (0.37, 0.69, 1.0, 1.0),
+        (1.0, 0.6, 0.2, 1.0),
+        (0.4, 0.85, 0.45, 1.0),
+        (0.9, 0.35, 0.45, 1.0),
+        (0.75, 0.55, 1.0, 1.0),
+    )
 
     def __init__(self):
         super(SolveWidget, self).__init__()
@@ -108,10 +222,32 @@ class SolveWidget(TabWidget):
         self.loading_dialog = None
         self._solve_thread = None
         self._solve_worker = None
+        # Previous results per segment, reused by incremental re-solves.
+        self._solve_cache = SegmentResultCache()
+        # (fingerprints, first re-solved segment index) of the solve in flight.
+        self._incremental_solve = None
+        # Results the running solve was warm-started from, kept to report the evaluation savings.
+        self._warm_start_results = None
+        # Segments of the running solve streamed back as they converge, and the mission's segment count.
+        self._partial_segments = []
+        self._solve_segment_count = 0
+        # Step timings of the last solve (SolveProfiler.rows()).
+        self.solve_profile = None
+        # Lightweight copies of recent results for side-by-side comparison.
+        self.run_history = RunHistory()
+        # True while the plots show several runs; per-run pens then take precedence over the line color setting.
+        self._overlay_active = False
+        # (results, ResultsTable) of the last rendered results; the table is reused until the results change.
+        self._results_table = None
+        # (results, plot parameters) currently drawn, the widgets of each drawn plot group by renderer key,
+        # and the skip reason of each checked group that could not be drawn.
+        self._rendered = None
+        self._plot_groups = {}
+        self._skipped_plots = {}
         self._is_rendering_plots = False
         self._plot_render_timer = QTimer(self)
         self._plot_render_timer.setSingleShot(True)
-        self._plot_render_timer.timeout.connect(self._render_from_latest_results)
+        self._plot_render_timer.timeout.connect(self.refresh_plot_selection)
         self._last_skipped_signature = None
 
         solve_button.setStyleSheet("""
@@ -169,6 +305,19 @@ class SolveWidget(TabWidget):
 
         solve_button.clicked.connect(self.run_solve)
 
+        # Parameter sweeps open in their own window, created on first use.
+        self.sweep_button = QPushButton("Parameter Sweep...")
+        self.sweep_button.clicked.connect(self.open_sweep_window)
+        self.sweep_widget = None
+        self.payload_range_button = QPushButton("Payload-Range...")
+        self.payload_range_button.clicked.connect(self.open_payload_range_window)
+        self.payload_range_widget = None
+
+        # Opt-in: start re-solved segments from the unknowns of the previous results.
+        self.warm_start_checkbox = QCheckBox("Warm start from previous results")
+        self.warm_start_checkbox.setToolTip(
+            "Seed each segment's unknowns with the solution of the same segment from the last simulation.")
+
         # Create a scroll area for the plot widgets
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -181,6 +330,13 @@ class SolveWidget(TabWidget):
         plot_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         self.plot_layout = plot_layout
         self._dynamic_plot_widgets = []
+        # Dynamic plot slots by (renderer key, title), kept across renders and refilled in place.
+        self._plot_slots = {}
+        # Plot widgets detached from slots that scrolled far out of view, reused for the next slots shown.
+        self._free_plot_widgets = []
+        # Curves filled so far in the current render, per base plot widget.
+        self._curve_cursors = {}
+        self._rendering_key = None
 
         plot_size = QSize(620, 400)  # Slightly narrower to avoid lateral scrolling
         show_legend = True
@@ -191,8 +347,19 @@ class SolveWidget(TabWidget):
             self.aircraft_Mach_plot,
             self.aircraft_CAS_plot,
         ]
+        # Plot widgets that settings and theming apply to.
+        self.plot_registry = PlotRegistry()
+        for widget in self._base_plot_widgets:
+            self.plot_registry.register(widget)
 
         scroll_area.setWidget(plot_container)
+        self.plot_scroll_area = scroll_area
+        # Plot widgets are only attached to slots near the viewport; re-check whenever it moves.
+        self._viewport_timer = QTimer(self)
+        self._viewport_timer.setSingleShot(True)
+        self._viewport_timer.timeout.connect(self._update_plot_viewport)
+        scroll_area.verticalScrollBar().valueChanged.connect(self._schedule_viewport_update)
+        scroll_area.verticalScrollBar().rangeChanged.connect(self._schedule_viewport_update)
 
         # Add the scroll area to the main_layout
         main_layout.addWidget(scroll_area)
@@ -201,7 +368,16 @@ class SolveWidget(TabWidget):
         self.tree = QTreeWidget()
         self.init_tree()
         tree_layout.addWidget(solve_button)
+        tree_layout.addWidget(self.warm_start_checkbox)
+        tree_layout.addWidget(self.sweep_button)
+        tree_layout.addWidget(self.payload_range_button)
         tree_layout.addWidget(self.tree)
+        self.profile_widget = SolveProfileWidget()
+        tree_layout.addWidget(self.profile_widget)
+        self.run_history_widget = RunHistoryWidget()
+        self.run_history_widget.overlay_requested.connect(self.render_run_overlay)
+        self.run_history_widget.latest_requested.connect(self._render_from_latest_results)
+        tree_layout.addWidget(self.run_history_widget)
 
         # Add layouts to the base_layout
         base_layout.addLayout(tree_layout, 3)
@@ -235,7 +411,7 @@ class SolveWidget(TabWidget):
         # Use local imports to avoid extra startup/circular import issues.
         import values
         from tabs.mission.widgets.mission_analysis_widget import MissionAnalysisWidget
-        from tabs.mission.widgets.mission_segment_widget import MissionSegmentWidget
+        from tabs.mission.widgets.mission_segment_builder import build_rcaide_mission
 
         # Read mission built in Mission tab.
         mission = getattr(values, "rcaide_mission", None)
@@ -257,49 +433,96 @@ class SolveWidget(TabWidget):
                     "Go to Aircraft Configurations tab and press 'Save Configuration'."
                 ) from e
 
-        # If mission has no segments, rebuild it from saved mission_data.
-        if not getattr(mission, "segments", []):
-            if values.mission_data:
-                # Ensure analyses exist before rebuilding segments.
-                if not getattr(values, "rcaide_analyses", None):
-                    MissionAnalysisWidget().save_analyses()
-
-                # Recreate mission and append each saved segment.
-                import RCAIDE
-                mission = RCAIDE.Framework.Mission.Sequential_Segments()
-                for seg_data in values.mission_data:
-                    seg = MissionSegmentWidget()
-                    seg.load_data(seg_data)
-                    _, rcaide_segment = seg.get_data()
-                    mission.append_segment(rcaide_segment)
-
-                # Save rebuilt mission back to shared state.
-                values.rcaide_mission = mission
-            else:
-                # No mission to run.
-                raise RuntimeError("No mission segments available. Save the mission first.")
-
         # Ignore click if a solve is already running.
         if self._solve_thread is not None and self._solve_thread.isRunning():
             return
 
+        fingerprints = None
+        if values.mission_data:
+            # Ensure analyses exist before rebuilding segments.
+            if not getattr(values, "rcaide_analyses", None):
+                MissionAnalysisWidget().save_analyses()
+
+            # Recreate mission from the saved segment data so edits since the last solve are picked up.
+            mission = build_rcaide_mission(values.mission_data)
+
+            # Save rebuilt mission back to shared state.
+            values.rcaide_mission = mission
+            fingerprints = segment_fingerprints(values.mission_data)
+        elif not getattr(mission, "segments", []):
+            # No mission to run.
+            raise RuntimeError("No mission segments available. Save the mission first.")
+
+        # Only segments from the first changed one onward need to be solved again.
+        start_index = self._solve_cache.first_changed_segment(fingerprints)
+        segment_count = len(mission.segments)
+        if start_index >= segment_count:
+            # Nothing to solve or record: show the cached results again, keeping their extracted table.
+            print("Mission unchanged since the last simulation; reusing previous results")
+            self._incremental_solve = None
+            values.rcaide_results = self._solve_cache.results
+            self.render_solve_plots(values.rcaide_results)
+            return
+        self._incremental_solve = (fingerprints, start_index)
+
         # Start solve with loading popup.
-        print("Commencing Mission Simulation")
-        self._set_loading_state(True)
-        self._start_solve_worker(mission)
-
-    def _start_solve_worker(self, mission):
-        # Create worker thread so UI does not freeze during solve.
-        self._solve_thread = QThread(self)
-        self._solve_worker = _SolveWorker(mission)
+        if start_index > 0:
+            print(f"Commencing Mission Simulation from segment {start_index + 1}/{segment_count} "
+                  f"(reusing {start_index} unchanged segments)")
+        else:
+            print("Commencing Mission Simulation")
+        # Reused segments are shown right away; solved ones are appended as they converge.
+        self._solve_segment_count = segment_count
+        self._partial_segments = []
+        if start_index > 0:
+            self._partial_segments = list(self._solve_cache.results.segments.values())[:start_index]
+        self._set_loading_state(True)
+        mission = self._solve_cache.mission_from(mission, start_index)
+
+        # Seed the segments to solve with the previous solution of the same segments, if requested.
+        warm_starts = None
+        self._warm_start_results = None
+        if self.warm_start_checkbox.isChecked() and values.rcaide_results is not None:
+            warm_starts = warm_start_seeds(mission, values.rcaide_results)
+            if any(seed is not None for seed in warm_starts):
+                self._warm_start_results = values.rcaide_results
+            else:
+                warm_starts = None
+        self._start_solve_worker(mission, warm_starts)
+
+    def open_sweep_window(self):
+        # Sweep the project as currently saved; reuse the window so a finished sweep stays visible.
+        if self.sweep_widget is None:
+            self.sweep_widget = SweepWidget(self._SOLVE_TIME_BUDGET)
+        else:
+            self.sweep_widget.load_parameters()
+        self.sweep_widget.show()
+        self.sweep_widget.raise_()
+
+    def open_payload_range_window(self):
+        # Reuse the window so its cache of solved corner points survives between openings.
+        if self.payload_range_widget is None:
+            self.payload_range_widget = PayloadRangeWidget(self._SOLVE_TIME_BUDGET)
+        self.payload_range_widget.show()
+        self.payload_range_widget.raise_()
+
+    def _start_solve_worker(self, mission, warm_starts=None):
+        # Create worker thread so UI does not freeze during solve.
+        self._solve_thread = QThread(self)
+        self._solve_worker = _SolveWorker(mission, self._SOLVE_TIME_BUDGET, warm_starts)
         self._solve_worker.moveToThread(self._solve_thread)
 
-        # Wire start/success/failure/cleanup signals.
+        # Wire start/progress/success/failure/cancel/cleanup signals.
         self._solve_thread.started.connect(self._solve_worker.run)
+        self._solve_worker.segment_started.connect(self._on_segment_started)
+        self._solve_worker.segment_finished.connect(self._on_segment_finished)
+        self._solve_worker.profiled.connect(self._on_solve_profiled)
         self._solve_worker.finished.connect(self._on_solve_finished)
         self._solve_worker.failed.connect(self._on_solve_failed)
+        self._solve_worker.cancelled.connect(self._on_solve_cancelled)
         self._solve_worker.finished.connect(self._solve_thread.quit)
         self._solve_worker.failed.connect(self._solve_thread.quit)
+        self._solve_worker.cancelled.connect(self._solve_thread.quit)
         self._solve_thread.finished.connect(self._cleanup_solve_worker)
         self._solve_thread.start()
 
@@ -318,11 +541,11 @@ class SolveWidget(TabWidget):
         self.tree.setEnabled(not is_loading)
 
         if is_loading:
-            # Show modal loading popup.
-            dialog = QProgressDialog("Running mission simulation...", "", 0, 0, self)
+            # Show loading popup; it is not modal so plots of finished segments can be inspected during the solve.
+            dialog = QProgressDialog("Running mission simulation...", "Cancel", 0, 0, self)
             dialog.setWindowTitle("Simulating Mission")
-            dialog.setWindowModality(Qt.WindowModality.ApplicationModal)
-            dialog.setCancelButton(None)
+            dialog.setWindowModality(Qt.WindowModality.NonModal)
+            dialog.canceled.connect(self._cancel_solve)
             dialog.setMinimumDuration(0)
             dialog.setAutoClose(False)
             dialog.setAutoReset(False)
@@ -331,7 +554,8 @@ class SolveWidget(TabWidget):
             return
 
         if self.loading_dialog is not None:
-            # Hide loading popup when solve completes/fails.
+            # Hide loading popup when solve completes/fails; closing would otherwise emit canceled.
+            self.loading_dialog.canceled.disconnect(self._cancel_solve)
             self.loading_dialog.close()
             self.loading_dialog.deleteLater()
             self.loading_dialog = None
@@ -345,63 +569,250 @@ class SolveWidget(TabWidget):
             for warning in warnings:
                 print(f"- {warning}")
 
+        # Report how many residual evaluations warm-started segments needed compared to the previous solve.
+        if self._warm_start_results is not None:
+            self._print_warm_start_savings(results, self._warm_start_results)
+            self._warm_start_results = None
+
+        # Splice newly solved segments after the reused ones and remember them for the next solve.
+        if self._incremental_solve is not None:
+            fingerprints, start_index = self._incremental_solve
+            self._incremental_solve = None
+            if start_index > 0:
+                results = self._solve_cache.merge(start_index, results)
+            if fingerprints is not None:
+                self._solve_cache.store(fingerprints, results)
+            else:
+                self._solve_cache.clear()
+
         # Store results and refresh plots.
+        self._partial_segments = []
         print("Completed Mission Simulation")
         values.rcaide_results = results
+        # Extract the plotted quantities once; every later re-render only slices the table.
+        self._results_table = (results, ResultsTable(results).extract_all())
+        self.run_history.add(results)
+        self.run_history_widget.set_runs(self.run_history.records())
         self.render_solve_plots(results)
         self._set_loading_state(False)
 
+    def _print_warm_start_savings(self, results, previous_results):
+        savings = evaluation_savings(results, previous_results)
+        if not savings:
+            return
+        print("Warm start residual evaluations (this solve / previous solve):")
+        total_warm = total_previous = 0
+        for tag, warm, previous in savings:
+            print(f"- {tag}: {warm if warm is not None else '?'} / {previous if previous is not None else '?'}")
+            if warm is not None and previous is not None:
+                total_warm += warm
+                total_previous += previous
+        if total_previous:
+            print(f"Saved {total_previous - total_warm} of {total_previous} evaluations "
+                  f"({100.0 * (total_previous - total_warm) / total_previous:.0f}%)")
+
     def _on_solve_failed(self, error_message):
         # Restore UI state and surface error details.
+        self._incremental_solve = None
+        self._warm_start_results = None
+        self._partial_segments = []
         self._set_loading_state(False)
         print("Mission simulation failed.")
         print(error_message)
         QMessageBox.critical(self, "Mission Simulation Failed", error_message)
 
-    def render_solve_plots(self, results):
+    def _cancel_solve(self):
+        # Ask the worker to terminate the solve process; UI is restored once it reports back.
+        if self._solve_worker is not None:
+            print("Cancelling mission simulation...")
+            self._solve_worker.cancel()
+
+    def _on_segment_started(self, index, tag):
+        # Show which segment is being solved in the loading popup.
+        if self.loading_dialog is not None:
+            # Indices from the solve process are relative to the first re-solved segment.
+            if self._incremental_solve is not None:
+                index += self._incremental_solve[1]
+            self.loading_dialog.setLabelText(f"Running mission simulation...\nSolving segment {index + 1}: {tag}")
+
+    def _on_segment_finished(self, index, tag, info):
+        # Stream the converged segment into the plots and report its solve statistics.
+        if self._incremental_solve is not None:
+            index += self._incremental_solve[1]
+
+        elapsed = info.get("elapsed")
+        residual_norm = info.get("residual_norm")
+        status = "converged" if info.get("converged") else "did not converge"
+        elapsed_text = f"{elapsed:.1f} s" if elapsed is not None else "? s"
+        residual_text = f"{residual_norm:.3e}" if residual_norm is not None else "?"
+        print(f"Segment {index + 1}/{self._solve_segment_count} '{tag}' {status} "
+              f"in {elapsed_text} (residual norm {residual_text})")
+
+        if self.loading_dialog is not None:
+            self.loading_dialog.setMaximum(self._solve_segment_count)
+            self.loading_dialog.setValue(index + 1)
+
+        self._partial_segments.append(info["segment"])
+        self.render_solve_plots(self._partial_results())
+
+    def _on_solve_profiled(self, rows):
+        # Show where the solve spent its time.
+        self.solve_profile = rows
+        self.profile_widget.set_profile(rows)
+
+    def _partial_results(self):
+        # Minimal results object (segments only) accepted by the time-series renderers.
+        from RCAIDE.Framework.Core import Data
+        partial = Data()
+        partial.segments = list(self._partial_segments)
+        return partial
+
+    def _on_solve_cancelled(self, message):
+        # Restore UI state and log where the solve was stopped; plots of finished segments are kept.
+        self._incremental_solve = None
+        self._warm_start_results = None
+        self._partial_segments = []
+        self._set_loading_state(False)
+        print(message)
+
+    def render_run_overlay(self, run_ids):
+        # Draw the selected runs on the same axes, one pen color per run.
+        from RCAIDE.Framework.Core import Data
+        overlay = Data()
+        overlay.segments = []
+        colors = []
+        for run_number, run_id in enumerate(run_ids):
+            record = next(record for record in self.run_history.records() if record.run_id == run_id)
+            color = np.array(self._RUN_COLORS[run_number % len(self._RUN_COLORS)])
+            for segment in self.run_history.get(run_id).segments:
+                # Shallow copies: the tag carries the run label into the legends, the arrays are shared.
+                labelled = Data()
+                labelled.tag = f"{record.label}: {segment.tag}"
+                labelled.conditions = segment.conditions
+                overlay.segments.append(labelled)
+                colors.append(color)
+        # Spilled runs may have been reloaded; refresh their "(on disk)" markers.
+        self.run_history_widget.set_runs(self.run_history.records())
+        self.render_solve_plots(overlay, line_colors=np.array(colors))
+
+    def render_solve_plots(self, results, line_colors=None):
         # Main render entry point: rebuild plots from current checked options.
         if self._is_rendering_plots:
             return
         self._is_rendering_plots = True
+        self._overlay_active = line_colors is not None
         self.setUpdatesEnabled(False)
         try:
-            self.clear_plot_widgets()
-            self.clear_dynamic_plot_widgets()
+            previous_widgets = self._dynamic_plot_widgets
+            self._dynamic_plot_widgets = []
+            self._curve_cursors = {}
+            self._plot_groups = {}
+            self._skipped_plots = {}
             for widget in self._base_plot_widgets:
                 widget.setVisible(False)
-            plot_parameters = self._build_plot_parameters(results)
+            plot_parameters = self._build_plot_parameters(results, line_colors)
+            plot_parameters.results_table = self._table_for(results)
+            self._rendered = (results, plot_parameters)
 
-            rendered = set()
-            skipped = []
-            for option in self._collect_checked_plot_options():
-                key, renderer = self._resolve_plot_renderer(option)
-                if key in rendered:
-                    continue
-                # Option exists in the tree but no renderer is wired for it.
-                if renderer is None:
-                    skipped.append(f"{option}: no renderer")
-                    continue
-                start_idx = len(self._dynamic_plot_widgets)
-                try:
-                    # Each renderer can raise RuntimeError when its required
-                    # result fields are missing. We treat that as a per-plot
-                    # skip so the rest of the selected plots still render.
-                    renderer(results, plot_parameters)
-                    self._remove_empty_dynamic_plots(start_idx)
-                    rendered.add(key)
-                except Exception as exc:
-                    # Roll back widgets created by this renderer and record
-                    # the reason so the user knows why this plot was skipped.
-                    self._clear_dynamic_widgets_from(start_idx)
-                    skipped.append(f"{option}: {exc}")
-
-            self._log_skipped_plot_entries(skipped)
+            for option, key, renderer in self._checked_plot_renderers():
+                self._run_plot_renderer(option, key, renderer)
+
+            self._finish_plot_widgets(previous_widgets)
+            self._log_skipped_plot_entries(list(self._skipped_plots.values()))
             if hasattr(self, "apply_plot_settings"):
                 self.apply_plot_settings()
         finally:
             self.setUpdatesEnabled(True)
             self._is_rendering_plots = False
 
+    def refresh_plot_selection(self):
+        # Apply plot option changes to the shown results: hide unchecked groups, draw only newly checked ones.
+        if self._rendered is None:
+            self._render_from_latest_results()
+            return
+        if self._is_rendering_plots:
+            return
+        self._is_rendering_plots = True
+        self.setUpdatesEnabled(False)
+        try:
+            checked = self._checked_plot_renderers()
+            checked_keys = {key for _, key, _ in checked}
+            for key in [key for key in self._plot_groups if key not in checked_keys]:
+                for widget in self._plot_groups.pop(key):
+                    widget.setVisible(False)
+            for key in [key for key in self._skipped_plots if key not in checked_keys]:
+                del self._skipped_plots[key]
+
+            self._curve_cursors = {}
+            added = []
+            for option, key, renderer in checked:
+                # Groups already drawn, or already skipped for these results, are left as they are.
+                if key in self._plot_groups or key in self._skipped_plots:
+                    continue
+                self._run_plot_renderer(option, key, renderer)
+                added.extend(self._plot_groups.get(key, []))
+
+            # Keep dynamic plots in tree order.
+            previous_widgets = self._dynamic_plot_widgets
+            base_widgets = set(self._base_plot_widgets)
+            self._dynamic_plot_widgets = [
+                widget for _, key, _ in checked for widget in self._plot_groups.get(key, [])
+                if widget not in base_widgets
+            ]
+            self._finish_plot_widgets(previous_widgets)
+            self._log_skipped_plot_entries(list(self._skipped_plots.values()))
+            # Slots get the settings when a plot widget is attached to them.
+            added = [widget for widget in added if isinstance(widget, pg.PlotWidget)]
+            if added and hasattr(self, "apply_plot_settings_to"):
+                self.apply_plot_settings_to(added)
+        finally:
+            self.setUpdatesEnabled(True)
+            self._is_rendering_plots = False
+
+    def _checked_plot_renderers(self):
+        # (option, renderer key, renderer) of the checked options, once per renderer key.
+        entries = []
+        seen = set()
+        for option in self._collect_checked_plot_options():
+            key, renderer = self._resolve_plot_renderer(option)
+            if key in seen:
+                continue
+            seen.add(key)
+            entries.append((option, key, renderer))
+        return entries
+
+    def _run_plot_renderer(self, option, key, renderer):
+        # Draw one plot group of the shown results and record its widgets, so toggling it only hides or shows them.
+        if renderer is None:
+            # Option exists in the tree but no renderer is wired for it.
+            self._skipped_plots[key] = f"{option}: no renderer"
+            return
+        results, plot_parameters = self._rendered
+        start_idx = len(self._dynamic_plot_widgets)
+        hidden_base_widgets = [widget for widget in self._base_plot_widgets if widget.isHidden()]
+        self._rendering_key = key
+        try:
+            # Each renderer can raise RuntimeError when its required
+            # result fields are missing. We treat that as a per-plot
+            # skip so the rest of the selected plots still render.
+            renderer(results, plot_parameters)
+            self._remove_empty_dynamic_plots(start_idx)
+        except Exception as exc:
+            # Roll back widgets created by this renderer and record
+            # the reason so the user knows why this plot was skipped.
+            self._clear_dynamic_widgets_from(start_idx)
+            self._skipped_plots[key] = f"{option}: {exc}"
+            return
+        self._plot_groups[key] = self._dynamic_plot_widgets[start_idx:] + [
+            widget for widget in hidden_base_widgets if not widget.isHidden()
+        ]
+
+    def _table_for(self, results):
+        # Flattened table of ``results``, built on first render and kept while the same results are shown.
+        if self._results_table is None or self._results_table[0] is not results:
+            self._results_table = (results, ResultsTable(results))
+        return self._results_table[1]
+
     def clear_plot_widgets(self):
         # Clear data items from all plot widgets (keeps widgets alive).
         for widget in self.findChildren(pg.PlotWidget):
@@ -432,10 +843,29 @@ class SolveWidget(TabWidget):
         return key, getattr(self, method_name, None)
 
     def _clear_dynamic_widgets_from(self, start_idx):
-        # Remove dynamic plots created after a given index.
-        to_remove = self._dynamic_plot_widgets[start_idx:]
+        # Release dynamic plots used after a given index; their slots stay pooled for the next render.
+        for slot in self._dynamic_plot_widgets[start_idx:]:
+            slot.curves = []
+            self._release_slot(slot)
         self._dynamic_plot_widgets = self._dynamic_plot_widgets[:start_idx]
-        self._delete_plot_widgets(to_remove)
+
+    def _finish_plot_widgets(self, previous_widgets):
+        # Drop curves not refilled by this render, hide unused plots and keep the layout in render order.
+        for widget, cursor in self._curve_cursors.items():
+            trim_curves(widget, cursor)
+        in_use = set(self._dynamic_plot_widgets)
+        for slot in self._plot_slots.values():
+            if slot not in in_use:
+                slot.setVisible(False)
+                self._release_slot(slot)
+        if self._dynamic_plot_widgets != [widget for widget in previous_widgets if widget in in_use]:
+            for widget in self._dynamic_plot_widgets:
+                self.plot_layout.removeWidget(widget)
+                self.plot_layout.addWidget(widget, alignment=Qt.AlignmentFlag.AlignHCenter)
+        for slot in self._dynamic_plot_widgets:
+            slot.setVisible(True)
+            slot.refresh()
+        self._schedule_viewport_update()
 
     def _log_skipped_plot_entries(self, skipped):
         # Print skipped-plot reasons, but only when the list changes.
@@ -463,22 +893,71 @@ class SolveWidget(TabWidget):
         if results is not None:
             self.render_solve_plots(results)
 
+    def load_from_values(self):
+        # A newly loaded project brings its own (possibly memory-mapped) results; drop those of the previous one.
+        import values
+        self._solve_cache.clear()
+        self.solve_profile = None
+        self.profile_widget.clear()
+        self.run_history.clear()
+        self.run_history_widget.set_runs([])
+        if getattr(values, "rcaide_results", None) is not None:
+            self.render_solve_plots(values.rcaide_results)
+        else:
+            self.clear_plot_widgets()
+            self.clear_dynamic_plot_widgets()
+            self._rendered = None
+            self._plot_groups = {}
+            self._skipped_plots = {}
+
     def clear_dynamic_plot_widgets(self):
-        # Delete all dynamic plots from the layout.
-        self._delete_plot_widgets(self._dynamic_plot_widgets)
+        # Hide all dynamic plots and give back their plot widgets; the slots stay pooled for the next render.
+        for slot in self._dynamic_plot_widgets:
+            slot.setVisible(False)
+            self._release_slot(slot)
         self._dynamic_plot_widgets = []
 
-    def _delete_plot_widgets(self, widgets):
-        # Remove widgets from layout and free them safely.
-        for widget in widgets:
-            self.plot_layout.removeWidget(widget)
-            widget.setParent(None)
-            widget.deleteLater()
-
     def _new_plot_widget(self, title, y_label, x_label="Time (min)", show_legend=True):
-        # Create one new plot widget and add it to the dynamic list.
+        # Return the pooled plot slot of this renderer and title, creating it on first use.
+        # Renderers fill the slot like a plot widget; a real widget is attached once it scrolls into view.
+        key = (self._rendering_key, title)
+        slot = self._plot_slots.get(key)
+        if slot is None:
+            slot = PlotSlot(title, y_label, x_label)
+            self.plot_layout.addWidget(slot, alignment=Qt.AlignmentFlag.AlignHCenter)
+            self._plot_slots[key] = slot
+        self._begin_curves(slot)
+        self._dynamic_plot_widgets.append(slot)
+        return slot
+
+    def _begin_curves(self, target):
+        # Start refilling the curves of a plot slot or widget from its first curve.
+        if isinstance(target, PlotSlot):
+            target.curves = []
+        else:
+            self._curve_cursors[target] = 0
+
+    def _curve_count(self, target):
+        # Curves filled into a plot slot or widget by the current render.
+        if isinstance(target, PlotSlot):
+            return len(target.curves)
+        return self._curve_cursors.get(target, 0)
+
+    def _plot_curve(self, target, x, y, pen, symbol, brush, plot_parameters, name=None, source=None):
+        # Add the next curve of a plot slot, or fill it into a plot widget reusing the existing PlotDataItem.
+        # ``source`` names the arrays and rows the curve was sliced from (see PlotCurve).
+        curve = PlotCurve(x, y, pen, symbol, brush, plot_parameters.marker_size, name, source)
+        if isinstance(target, PlotSlot):
+            target.curves.append(curve)
+            return
+        cursor = self._curve_cursors.get(target, 0)
+        self._curve_cursors[target] = cursor + 1
+        update_curve(target, cursor, curve)
+
+    def _create_plot_widget(self):
+        # Create and style one dynamic plot widget; titles and labels come from the slot it is attached to.
         widget = pg.PlotWidget()
-        widget.setFixedSize(QSize(620, 380))
+        widget.setFixedSize(PLOT_SIZE)
         widget.setBackground("#0e141b")
         plot_item = widget.getPlotItem()
         plot_item.showGrid(x=True, y=True, alpha=0.15)
@@ -487,10 +966,7 @@ class SolveWidget(TabWidget):
             axis.setPen(pg.mkPen("#4da3ff"))
             axis.setTextPen(pg.mkPen("#9fb8ff"))
         plot_item.getViewBox().setBorder(pg.mkPen("#1f2a36"))
-        widget.setLabel("left", y_label, color="white", size="18px")
-        widget.setLabel("bottom", x_label, color="white", size="18px")
-        widget.setTitle(title, color="#9fb8ff", size="14pt")
-        # Add legend only when legend toggle is enabled.
+        # Add legend only when legend toggle is enabled; apply_plot_settings adds it later otherwise.
         if hasattr(self, "legend_check") and self.legend_check.isChecked():
             legend = widget.addLegend(offset=(10, 10))
             # Style legend when it was created.
@@ -498,10 +974,60 @@ class SolveWidget(TabWidget):
                 legend.setBrush(pg.mkBrush(8, 12, 18, 180))
                 legend.setPen(pg.mkPen(120, 150, 210, 140))
             self._position_plot_legend(widget)
-        self.plot_layout.addWidget(widget, alignment=Qt.AlignmentFlag.AlignHCenter)
-        self._dynamic_plot_widgets.append(widget)
         return widget
 
+    def _materialize_slot(self, slot):
+        # Attach a plot widget (reused from the free list when possible) to a slot and style it.
+        if slot.plot_widget is not None:
+            return
+        widget = self._free_plot_widgets.pop() if self._free_plot_widgets else self._create_plot_widget()
+        slot.attach(widget)
+        self.plot_registry.register(widget)
+        if hasattr(self, "apply_plot_settings_to"):
+            self.apply_plot_settings_to([widget])
+
+    def _release_slot(self, slot):
+        # Detach the plot widget of a slot; keep a few for reuse and free the rest.
+        widget = slot.detach()
+        if widget is None:
+            return
+        self.plot_registry.unregister(widget)
+        if len(self._free_plot_widgets) < self._MAX_FREE_PLOT_WIDGETS:
+            self._free_plot_widgets.append(widget)
+        else:
+            widget.deleteLater()
+
+    def _schedule_viewport_update(self, *args):
+        # Coalesce scroll and layout changes into one viewport pass.
+        self._viewport_timer.start(0)
+
+    def _update_plot_viewport(self):
+        # Attach plot widgets to slots near the visible area and release those far away from it.
+        viewport_height = self.plot_scroll_area.viewport().height()
+        top = self.plot_scroll_area.verticalScrollBar().value()
+        near_top = top - self._PLOT_PREFETCH_SCREENS * viewport_height
+        near_bottom = top + (1 + self._PLOT_PREFETCH_SCREENS) * viewport_height
+        far_top = top - self._PLOT_RELEASE_SCREENS * viewport_height
+        far_bottom = top + (1 + self._PLOT_RELEASE_SCREENS) * viewport_height
+        for slot in self._dynamic_plot_widgets:
+            slot_top = slot.y()
+            slot_bottom = slot_top + slot.height()
+            if slot_bottom >= near_top and slot_top <= near_bottom:
+                self._materialize_slot(slot)
+            elif slot_bottom < far_top or slot_top > far_bottom:
+                self._release_slot(slot)
+
+    def _materialize_all_plots(self):
+        # Attach plot widgets to every shown slot (e.g. before exporting all plots).
+        for slot in self._dynamic_plot_widgets:
+            self._materialize_slot(slot)
+
+    def _materialized_plot_widgets(self):
+        # Base plot widgets plus the plot widgets currently attached to shown slots.
+        return list(self._base_plot_widgets) + [
+            slot.plot_widget for slot in self._dynamic_plot_widgets if slot.plot_widget is not None
+        ]
+
     def _position_plot_legend(self, plot_widget):
         # Keep legend fixed in the top-right corner.
         legend = plot_widget.plotItem.legend
@@ -540,76 +1066,93 @@ class SolveWidget(TabWidget):
         from RCAIDE.Framework.Core import Units
         return Units
 
-    def _plot_time_series(self, widget, results, plot_parameters, y_fn):
-        # Plot one time-series curve per mission segment.
-        for segment, time, pen, brush, symbol, tag in self._iter_segments_with_style(results, plot_parameters):
-            y = np.asarray(y_fn(segment)).reshape(-1)
-            widget.plot(time, y, pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=tag)
+    def _plot_time_series(self, widget, table, plot_parameters, y):
+        # Plot one time-series curve per mission segment from slices of a table column.
+        for i, rows, pen, brush, symbol, tag in self._iter_segments_with_style(table, plot_parameters):
+            self._plot_curve(widget, table.time_minutes[rows], y[rows], pen, symbol, brush, plot_parameters,
+                             name=tag, source=(table.time_minutes, y, rows.start, rows.stop))
 
-    def _iter_segments_with_style(self, results, plot_parameters):
-        # Yield segment data plus plotting style and label.
-        U = self._units()
-        for i, segment in enumerate(results.segments):
-            time = segment.conditions.frames.inertial.time[:, 0] / U.min
+    def _iter_segments_with_style(self, table, plot_parameters):
+        # Yield segment rows of the results table plus plotting style and label.
+        for i, tag in enumerate(table.tags):
             pen, brush, symbol = self._segment_style(i, plot_parameters)
-            yield segment, time, pen, brush, symbol, segment.tag.replace("_", " ")
+            yield i, table.segment_slice(i), pen, brush, symbol, tag.replace("_", " ")
 
-    def _render_time_series_group(self, results, plot_parameters, specs, x_label="Time (min)"):
-        # Create and fill a group of time-series plots.
+    def _render_time_series_group(self, table, plot_parameters, specs, x_label="Time (min)"):
+        # Create and fill a group of time-series plots; each spec computes its whole-mission column once.
         for title, y_label, y_fn, show_legend in specs:
+            y = table.derived(title, y_fn)
             widget = self._new_plot_widget(title, y_label, x_label=x_label, show_legend=show_legend)
-            self._plot_time_series(widget, results, plot_parameters, y_fn)
+            self._plot_time_series(widget, table, plot_parameters, y)
 
     def _render_aircraft_velocities(self, results, plot_parameters):
         # Fill the base aircraft-velocity plots.
-        from .plots.mission import plot_aircraft_velocities
-        for widget in self._base_plot_widgets:
+        U = self._units()
+        table = plot_parameters.results_table
+
+        def airspeeds(t):
+            velocity = t["velocity"] / U.kts
+            pressure_ratio = t["density"] / 1.225
+            mach = t["mach_number"]
+            eas = velocity * np.sqrt(pressure_ratio)
+            cas = eas * (1 + ((1 / 8) * ((1 - pressure_ratio) * mach ** 2))
+                         + ((3 / 640) * (1 - 10 * pressure_ratio + (9 * pressure_ratio ** 2) * (mach ** 4))))
+            return velocity, eas, mach, cas
+
+        velocity, eas, mach, cas = table.derived("Aircraft Velocities", airspeeds)
+        for widget, y, y_label in (
+            (self.aircraft_TAS_plot, velocity, "True Airspeed (kts)"),
+            (self.aircraft_EAS_plot, eas, "Equiv. Airspeed (kts)"),
+            (self.aircraft_Mach_plot, mach, "Mach Number"),
+            (self.aircraft_CAS_plot, cas, "Calibrated Airspeed (kts)"),
+        ):
             widget.setVisible(True)
-        plot_aircraft_velocities(self, results, plot_parameters)
+            self._begin_curves(widget)
+            self._plot_time_series(widget, table, plot_parameters, y)
+            widget.setLabel("left", y_label, **plot_parameters.styles)
+            widget.setLabel("bottom", "Time (min)", **plot_parameters.styles)
+            widget.showGrid(x=plot_parameters.show_grid, y=plot_parameters.show_grid)
+            widget.addLegend(labelTextSize=plot_parameters.legend_font_size)
+            widget.setYRange(0, (np.max(y) if y.size else 0) * 1.2)
 
     def _render_aerodynamic_coefficients_pg(self, results, plot_parameters):
         # Plot AoA, L/D, CL, and CD.
         U = self._units()
-        self._render_time_series_group(results, plot_parameters, [
-            ("Aerodynamic Coefficients: AoA", "AoA (deg)", lambda s: s.conditions.aerodynamics.angles.alpha[:, 0] / U.deg, True),
-            ("Aerodynamic Coefficients: L/D", "L/D", lambda s: s.conditions.aerodynamics.coefficients.lift.total[:, 0] / np.clip(s.conditions.aerodynamics.coefficients.drag.total[:, 0], 1e-9, None), False),
-            ("Aerodynamic Coefficients: CL", "CL", lambda s: s.conditions.aerodynamics.coefficients.lift.total[:, 0], False),
-            ("Aerodynamic Coefficients: CD", "CD", lambda s: s.conditions.aerodynamics.coefficients.drag.total[:, 0], False),
+        self._render_time_series_group(plot_parameters.results_table, plot_parameters, [
+            ("Aerodynamic Coefficients: AoA", "AoA (deg)", lambda t: t["alpha"] / U.deg, True),
+            ("Aerodynamic Coefficients: L/D", "L/D", lambda t: t["CL"] / np.clip(t["CD"], 1e-9, None), False),
+            ("Aerodynamic Coefficients: CL", "CL", lambda t: t["CL"], False),
+            ("Aerodynamic Coefficients: CD", "CD", lambda t: t["CD"], False),
         ])
 
     def _render_aerodynamic_forces_pg(self, results, plot_parameters):
         # Plot aerodynamic power, thrust, lift, and drag.
-        self._render_time_series_group(results, plot_parameters, [
-            ("Aerodynamic Forces: Power", "Power (MW)", lambda s: s.conditions.energy.power[:, 0] / 1e6, True),
-            ("Aerodynamic Forces: Thrust", "Thrust (kN)", lambda s: s.conditions.frames.body.thrust_force_vector[:, 0] / 1000.0, False),
-            ("Aerodynamic Forces: Lift", "Lift (kN)", lambda s: -s.conditions.frames.wind.force_vector[:, 2] / 1000.0, False),
-            ("Aerodynamic Forces: Drag", "Drag (kN)", lambda s: -s.conditions.frames.wind.force_vector[:, 0] / 1000.0, False),
+        self._render_time_series_group(plot_parameters.results_table, plot_parameters, [
+            ("Aerodynamic Forces: Power", "Power (MW)", lambda t: t["power"] / 1e6, True),
+            ("Aerodynamic Forces: Thrust", "Thrust (kN)", lambda t: t["thrust"] / 1000.0, False),
+            ("Aerodynamic Forces: Lift", "Lift (kN)", lambda t: -t["wind_force_z"] / 1000.0, False),
+            ("Aerodynamic Forces: Drag", "Drag (kN)", lambda t: -t["wind_force_x"] / 1000.0, False),
         ])
 
     def _render_drag_components_pg(self, results, plot_parameters):
         # Plot drag breakdown components.
-        U = self._units()
+        table = plot_parameters.results_table
+        table["CD"]
         widget = self._new_plot_widget("Drag Components", "Drag Coefficient", show_legend=True)
-        for i, segment in enumerate(results.segments):
-            time = segment.conditions.frames.inertial.time[:, 0] / U.min
-            drag = segment.conditions.aerodynamics.coefficients.drag
-            cd_total = np.asarray(drag.total[:, 0]).reshape(-1)
-            pen, brush, symbol = self._segment_style(i, plot_parameters)
-            for name, chain in self._DRAG_COMPONENTS:
-                value = drag
-                try:
-                    for key in chain:
-                        value = getattr(value, key)
-                    arr_np = np.asarray(value)
-                    arr = arr_np[:, 0].reshape(-1) if arr_np.ndim > 1 else arr_np.reshape(-1)
-                except Exception:
-                    # Missing drag component: plot zeros for that component.
-                    arr = np.zeros_like(cd_total)
+        # Missing drag components are plotted as zeros.
+        components = [
+            (name, table.column(("aerodynamics", "coefficients", "drag") + chain, 0, fill=0.0))
+            for name, chain in self._DRAG_COMPONENTS
+        ]
+        for i, rows, pen, brush, symbol, tag in self._iter_segments_with_style(table, plot_parameters):
+            for name, column in components:
                 label = name if i == 0 else None
-                widget.plot(time, arr, pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=label)
+                self._plot_curve(widget, table.time_minutes[rows], column[rows], pen, symbol, brush, plot_parameters,
+                                 name=label, source=(table.time_minutes, column, rows.start, rows.stop))
 
     def _render_lift_distribution_pg(self, results, plot_parameters):
         # Plot final spanwise lift distribution for each segment.
+        # Not a time series: one spanwise row per segment, read directly from the segments.
         if not self._has_attr_chain(
             results.segments[0].conditions,
             ["aerodynamics", "coefficients", "lift", "inviscid", "spanwise"]
@@ -618,146 +1161,409 @@ class SolveWidget(TabWidget):
             raise RuntimeError("no spanwise lift data")
         widget = self._new_plot_widget("Lift Distribution", "Spanwise Lift Coefficient", "Span Index", show_legend=True)
         for i, segment in enumerate(results.segments):
-            spanwise = np.asarray(segment.conditions.aerodynamics.coefficients.lift.inviscid.spanwise)
-            y = np.asarray(spanwise[-1]).reshape(-1)
+            spanwise = segment.conditions.aerodynamics.coefficients.lift.inviscid.spanwise
+            y = np.asarray(np.asarray(spanwise)[-1]).reshape(-1)
             x = np.arange(y.size)
             pen, brush, symbol = self._segment_style(i, plot_parameters)
             tag = segment.tag.replace("_", " ")
-            widget.plot(x, y, pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=tag)
+            self._plot_curve(widget, x, y, pen, symbol, brush, plot_parameters, name=tag, source=(spanwise,))
 
     def _render_rotor_conditions_pg(self, results, plot_parameters):
-        # Plot rotor disc loading and power loading.
-        U = self._units()
+        # Plot rotor disc loading and power loading of the first converter.
+        table = plot_parameters.results_table
         seg0 = results.segments[0]
         if not self._has_attr_chain(seg0.conditions, ["energy", "converters"]):
             # This plot needs converter data; skip when not available.
             raise RuntimeError("no rotor converter data")
-        dl = self._new_plot_widget("Rotor Conditions: Disc Loading", "Disc Loading", show_legend=True)
-        pl = self._new_plot_widget("Rotor Conditions: Power Loading", "Power Loading", show_legend=False)
-        for i, segment in enumerate(results.segments):
-            converters = segment.conditions.energy.converters
-            if hasattr(converters, "keys"):
-                tag = next(iter(converters.keys()))
-                conv = converters[tag]
-            else:
-                tags = [name for name in dir(converters) if not name.startswith("_")]
-                tag = tags[0]
-                conv = getattr(converters, tag)
-            if not hasattr(conv, "disc_loading") or not hasattr(conv, "power_loading"):
-                # Skip when converter metrics are incomplete.
-                raise RuntimeError("no disc/power loading data")
-            time = segment.conditions.frames.inertial.time[:, 0] / U.min
-            pen, brush, symbol = self._segment_style(i, plot_parameters)
-            name = segment.tag.replace("_", " ")
-            dl.plot(time, np.asarray(conv.disc_loading[:, 0]).reshape(-1), pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=name)
-            pl.plot(time, np.asarray(conv.power_loading[:, 0]).reshape(-1), pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=name)
+        converters = seg0.conditions.energy.converters
+        if hasattr(converters, "keys"):
+            tag = next(iter(converters.keys()))
+        else:
+            tag = [name for name in dir(converters) if not name.startswith("_")][0]
+        self._render_time_series_group(table, plot_parameters, [
+            ("Rotor Conditions: Disc Loading", "Disc Loading", lambda t: t.column(("energy", "converters", tag, "disc_loading")), True),
+            ("Rotor Conditions: Power Loading", "Power Loading", lambda t: t.column(("energy", "converters", tag, "power_loading")), False),
+        ])
 
     def _render_altitude_sfc_weight_pg(self, results, plot_parameters):
         # Plot weight, fuel burn, SFC, and fuel flow.
         U = self._units()
-        seg0 = results.segments[0]
-        if not self._has_attr_chain(seg0.conditions, ["weights", "total_mass"]):
-            # Skip when weight history is missing.
-            raise RuntimeError("no total_mass data")
-        if not self._has_attr_chain(seg0.conditions, ["weights", "vehicle_mass_rate"]):
-            # Skip when mass-rate (fuel flow) is missing.
-            raise RuntimeError("no vehicle_mass_rate data")
-        if not self._has_attr_chain(seg0.conditions, ["energy", "cumulative_fuel_consumption"]):
-            # Skip when cumulative fuel-burn data is missing.
-            raise RuntimeError("no cumulative_fuel_consumption data")
-        self._render_time_series_group(results, plot_parameters, [
-            ("Weight", "Weight (lbf)", lambda s: (s.conditions.weights.total_mass[:, 0] * 9.81) / U.lbf, True),
-            ("Fuel Burn", "Fuel Burn (lb)", lambda s: s.conditions.energy.cumulative_fuel_consumption[:, 0] / U.lb, False),
-            ("SFC", "SFC", lambda s: ((s.conditions.weights.vehicle_mass_rate[:, 0] / U.lb) / np.clip(np.abs(s.conditions.frames.body.thrust_force_vector[:, 0]) / U.lbf, 1e-9, None)), False),
-            ("Fuel Flow", "mdot (lb/s)", lambda s: s.conditions.weights.vehicle_mass_rate[:, 0] / U.lb, False),
+        table = plot_parameters.results_table
+        # Fail before creating any plot when a required history is missing.
+        for name in ("total_mass", "vehicle_mass_rate", "cumulative_fuel_consumption"):
+            table[name]
+        self._render_time_series_group(table, plot_parameters, [
+            ("Weight", "Weight (lbf)", lambda t: (t["total_mass"] * 9.81) / U.lbf, True),
+            ("Fuel Burn", "Fuel Burn (lb)", lambda t: t["cumulative_fuel_consumption"] / U.lb, False),
+            ("SFC", "SFC", lambda t: ((t["vehicle_mass_rate"] / U.lb) / np.clip(np.abs(t["thrust"]) / U.lbf, 1e-9, None)), False),
+            ("Fuel Flow", "mdot (lb/s)", lambda t: t["vehicle_mass_rate"] / U.lb, False),
         ])
 
     def _render_propulsor_throttles_pg(self, results, plot_parameters):
         # Plot throttle traces for each propulsor.
-        U = self._units()
+        table = plot_parameters.results_table
+        throttles = table.propulsor_throttles()
         widget = self._new_plot_widget("Propulsor Throttles", "Throttle", show_legend=True)
-        for i, segment in enumerate(results.segments):
-            time = segment.conditions.frames.inertial.time[:, 0] / U.min
-            pen, brush, symbol = self._segment_style(i, plot_parameters)
-            for prop_tag, prop_data in segment.conditions.energy.propulsors.items():
-                y = np.asarray(prop_data.throttle[:, 0]).reshape(-1)
-                label = f"{segment.tag.replace('_', ' ')}: {prop_tag}"
-                widget.plot(time, y, pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=label)
+        for i, rows, pen, brush, symbol, tag in self._iter_segments_with_style(table, plot_parameters):
+            for prop_tag, throttle in throttles:
+                y = throttle[rows]
+                # Propulsors absent from this segment are NaN-filled.
+                if np.isnan(y).all():
+                    continue
+                self._plot_curve(widget, table.time_minutes[rows], y, pen, symbol, brush, plot_parameters,
+                                 name=f"{tag}: {prop_tag}", source=(table.time_minutes, throttle, rows.start, rows.stop))
 
     def _render_flight_conditions_pg(self, results, plot_parameters):
         # Plot altitude, airspeed, and range.
         U = self._units()
-        self._render_time_series_group(results, plot_parameters, [
-            ("Flight Conditions: Altitude", "Altitude (ft)", lambda s: s.conditions.freestream.altitude[:, 0] / U.feet, True),
-            ("Flight Conditions: Airspeed", "Airspeed (mph)", lambda s: s.conditions.freestream.velocity[:, 0] / U["mph"], False),
-            ("Flight Conditions: Range", "Range (nmi)", lambda s: s.conditions.frames.inertial.aircraft_range[:, 0] / U.nmi, False),
+        self._render_time_series_group(plot_parameters.results_table, plot_parameters, [
+            ("Flight Conditions: Altitude", "Altitude (ft)", lambda t: t["altitude"] / U.feet, True),
+            ("Flight Conditions: Airspeed", "Airspeed (mph)", lambda t: t["velocity"] / U["mph"], False),
+            ("Flight Conditions: Range", "Range (nmi)", lambda t: t["range"] / U.nmi, False),
         ])
 
     def _render_flight_trajectory_pg(self, results, plot_parameters):
         # Plot trajectory as range-time, XY, and altitude-time.
         U = self._units()
+        table = plot_parameters.results_table
+        rng = table.derived("Flight Trajectory: Range vs Time", lambda t: t["range"] / U.nmi)
+        x = table["position_x"]
+        y = table["position_y"]
+        z = table.derived("Flight Trajectory: Altitude", lambda t: -t["position_z"])
         tr = self._new_plot_widget("Flight Trajectory: Range vs Time", "Range (nmi)", show_legend=True)
         xy = self._new_plot_widget("Flight Trajectory: Y vs X", "Y", "X", show_legend=False)
         alt = self._new_plot_widget("Flight Trajectory: Altitude", "Altitude (m)", show_legend=False)
-        for segment, time, pen, brush, symbol, tag in self._iter_segments_with_style(results, plot_parameters):
-            rng = segment.conditions.frames.inertial.aircraft_range[:, 0] / U.nmi
-            x = segment.conditions.frames.inertial.position_vector[:, 0]
-            y = segment.conditions.frames.inertial.position_vector[:, 1]
-            z = -segment.conditions.frames.inertial.position_vector[:, 2]
-            tr.plot(time, np.asarray(rng).reshape(-1), pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=tag)
-            xy.plot(np.asarray(x).reshape(-1), np.asarray(y).reshape(-1), pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=tag)
-            alt.plot(time, np.asarray(z).reshape(-1), pen=pen, symbol=symbol, symbolBrush=brush, symbolSize=plot_parameters.marker_size, name=tag)
+        self._plot_time_series(tr, table, plot_parameters, rng)
+        self._plot_time_series(alt, table, plot_parameters, z)
+        for i, rows, pen, brush, symbol, tag in self._iter_segments_with_style(table, plot_parameters):
+            self._plot_curve(xy, x[rows], y[rows], pen, symbol, brush, plot_parameters,
+                             name=tag, source=(x, y, rows.start, rows.stop))
 
     def _render_flight_forces_moments_pg(self, results, plot_parameters):
         # Plot wind-axis forces and moments.
-        self._render_time_series_group(results, plot_parameters, [
-            ("X Force", "X (N)", lambda s: s.conditions.frames.wind.total_force_vector[:, 0], True),
-            ("Y Force", "Y (N)", lambda s: s.conditions.frames.wind.total_force_vector[:, 1], False),
-            ("Z Force", "Z (N)", lambda s: s.conditions.frames.wind.total_force_vector[:, 2], False),
-            ("Roll Moment", "L", lambda s: s.conditions.frames.wind.total_moment_vector[:, 0], False),
-            ("Pitch Moment", "M", lambda s: s.conditions.frames.wind.total_moment_vector[:, 1], False),
-            ("Yaw Moment", "N", lambda s: s.conditions.frames.wind.total_moment_vector[:, 2], False),
+        self._render_time_series_group(plot_parameters.results_table, plot_parameters, [
+            ("X Force", "X (N)", lambda t: t["total_force_x"], True),
+            ("Y Force", "Y (N)", lambda t: t["total_force_y"], False),
+            ("Z Force", "Z (N)", lambda t: t["total_force_z"], False),
+            ("Roll Moment", "L", lambda t: t["total_moment_x"], False),
+            ("Pitch Moment", "M", lambda t: t["total_moment_y"], False),
+            ("Yaw Moment", "N", lambda t: t["total_moment_z"], False),
         ])
 
     def _render_longitudinal_stability_pg(self, results, plot_parameters):
         # Plot longitudinal stability metrics.
         U = self._units()
-        self._render_time_series_group(results, plot_parameters, [
-            ("Longitudinal: Cm", "Cm", lambda s: s.conditions.static_stability.coefficients.M[:, 0], True),
-            ("Longitudinal: Static Margin", "SM", lambda s: s.conditions.static_stability.static_margin[:, 0], False),
-            ("Longitudinal: Elevator", "delta_e (deg)", lambda s: s.conditions.control_surfaces.elevator.deflection[:, 0] / U.deg, False),
+        self._render_time_series_group(plot_parameters.results_table, plot_parameters, [
+            ("Longitudinal: Cm", "Cm", lambda t: t["Cm"], True),
+            ("Longitudinal: Static Margin", "SM", lambda t: t["static_margin"], False),
+            ("Longitudinal: Elevator", "delta_e (deg)", lambda t: t["elevator_deflection"] / U.deg, False),
         ])
 
     def _render_lateral_stability_pg(self, results, plot_parameters):
         # Plot lateral-directional stability metrics.
         U = self._units()
-        self._render_time_series_group(results, plot_parameters, [
-            ("Lateral: Bank Angle", "phi (deg)", lambda s: -s.conditions.aerodynamics.angles.phi[:, 0] / U.deg, True),
-            ("Lateral: Aileron", "delta_a (deg)", lambda s: s.conditions.control_surfaces.aileron.deflection[:, 0] / U.deg, False),
-            ("Lateral: Rudder", "delta_r (deg)", lambda s: s.conditions.control_surfaces.rudder.deflection[:, 0] / U.deg, False),
+        self._render_time_series_group(plot_parameters.results_table, plot_parameters, [
+            ("Lateral: Bank Angle", "phi (deg)", lambda t: -t["phi"] / U.deg, True),
+            ("Lateral: Aileron", "delta_a (deg)", lambda t: t["aileron_deflection"] / U.deg, False),
+            ("Lateral: Rudder", "delta_r (deg)", lambda t: t["rudder_deflection"] / U.deg, False),
+        ])
+
+    def _iter_segment_runs_with_style(self, table, plot_parameters):
+        # Yield rows and style of each run of consecutive segments drawn in the same color.
+        start = 0
+        for i in range(1, len(table) + 1):
+            if i < len(table) and np.array_equal(plot_parameters.line_colors[i], plot_parameters.line_colors[start]):
+                continue
+            pen, brush, symbol = self._segment_style(start, plot_parameters)
+            yield slice(table.offsets[start], table.offsets[i]), pen, brush, symbol
+            start = i
+
+    def _render_component_group(self, table, plot_parameters, components, specs, x_label="Time (min)"):
+        # Create and fill a group of time-series plots with one curve per component (battery module, converter,
+        # ...) and run of same-colored segments, so a long mission does not need a curve per segment and module.
+        # ``components`` are (label, component); each spec's y_fn(table, component) computes a whole-mission
+        # column once per component. NaN rows (components missing from a segment) are not drawn.
+        runs = list(self._iter_segment_runs_with_style(table, plot_parameters))
+        for title, y_label, y_fn in specs:
+            columns = [
+                (label, table.derived((title, component), lambda t, c=component: y_fn(t, c)))
+                for label, component in components
+            ]
+            widget = self._new_plot_widget(title, y_label, x_label=x_label, show_legend=True)
+            for rows, pen, brush, symbol in runs:
+                for label, y in columns:
+                    if np.isnan(y[rows]).all():
+                        continue
+                    self._plot_curve(widget, table.time_minutes[rows], y[rows], pen, symbol, brush, plot_parameters,
+                                     name=label, source=(table.time_minutes, y, rows.start, rows.stop))
+
+    def _vehicle_bus(self, results, bus_tag):
+        # Electrical bus of the solved vehicle, or None when the results carry no vehicle (e.g. run history).
+        try:
+            for network in results.segments[0].analyses.vehicle.networks:
+                for bus in network.busses:
+                    if bus.tag == bus_tag:
+                        return bus
+        except (AttributeError, IndexError, KeyError):
+            pass
+        return None
+
+    def _battery_modules(self, results, table):
+        # (module tag, (bus tag, module tag)) of the battery modules in the results; identical modules once.
+        modules = []
+        for bus_tag in table.component_tags(("energy", "busses")):
+            tags = table.component_tags(("energy", "busses", bus_tag, "battery_modules"))
+            bus = self._vehicle_bus(results, bus_tag)
+            if tags and bus is not None and bus.identical_battery_modules:
+                tags = tags[:1]
+            modules.extend((tag, (bus_tag, tag)) for tag in tags)
+        if not modules:
+            raise RuntimeError("no battery module data")
+        return modules
+
+    def _module_column(self, table, module, *names, fill=None):
+        # Whole-mission column of a battery module quantity; ``module`` is (bus tag, module tag).
+        bus_tag, module_tag = module
+        return table.column(("energy", "busses", bus_tag, "battery_modules", module_tag) + names, 0, fill=fill)
+
+    def _render_battery_pack_conditions_pg(self, results, plot_parameters):
+        # Plot pack SOC, energy, current, power, voltage and temperature of every battery bus.
+        U = self._units()
+        table = plot_parameters.results_table
+        packs = []
+        for bus_tag in table.component_tags(("energy", "busses")):
+            tags = table.component_tags(("energy", "busses", bus_tag, "battery_modules"))
+            if not tags:
+                continue
+            bus = self._vehicle_bus(results, bus_tag)
+            if bus is None:
+                # Series or parallel module wiring is only known from the vehicle.
+                raise RuntimeError("no battery bus configuration")
+            series = bus.battery_module_electric_configuration == "Series"
+            packs.append((bus_tag, ((bus_tag, tags[0]), len(tags), series)))
+        if not packs:
+            raise RuntimeError("no battery module data")
+
+        def module(t, pack, *names):
+            return self._module_column(t, pack[0], *names)
+
+        self._render_component_group(table, plot_parameters, packs, [
+            ("Battery Pack: SOC", "SOC", lambda t, p: module(t, p, "cell", "state_of_charge")),
+            ("Battery Pack: Energy", "Energy (kW-hr)", lambda t, p: module(t, p, "energy") * p[1] / 1000 / U.Wh),
+            ("Battery Pack: Current", "Current (kA)",
+             lambda t, p: module(t, p, "current") * (1 if p[2] else p[1]) / 1000),
+            ("Battery Pack: Power", "Power (kW)", lambda t, p: module(t, p, "power") * p[1] / 1000),
+            ("Battery Pack: Voltage", "Voltage (kV)",
+             lambda t, p: module(t, p, "voltage_under_load") * (p[1] if p[2] else 1) / 1000),
+            ("Battery Pack: Temperature", "Temperature (K)", lambda t, p: module(t, p, "temperature")),
+        ])
+
+    def _render_battery_module_conditions_pg(self, results, plot_parameters):
+        # Plot SOC, energy, current, power, voltage and temperature of every battery module.
+        U = self._units()
+        table = plot_parameters.results_table
+        column = self._module_column
+        self._render_component_group(table, plot_parameters, self._battery_modules(results, table), [
+            ("Battery Module: SOC", "SOC", lambda t, m: column(t, m, "cell", "state_of_charge")),
+            ("Battery Module: Energy", "Energy (W-hr)", lambda t, m: column(t, m, "energy") / U.Wh),
+            ("Battery Module: Current", "Current (A)", lambda t, m: column(t, m, "current")),
+            ("Battery Module: Power", "Power (W)", lambda t, m: column(t, m, "power")),
+            ("Battery Module: Voltage", "Voltage (V)", lambda t, m: column(t, m, "voltage_under_load")),
+            ("Battery Module: Temperature", "Temperature (K)", lambda t, m: column(t, m, "temperature")),
+        ])
+
+    def _render_battery_cell_conditions_pg(self, results, plot_parameters):
+        # Plot cell SOC, energy, current, power, voltages and temperature of every battery module.
+        U = self._units()
+        table = plot_parameters.results_table
+        column = self._module_column
+        self._render_component_group(table, plot_parameters, self._battery_modules(results, table), [
+            ("Battery Cell: SOC", "SOC", lambda t, m: column(t, m, "cell", "state_of_charge")),
+            ("Battery Cell: Energy", "Energy (W-hr)", lambda t, m: column(t, m, "cell", "energy") / U.Wh),
+            ("Battery Cell: Current", "Current (A)", lambda t, m: column(t, m, "cell", "current")),
+            ("Battery Cell: Power", "Power (W)", lambda t, m: column(t, m, "cell", "power")),
+            ("Battery Cell: Voltage Under Load", "Voltage (V)", lambda t, m: column(t, m, "cell", "voltage_under_load")),
+            ("Battery Cell: Open Circuit Voltage", "Voltage (V)",
+             lambda t, m: column(t, m, "cell", "voltage_open_circuit")),
+            ("Battery Cell: Temperature", "Temperature (K)", lambda t, m: column(t, m, "cell", "temperature")),
+        ])
+
+    def _render_battery_c_rates_pg(self, results, plot_parameters):
+        # Plot instantaneous and nominal C-rates of every battery module.
+        U = self._units()
+        table = plot_parameters.results_table
+
+        def c_rates(t, m):
+            current = self._module_column(t, m, "current")
+            with np.errstate(divide="ignore", invalid="ignore"):
+                amp_hours = (self._module_column(t, m, "energy") / U.Wh) / self._module_column(t, m, "voltage_under_load")
+                # Nominal capacity: the largest capacity within each segment.
+                nominal = np.repeat(np.maximum.reduceat(amp_hours, t.offsets[:-1]), np.diff(t.offsets))
+                return current / amp_hours, current / nominal
+
+        self._render_component_group(table, plot_parameters, self._battery_modules(results, table), [
+            ("Battery C-Rates: Instantaneous", "Inst. C-Rate (C)",
+             lambda t, m: t.derived(("Battery C-Rates", m), lambda t: c_rates(t, m))[0]),
+            ("Battery C-Rates: Nominal", "Nom. C-Rate (C)",
+             lambda t, m: t.derived(("Battery C-Rates", m), lambda t: c_rates(t, m))[1]),
+        ])
+
+    def _render_battery_temperature_pg(self, results, plot_parameters):
+        # Plot cell temperature, charge throughput and bus heat generation of every battery module.
+        table = plot_parameters.results_table
+        column = self._module_column
+        self._render_component_group(table, plot_parameters, self._battery_modules(results, table), [
+            ("Battery Temperature: Cell", "Temperature (K)", lambda t, m: column(t, m, "cell", "temperature")),
+            ("Battery Temperature: Charge Throughput", "Charge Throughput (Ah)",
+             lambda t, m: column(t, m, "cell", "charge_throughput")),
+            ("Battery Temperature: Heat Generation", "Q heat (kW)",
+             lambda t, m: t.column(("energy", "busses", m[0], "heat_energy_generated")) / 1000),
+        ])
+
+    def _render_battery_degradation_pg(self, results, plot_parameters):
+        # Plot capacity fade and resistance growth of every battery module against charge throughput and time.
+        # Not a time series: one point per segment.
+        U = self._units()
+        table = plot_parameters.results_table
+        pen, brush, symbol = self._segment_style(0, plot_parameters)
+        modules = self._battery_modules(results, table)
+        series = []
+        for label, (bus_tag, module_tag) in modules:
+            chain = ("energy", "busses", bus_tag, "battery_modules", module_tag, "cell")
+            throughput = table.segment_ends(table.column(chain + ("charge_throughput",)))
+            hours = table.segment_ends(table["time"]) / U.hour
+            days = table.segment_values(chain + ("cycle_in_day",))
+            fade = table.segment_values(chain + ("capacity_fade_factor",))
+            growth = table.segment_values(chain + ("resistance_growth_factor",))
+            series.append((label, throughput, hours, days, fade, growth))
+
+        for title, y_label, x_label, x_index, y_index in (
+            ("Battery Degradation: Capacity vs Throughput", "E/E0", "Charge Throughput (Ah)", 1, 4),
+            ("Battery Degradation: Capacity vs Time", "E/E0", "Time (hrs)", 2, 4),
+            ("Battery Degradation: Capacity vs Days", "E/E0", "Time (days)", 3, 4),
+            ("Battery Degradation: Resistance vs Throughput", "R/R0", "Charge Throughput (Ah)", 1, 5),
+            ("Battery Degradation: Resistance vs Time", "R/R0", "Time (hrs)", 2, 5),
+            ("Battery Degradation: Resistance vs Days", "R/R0", "Time (days)", 3, 5),
+        ):
+            widget = self._new_plot_widget(title, y_label, x_label, show_legend=True)
+            for values in series:
+                self._plot_curve(widget, values[x_index], values[y_index], pen, symbol, brush, plot_parameters,
+                                 name=values[0], source=(values[x_index], values[y_index]))
+
+    def _render_battery_ragone_pg(self, results, plot_parameters):
+        # Plot the Ragone curve of every battery module cell of the solved vehicle.
+        U = self._units()
+        table = plot_parameters.results_table
+        pen, brush, symbol = self._segment_style(0, plot_parameters)
+        curves = []
+        for label, (bus_tag, module_tag) in self._battery_modules(results, table):
+            bus = self._vehicle_bus(results, bus_tag)
+            if bus is None:
+                # Ragone constants are cell properties; only the solved vehicle has them.
+                raise RuntimeError("no battery cell data")
+
+            def ragone(t, ragone=bus.battery_modules[module_tag].cell.ragone):
+                specific_energy = np.linspace(ragone.lower_bound, ragone.upper_bound, 50)
+                specific_power = ragone.const_1 * 10 ** (specific_energy * ragone.const_2)
+                return specific_energy / (U.Wh / U.kg), specific_power / (U.kW / U.kg)
+
+            curves.append((label, table.derived(("Battery Ragone Diagram", bus_tag, module_tag), ragone)))
+
+        widget = self._new_plot_widget("Battery Ragone Diagram", "Specific Power (kW/kg)",
+                                       "Specific Energy (W-h/kg)", show_legend=True)
+        for label, (x, y) in curves:
+            self._plot_curve(widget, x, y, pen, symbol, brush, plot_parameters, name=label, source=(x, y))
+
+    def _render_propulsor_efficiencies_pg(self, results, plot_parameters):
+        # Plot the efficiency of every energy converter (rotors, ducted fans, motors) that reports one.
+        table = plot_parameters.results_table
+        converters = [
+            (tag, tag) for tag in table.component_tags(("energy", "converters"))
+            if not np.isnan(table.column(("energy", "converters", tag, "efficiency"), 0, fill=np.nan)).all()
+        ]
+        if not converters:
+            raise RuntimeError("no converter efficiency data")
+        self._render_component_group(table, plot_parameters, converters, [
+            ("Electric Propulsor Efficiencies", "Efficiency",
+             lambda t, tag: t.column(("energy", "converters", tag, "efficiency"), 0, fill=np.nan)),
+        ])
+
+    def _coolant_components(self, table, kind):
+        # (component tag, (coolant line tag, component tag)) of the coolant line components of one kind.
+        marker = self._COOLANT_COMPONENTS[kind][1]
+        components = []
+        for line_tag in table.component_tags(("energy", "coolant_lines")):
+            for tag in table.component_tags(("energy", "coolant_lines", line_tag)):
+                column = table.column(("energy", "coolant_lines", line_tag, tag, marker), 0, fill=np.nan)
+                if not np.isnan(column).all():
+                    components.append((tag, (line_tag, tag)))
+        return components
+
+    def _render_coolant_kind(self, results, plot_parameters, kind):
+        # Plot the conditions of every coolant line component of one kind.
+        table = plot_parameters.results_table
+        components = self._coolant_components(table, kind)
+        name, _, plots = self._COOLANT_COMPONENTS[kind]
+        if not components:
+            raise RuntimeError(f"no {name.lower()} data")
+        self._render_component_group(table, plot_parameters, components, [
+            (f"{name}: {title}", y_label,
+             lambda t, c, field=field, scale=scale: t.column(("energy", "coolant_lines") + c + (field,), 0,
+                                                             fill=np.nan) * scale)
+            for title, y_label, field, scale in plots
+        ])
+
+    def _render_wavy_channel_pg(self, results, plot_parameters):
+        self._render_coolant_kind(results, plot_parameters, "wavy_channel")
+
+    def _render_cross_flow_hex_pg(self, results, plot_parameters):
+        self._render_coolant_kind(results, plot_parameters, "cross_flow_hex")
+
+    def _render_reservoir_pg(self, results, plot_parameters):
+        self._render_coolant_kind(results, plot_parameters, "reservoir")
+
+    def _render_air_cooled_pg(self, results, plot_parameters):
+        self._render_coolant_kind(results, plot_parameters, "air_cooled")
+
+    def _render_emissions_pg(self, results, plot_parameters):
+        # Plot cumulative CO2-equivalent emissions and the emission index of each species.
+        table = plot_parameters.results_table
+
+        def cumulative_emissions(t):
+            # Species masses restart every segment; carry the mission total over segment boundaries.
+            total = sum(t.column(("emissions", "mass", species)) for species in ("CO2", "CO", "NOx", "H2O")) / 1e3
+            carried = np.concatenate(([0.0], np.cumsum(t.segment_ends(total))[:-1]))
+            return total + np.repeat(carried, np.diff(t.offsets))
+
+        self._render_time_series_group(table, plot_parameters, [
+            ("Emissions: CO2e", "CO2e Emissions (Metric Tons)", cumulative_emissions, True),
+        ])
+        self._render_component_group(table, plot_parameters, [(s, s) for s in self._EMISSION_SPECIES], [
+            ("Emissions: Emission Index", "Emission Index",
+             lambda t, species: t.column(("emissions", "index", species), 0, fill=np.nan)),
         ])
 
     def _remove_empty_dynamic_plots(self, start_index=0):
-        # Remove new dynamic plots that ended up with no curves.
+        # Release new dynamic plots that received no curves in this render.
         kept = []
-        removed = []
         for idx, widget in enumerate(self._dynamic_plot_widgets):
-            # Keep old plots and any plot that has data items.
-            if idx < start_index or widget.listDataItems():
+            # Keep old plots and any plot that was filled.
+            if idx < start_index or self._curve_count(widget):
                 kept.append(widget)
             else:
-                removed.append(widget)
+                self._release_slot(widget)
         self._dynamic_plot_widgets = kept
-        self._delete_plot_widgets(removed)
 
-    def _build_plot_parameters(self, results):
-        from RCAIDE.Framework.Core import Data
-        # Build shared style settings passed into plot functions.
-        plot_parameters = Data()
+    def _build_plot_parameters(self, results, line_colors=None):
+        from RCAIDE.Framework.Core import Data
+        # Build shared style settings passed into plot functions.
+        plot_parameters = Data()
         plot_parameters.line_width = 5
         plot_parameters.line_style = '-'
-        # Keep mission lines white.
-        plot_parameters.line_colors = np.tile(np.array([1.0, 1.0, 1.0, 1.0]), (len(results.segments), 1))
+        # Keep mission lines white unless each segment has its own color (run overlays).
+        if line_colors is None:
+            line_colors = np.tile(np.array([1.0, 1.0, 1.0, 1.0]), (len(results.segments), 1))
+        plot_parameters.line_colors = line_colors
         plot_parameters.marker_size = 8
         plot_parameters.legend_font_size = 12
         plot_parameters.axis_font_size = 14
@@ -785,6 +1591,23 @@ class SolveWidget(TabWidget):
             "Plot Fuel Consumption",
             "Plot Altitude SFC Weight",
             "Plot Propulsor Throttles",
+            "Plot Battery Pack Conditions",
+            "Plot Battery Module Conditions",
+            "Plot Battery Cell Conditions",
+            "Plot Battery C-Rates",
+            "Plot Battery Temperature",
+            "Plot Battery Degradation",
+            "Plot Battery Ragone Diagram",
+            "Plot Electric Propulsor Efficiencies",
+        ],
+        "Thermal Management": [
+            "Plot Wavy Channel Conditions",
+            "Plot Cross Flow Heat Exchanger Conditions",
+            "Plot Reservoir Conditions",
+            "Plot Air Cooled Conditions",
+        ],
+        "Emissions": [
+            "Plot Emissions",
         ],
         "Mission": [
             "Plot Aircraft Velocities",
@@ -964,12 +1787,7 @@ def _apply_solve_graph_skin(self):
     This includes background color, grid lines, axis colors, and frame styling.
     """
 
-    for attr_name in dir(self):
-        widget = getattr(self, attr_name)
-
-        # Only affect graph containers (not plot logic or data)
-        if not isinstance(widget, pg.PlotWidget):
-            continue
+    for widget in self.plot_registry.widgets():
 
         # Dark graph canvas
         widget.setBackground("#0e141b")
@@ -1084,6 +1902,12 @@ def init_plot_settings_panel(self):
     self.legend_check.setChecked(True)
     layout.addWidget(self.legend_check)
 
+    # Dense plots: downsample, clip to the view and drop markers until zoomed in
+    layout.addWidget(header("Level of Detail"))
+    self.lod_check = QCheckBox("Simplify Dense Plots")
+    self.lod_check.setChecked(True)
+    layout.addWidget(self.lod_check)
+
     # Export section
     layout.addWidget(header("Export"))
 
@@ -1091,6 +1915,16 @@ def init_plot_settings_panel(self):
     self.save_plot_button = QPushButton("Save Plots")
     self.save_plot_button.clicked.connect(self.save_current_plot)
     layout.addWidget(self.save_plot_button)
+
+    # Report of every plot, rendered in the background as image and/or vector files
+    self.report_format_combo = QComboBox()
+    self.report_format_combo.addItems(["PNG", "SVG", "PDF", "PNG + SVG + PDF"])
+    layout.addWidget(self.report_format_combo)
+    self.export_report_button = QPushButton("Export Report")
+    self.export_report_button.clicked.connect(self.export_plot_report)
+    layout.addWidget(self.export_report_button)
+    self._export_thread = None
+    self._export_worker = None
 
     # Push everything up and keep the panel compact
     layout.addStretch()
@@ -1114,6 +1948,7 @@ def init_plot_settings_panel(self):
     self.autoscale_check.stateChanged.connect(self.apply_plot_settings)
     self.grid_check.stateChanged.connect(self.apply_plot_settings)
     self.legend_check.stateChanged.connect(self.apply_plot_settings)
+    self.lod_check.stateChanged.connect(self.apply_plot_settings)
 
     # Open color picker dialogs for line and grid colors
     self.line_color_button.clicked.connect(self.select_line_color)
@@ -1148,114 +1983,122 @@ def select_grid_color(self):
 # --------------------------------------------------------------------------------------------------
 #  Apply Plot Settings
 # --------------------------------------------------------------------------------------------------
-def apply_plot_settings(self):
-
-    # Collect all plot widgets (base + dynamic + fallback attribute scan)
-    plots = []
-    if hasattr(self, "_base_plot_widgets"):
-        plots.extend([p for p in self._base_plot_widgets if isinstance(p, pg.PlotWidget)])
-    if hasattr(self, "_dynamic_plot_widgets"):
-        plots.extend([p for p in self._dynamic_plot_widgets if isinstance(p, pg.PlotWidget)])
-    plots.extend([
-        getattr(self, name) for name in dir(self)
-        if isinstance(getattr(self, name), pg.PlotWidget)
-    ])
-
-    # De-duplicate while preserving order.
-    seen = set()
-    unique_plots = []
-    for plot in plots:
-        pid = id(plot)
-        if pid in seen:
-            continue
-        seen.add(pid)
-        unique_plots.append(plot)
-
-    for plot in unique_plots:
-
-        # Show or hide grid lines based on the checkbox state
-        plot.showGrid(
-            x=self.grid_check.isChecked(),
-            y=self.grid_check.isChecked(),
-            alpha=0.3
-        )
-
-        # Update axis line color to match selected grid color
-        plot.getAxis("bottom").setPen(self.selected_grid_color)
-        plot.getAxis("left").setPen(self.selected_grid_color)
-
-        # Autoscale axes to fit the data when enabled
-        if self.autoscale_check.isChecked():
-            viewbox = plot.getPlotItem().getViewBox()
-            viewbox.enableAutoRange(x=True, y=True)
-            viewbox.autoRange()
-
-        # Update axis tick label font size
-        font = pg.QtGui.QFont()
-        font.setPointSizeF(self.axis_font_spin.value())
-        plot.getAxis("bottom").setTickFont(font)
-        plot.getAxis("left").setTickFont(font)
-
-        # Show or hide the legend
-        if self.legend_check.isChecked():
-            if not plot.plotItem.legend:
-                plot.addLegend()
-            if hasattr(self, "_position_plot_legend"):
-                self._position_plot_legend(plot)
-            plot.plotItem.legend.show()
-        else:
-            if plot.plotItem.legend:
-                plot.plotItem.legend.hide()
-
-        # Apply line and marker settings to each curve in the plot
-        for curve in plot.listDataItems():
-
-            # Get the existing pen for the curve
-            old_pen = curve.opts["pen"]
-
-            # Determine line style from dropdown selection
-            style = self.line_style_combo.currentText()
-            if style == "Dashed":
-                pen_style = Qt.PenStyle.DashLine
-            elif style == "Dotted":
-                pen_style = Qt.PenStyle.DotLine
+def apply_plot_settings(self):
+    # Apply the settings to every plot that is shown (base plots and attached dynamic plots).
+    apply_plot_settings_to(self, self.plot_registry.widgets())
+
+
+# pyqtgraph names of the marker styles offered in the settings panel.
+_MARKER_SYMBOLS = {
+    '^': 't1',
+    'v': 't',
+    '<': 't3',
+    '>': 't2',
+    # pyqtgraph uses "star" (not "*") for star markers.
+    '*': 'star',
+}
+_VALID_MARKER_SYMBOLS = {'o', 's', 't', 't1', 't2', 't3', 'd', '+', 'x', 'p', 'h', 'star', '|', '_'}
+
+
+def _selected_marker_symbol(self):
+    # pyqtgraph symbol of the marker setting, or None when markers are off.
+    if not self.marker_check.isChecked():
+        return None
+    selected = self.marker_style_combo.currentText()
+    marker_symbol = _MARKER_SYMBOLS.get(selected, selected)
+    return marker_symbol if marker_symbol in _VALID_MARKER_SYMBOLS else 'o'
+
+
+def apply_plot_settings_to(self, plots):
+    # Apply the current settings panel state to the given plot widgets only.
+    # Settings are read once and pens are shared per color; repaints are held until every plot is styled.
+
+    # Determine line style from dropdown selection
+    style = self.line_style_combo.currentText()
+    if style == "Dashed":
+        pen_style = Qt.PenStyle.DashLine
+    elif style == "Dotted":
+        pen_style = Qt.PenStyle.DotLine
+    else:
+        pen_style = Qt.PenStyle.SolidLine
+    line_width = self.line_width_spin.value()
+
+    # Sanitize marker symbol first so setPen can't fail on stale invalid symbols.
+    marker_symbol = _selected_marker_symbol(self)
+    marker_size = self.marker_size_spin.value()
+
+    font = pg.QtGui.QFont()
+    font.setPointSizeF(self.axis_font_spin.value())
+    show_grid = self.grid_check.isChecked()
+    lod_enabled = self.lod_check.isChecked() if hasattr(self, "lod_check") else True
+    # Overlaid runs keep their own colors.
+    keep_colors = getattr(self, "_overlay_active", False) or not self.selected_line_color
+
+    # New pens by RGBA of their color.
+    pens = {}
+
+    def pen_for(color):
+        key = pg.mkColor(color).rgba()
+        if key not in pens:
+            pens[key] = pg.mkPen(color=color, width=line_width, style=pen_style)
+        return pens[key]
+
+    updates_enabled = self.updatesEnabled()
+    self.setUpdatesEnabled(False)
+    try:
+        for plot in plots:
+
+            # Show or hide grid lines based on the checkbox state
+            plot.showGrid(x=show_grid, y=show_grid, alpha=0.3)
+
+            # Update axis line color to match selected grid color
+            plot.getAxis("bottom").setPen(self.selected_grid_color)
+            plot.getAxis("left").setPen(self.selected_grid_color)
+
+            # Autoscale axes to fit the data when enabled
+            if self.autoscale_check.isChecked():
+                viewbox = plot.getPlotItem().getViewBox()
+                viewbox.enableAutoRange(x=True, y=True)
+                viewbox.autoRange()
+
+            # Update axis tick label font size
+            plot.getAxis("bottom").setTickFont(font)
+            plot.getAxis("left").setTickFont(font)
+
+            # Show or hide the legend
+            if self.legend_check.isChecked():
+                if not plot.plotItem.legend:
+                    plot.addLegend()
+                if hasattr(self, "_position_plot_legend"):
+                    self._position_plot_legend(plot)
+                plot.plotItem.legend.show()
             else:
-                pen_style = Qt.PenStyle.SolidLine
-
-            # Use selected color if provided, otherwise keep existing color
-            color = self.selected_line_color or old_pen.color()
-
-            # Create a new pen with updated style and width
-            new_pen = pg.mkPen(
-                color=color,
-                width=self.line_width_spin.value(),
-                style=pen_style
-            )
-
-            # Sanitize marker symbol first so setPen can't fail on stale invalid symbols.
-            if self.marker_check.isChecked():
-                symbol_map = {
-                    '^': 't1',
-                    'v': 't',
-                    '<': 't3',
-                    '>': 't2',
-                    # pyqtgraph uses "star" (not "*") for star markers.
-                    '*': 'star',
-                }
-                valid_symbols = {'o', 's', 't', 't1', 't2', 't3', 'd', '+', 'x', 'p', 'h', 'star', '|', '_'}
-                selected = self.marker_style_combo.currentText()
-                marker_symbol = symbol_map.get(selected, selected)
-                if marker_symbol not in valid_symbols:
-                    marker_symbol = 'o'
-                curve.setSymbol(marker_symbol)
-                curve.setSymbolSize(self.marker_size_spin.value())
-                curve.setSymbolBrush(new_pen.color())
-                curve.setSymbolPen(new_pen)
-            else:
-                curve.setSymbol(None)
-
-            # Apply the new pen to the curve
-            curve.setPen(new_pen)
+                if plot.plotItem.legend:
+                    plot.plotItem.legend.hide()
+
+            # Apply line and marker settings to each curve in the plot
+            for curve in plot.listDataItems():
+                # Use selected color if provided, otherwise keep existing color
+                new_pen = pen_for(curve.opts["pen"].color() if keep_colors else self.selected_line_color)
+
+                if marker_symbol is not None:
+                    # Markers hidden by the level of detail are restored by set_level_of_detail below.
+                    if curve.opts["symbol"] != marker_symbol:
+                        curve.setSymbol(marker_symbol)
+                    if curve.opts["symbolSize"] != marker_size:
+                        curve.setSymbolSize(marker_size)
+                    curve.setSymbolBrush(new_pen.color())
+                    curve.setSymbolPen(new_pen)
+                elif curve.opts["symbol"] is not None:
+                    curve.setSymbol(None)
+
+                # Apply the new pen to the curve
+                curve.setPen(new_pen)
+
+            # Downsample dense plots and drop their markers until zoomed in
+            set_level_of_detail(plot, lod_enabled)
+    finally:
+        self.setUpdatesEnabled(updates_enabled)
 
 # --------------------------------------------------------------------------------------------------
 #  Save Visible Plot
@@ -1280,15 +2123,15 @@ def save_current_plot(self):
                 return True
         return False
 
-    # Collect visible plots in display order.
-    plots = []
-    if hasattr(self, "_base_plot_widgets"):
-        plots.extend([p for p in self._base_plot_widgets if isinstance(p, pg.PlotWidget)])
-    if hasattr(self, "_dynamic_plot_widgets"):
-        plots.extend([p for p in self._dynamic_plot_widgets if isinstance(p, pg.PlotWidget)])
-    plots = [p for p in plots if p.isVisible() and _plot_has_real_data(p)]
+    def _collect_plots():
+        # Visible plots in display order; plots scrolled out of view get a plot widget first.
+        self._materialize_all_plots()
+        return [p for p in self._materialized_plot_widgets() if p.isVisible() and _plot_has_real_data(p)]
+
+    plots = _collect_plots()
 
     if not plots:
+        self._schedule_viewport_update()
         QMessageBox.information(self, "Save Plots", "No visible plots with data to save.")
         return
 
@@ -1299,7 +2142,10 @@ def save_current_plot(self):
         os.getcwd(),
     )
     if not parent_dir:
+        self._schedule_viewport_update()
         return
+    # The dialog's event loop may have released plot widgets of off-screen plots again.
+    plots = _collect_plots()
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     export_dir = os.path.join(parent_dir, f"Mission Plots {timestamp}")
@@ -1385,8 +2231,118 @@ def save_current_plot(self):
             curve.setSymbolPen(old_symbol_pen)
             curve.setSymbolBrush(old_symbol_brush)
 
+    # Keep the step timings of the solve next to the plots it produced.
+    if getattr(self, "solve_profile", None):
+        write_profile(self.solve_profile, export_dir)
+
+    # Release the plot widgets of off-screen plots again.
+    self._schedule_viewport_update()
     QMessageBox.information(self, "Save Plots", f"Saved {len(plots)} plots to:\n{export_dir}")
 
+# --------------------------------------------------------------------------------------------------
+#  Export Plot Report
+# --------------------------------------------------------------------------------------------------
+def _plot_report_figures(self):
+    # Snapshot every shown plot with data, in display order, without attaching plot widgets to off-screen slots.
+    line_width = self.line_width_spin.value()
+    marker_symbol = _selected_marker_symbol(self)
+    line_color = None
+    if self.selected_line_color and not getattr(self, "_overlay_active", False):
+        line_color = pg.mkColor(self.selected_line_color).name()
+
+    figures = []
+    for plot in self._base_plot_widgets:
+        if plot.isHidden():
+            continue
+        plot_item = plot.getPlotItem()
+        y_label = plot_item.getAxis("left").labelText
+        curves = [
+            curve_snapshot(item.xData, item.yData, item.opts["pen"].color().name(), line_width,
+                           getattr(item, "_lod_symbol", item.opts["symbol"]), item.name())
+            for item in plot.listDataItems() if item.xData is not None
+        ]
+        # The base plots are untitled; their y label names them.
+        figures.append(figure_snapshot(plot_item.titleLabel.text or y_label, plot_item.getAxis("bottom").labelText,
+                                       y_label, curves))
+    for slot in self._dynamic_plot_widgets:
+        curves = [
+            curve_snapshot(curve.x, curve.y, line_color or curve.pen.color().name(), line_width, marker_symbol,
+                           curve.name)
+            for curve in slot.curves
+        ]
+        figures.append(figure_snapshot(slot.title, slot.x_label, slot.y_label, curves))
+
+    # Keep plots that actually contain finite data points.
+    return [
+        figure for figure in figures
+        if any(np.isfinite(curve["x"]).any() and np.isfinite(curve["y"]).any() for curve in figure["curves"])
+    ]
+
+
+def export_plot_report(self):
+    from PyQt6.QtWidgets import QFileDialog
+
+    if self._export_thread is not None:
+        return
+    figures = _plot_report_figures(self)
+    if not figures:
+        QMessageBox.information(self, "Export Report", "No visible plots with data to export.")
+        return
+
+    parent_dir = QFileDialog.getExistingDirectory(self, "Choose Folder for the Plot Report", os.getcwd())
+    if not parent_dir:
+        return
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    export_dir = os.path.join(parent_dir, f"Mission Report {timestamp}")
+    os.makedirs(export_dir, exist_ok=True)
+
+    # Keep the step timings of the solve next to the plots it produced.
+    if getattr(self, "solve_profile", None):
+        write_profile(self.solve_profile, export_dir)
+
+    selected = self.report_format_combo.currentText().lower()
+    formats = EXPORT_FORMATS if selected not in EXPORT_FORMATS else (selected,)
+
+    self.export_report_button.setEnabled(False)
+    self.export_report_button.setText(f"Exporting 0/{len(figures)}...")
+
+    # Render in worker processes from a thread so the plots stay usable meanwhile.
+    self._export_thread = QThread(self)
+    self._export_worker = _PlotExportWorker(figures, export_dir, formats)
+    self._export_worker.moveToThread(self._export_thread)
+    self._export_thread.started.connect(self._export_worker.run)
+    self._export_worker.figure_finished.connect(
+        lambda done, total: self.export_report_button.setText(f"Exporting {done}/{total}..."))
+    self._export_worker.finished.connect(self._on_plot_report_exported)
+    self._export_worker.failed.connect(self._on_plot_report_failed)
+    self._export_worker.finished.connect(self._export_thread.quit)
+    self._export_worker.failed.connect(self._export_thread.quit)
+    self._export_thread.finished.connect(self._cleanup_export_worker)
+    self._export_thread.start()
+
+
+def _on_plot_report_exported(self, entries, export_dir):
+    failed = [entry["title"] for entry in entries if entry["status"] != "finished"]
+    message = f"Exported {len(entries) - len(failed)} plots to:\n{export_dir}"
+    if failed:
+        message += "\n\nFailed: " + ", ".join(failed)
+    QMessageBox.information(self, "Export Report", message)
+
+
+def _on_plot_report_failed(self, error_message):
+    QMessageBox.critical(self, "Export Report", f"Report export failed:\n{error_message}")
+
+
+def _cleanup_export_worker(self):
+    self.export_report_button.setEnabled(True)
+    self.export_report_button.setText("Export Report")
+    if self._export_worker is not None:
+        self._export_worker.deleteLater()
+        self._export_worker = None
+    if self._export_thread is not None:
+        self._export_thread.deleteLater()
+        self._export_thread = None
+
 # --------------------------------------------------------------------------------------------------
 #  Plot Visibility Toggle (Tree)
 # --------------------------------------------------------------------------------------------------
@@ -1396,10 +2352,10 @@ def toggle_plot_visibility(self, item, column):
     if item.childCount() > 0:
         return
 
-    # Re-render selected plots based on current tree state (debounced).
+    # Show or hide the toggled plot group on the plotted results (debounced).
     import values
     results = getattr(values, "rcaide_results", None)
-    if results is not None and hasattr(self, "_schedule_plot_render"):
+    if (results is not None or getattr(self, "_rendered", None) is not None) and hasattr(self, "_schedule_plot_render"):
         self._schedule_plot_render()
 
 def init_plot_options_panel(self):
@@ -1478,7 +2434,12 @@ if not getattr(SolveWidget, "_LEADS_PATCHED", False):
 
     # Attach helper methods to SolveWidget 
     SolveWidget.apply_plot_settings      = apply_plot_settings
+    SolveWidget.apply_plot_settings_to   = apply_plot_settings_to
     SolveWidget.save_current_plot        = save_current_plot
+    SolveWidget.export_plot_report       = export_plot_report
+    SolveWidget._on_plot_report_exported = _on_plot_report_exported
+    SolveWidget._on_plot_report_failed   = _on_plot_report_failed
+    SolveWidget._cleanup_export_worker   = _cleanup_export_worker
     SolveWidget.toggle_plot_visibility   = toggle_plot_visibility
     SolveWidget.select_line_color        = select_line_color
     SolveWidget.select_grid_color        = select_grid_color
@@ -0,0 +1,147 @@
+# RCAIDE_GUI/tabs/solve/solve_cache.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import hashlib
+import json
+
+import numpy as np
+import RCAIDE
+
+from tabs.mission.widgets.mission_segment_builder import config_names
+from utilities import convert_name
+import values
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Fingerprints
+# ----------------------------------------------------------------------------------------------------------------------
+def _update_digest(hasher, obj, seen):
+    # Feed a stable representation of nested settings data into the hasher.
+    if isinstance(obj, (bool, int, float, str, type(None))):
+        hasher.update(repr(obj).encode())
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"{obj.dtype.str}{obj.shape}".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.generic):
+        hasher.update(repr(obj.item()).encode())
+    elif isinstance(obj, (dict, list, tuple)):
+        # Guard against reference cycles in RCAIDE data trees.
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        if isinstance(obj, dict):
+            for key in sorted(obj.keys(), key=str):
+                hasher.update(str(key).encode())
+                _update_digest(hasher, obj[key], seen)
+        else:
+            for item in obj:
+                _update_digest(hasher, item, seen)
+    else:
+        # Functions, surrogates and other objects only contribute their type.
+        hasher.update(type(obj).__qualname__.encode())
+
+
+def _json_digest(data):
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def analyses_digest(config_name):
+    """Digest of the type and settings of every analysis attached to a configuration."""
+    hasher = hashlib.sha1()
+    analyses = values.rcaide_analyses.get(convert_name(config_name)) if values.rcaide_analyses else None
+    if analyses is not None:
+        for tag, analysis in analyses.items():
+            hasher.update(str(tag).encode())
+            hasher.update(type(analysis).__qualname__.encode())
+            _update_digest(hasher, getattr(analysis, "settings", None), set())
+    return hasher.hexdigest()
+
+
+def segment_fingerprints(mission_data):
+    """Fingerprint each saved segment together with everything that determines its solution.
+
+    Each fingerprint covers the segment dictionary, its configuration (name, saved config entry and
+    analyses settings), the vehicle geometry, and the fingerprint of the previous segment, which stands
+    in for the initial state the segment inherits.
+    """
+    names = config_names()
+    configs_by_name = {c.get("config name"): c for c in values.config_data if isinstance(c, dict)}
+    geometry_digest = _json_digest(values.geometry_data)
+
+    fingerprints = []
+    previous = geometry_digest
+    for seg_data in mission_data:
+        config_index = seg_data.get("config", 0)
+        config_name = names[config_index] if 0 <= config_index < len(names) else ""
+
+        hasher = hashlib.sha1(previous.encode())
+        hasher.update(_json_digest(seg_data).encode())
+        hasher.update(config_name.encode())
+        hasher.update(_json_digest(configs_by_name.get(config_name)).encode())
+        hasher.update(analyses_digest(config_name).encode())
+
+        previous = hasher.hexdigest()
+        fingerprints.append(previous)
+    return fingerprints
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Segment result cache
+# ----------------------------------------------------------------------------------------------------------------------
+class SegmentResultCache:
+    """Keeps the last solved mission and its segment fingerprints so unchanged leading segments are reused."""
+
+    def __init__(self):
+        self.fingerprints = []
+        self.results = None
+
+    def clear(self):
+        self.fingerprints = []
+        self.results = None
+
+    def store(self, fingerprints, results):
+        self.fingerprints = list(fingerprints)
+        self.results = results
+
+    def first_changed_segment(self, fingerprints):
+        """Index of the first segment that has to be solved again (``len(fingerprints)`` if none)."""
+        if fingerprints is None or self.results is None:
+            return 0
+        count = 0
+        for old, new in zip(self.fingerprints, fingerprints):
+            if old != new:
+                break
+            count += 1
+        # Every reused segment must actually be present in the cached results.
+        return min(count, len(self.results.segments))
+
+    def mission_from(self, mission, start_index):
+        """Mission made of the segments from ``start_index`` on, seeded with the cached end state before it."""
+        if start_index == 0:
+            return mission
+
+        remaining = RCAIDE.Framework.Mission.Sequential_Segments()
+        remaining.tag = mission.tag
+        for segment in list(mission.segments.values())[start_index:]:
+            remaining.append_segment(segment)
+
+        # Sequential segments only chain states between their own segments, so seed the first one here.
+        first_segment = list(remaining.segments.values())[0]
+        first_segment.state.initials = list(self.results.segments.values())[start_index - 1].state
+        return remaining
+
+    def merge(self, start_index, solved):
+        """Full mission results: cached segments before ``start_index`` followed by the newly solved ones."""
+        if start_index == 0 and solved is not None:
+            return solved
+
+        merged = RCAIDE.Framework.Mission.Sequential_Segments()
+        merged.tag = solved.tag if solved is not None else self.results.tag
+        for segment in list(self.results.segments.values())[:start_index]:
+            merged.append_segment(segment)
+        if solved is not None:
+            for segment in solved.segments.values():
+                merged.append_segment(segment)
+        return merged
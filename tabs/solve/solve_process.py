@@ -0,0 +1,270 @@
+# RCAIDE_GUI/tabs/solve/solve_process.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import multiprocessing
+import pickle
+import threading
+import time
+import traceback
+
+import numpy as np
+
+from .solve_profiler import SolveProfiler
+from .warm_start import WarmStartUnknowns, count_residual_evaluation
+
+# Interval used by the parent to check on the child while waiting for a message.
+POLL_INTERVAL = 0.1
+# Time given to a terminated child to exit before it is killed outright.
+TERMINATE_TIMEOUT = 5.0
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Child process
+# ----------------------------------------------------------------------------------------------------------------------
+class _SegmentReporter:
+    """Process step that tells the parent when a segment starts or finishes."""
+
+    def __init__(self, connection, event, index, tag):
+        self.connection = connection
+        self.event = event
+        self.index = index
+        self.tag = tag
+        self.start_time = None
+
+    def __call__(self, segment):
+        self.start_time = time.monotonic()
+        self.connection.send((self.event, self.index, self.tag))
+
+
+class _SegmentFinishedReporter(_SegmentReporter):
+    """Process step that sends a converged segment's conditions, solve time and residual norm to the parent."""
+
+    def __init__(self, connection, index, tag, started):
+        super().__init__(connection, "segment_finished", index, tag)
+        self.started = started
+
+    def __call__(self, segment):
+        elapsed = None
+        if self.started.start_time is not None:
+            elapsed = time.monotonic() - self.started.start_time
+        self.connection.send((self.event, self.index, self.tag, {
+            "segment": _lightweight_segment(segment),
+            "elapsed": elapsed,
+            "residual_norm": _residual_norm(segment),
+            "converged": bool(getattr(segment.state.numerics.solver, "converged", False)),
+        }))
+
+
+def _lightweight_segment(segment):
+    # Tag and conditions only: enough for the time-series plots without pickling the analyses and vehicle.
+    from RCAIDE.Framework.Core import Data
+    light = Data()
+    light.tag = segment.tag
+    light.conditions = segment.state.conditions
+    return light
+
+
+def _residual_norm(segment):
+    # Euclidean norm of the converged residuals, or None if they cannot be packed.
+    try:
+        return float(np.linalg.norm(segment.state.residuals.pack_array()))
+    except Exception:
+        return None
+
+
+def _counted_iterate(iterate):
+    # Copy of the iterate process with a residual evaluation counter in front.
+    process = type(iterate)()
+    process.count_residual_evaluation = count_residual_evaluation
+    for key, step in iterate.items():
+        process[key] = step
+    return process
+
+
+def _install_segment_steps(mission, connection, warm_starts=None):
+    # Wrap each segment process with start/finish reporters, an evaluation counter and, when a seed is
+    # given, a warm start of the unknowns; return the originals so they can be restored.
+    originals = []
+    for index, segment in enumerate(mission.segments.values()):
+        seed = warm_starts[index] if warm_starts is not None and index < len(warm_starts) else None
+        process = type(segment.process)()
+        started = _SegmentReporter(connection, "segment_started", index, segment.tag)
+        process.report_started = started
+        for key, step in segment.process.items():
+            if key == "converge" and seed is not None:
+                process.warm_start = WarmStartUnknowns(seed)
+            process[key] = _counted_iterate(step) if key == "iterate" else step
+        process.report_finished = _SegmentFinishedReporter(connection, index, segment.tag, started)
+        originals.append((segment, segment.process))
+        segment.process = process
+    return originals
+
+
+def _restore_segment_processes(originals):
+    # Reporters hold the pipe, so they have to be removed before the results are pickled.
+    for segment, process in originals:
+        segment.process = process
+
+
+def solve_mission_in_process(connection, mission_bytes, warm_starts=None):
+    """Entry point of the solve process: evaluate a pickled mission and send the outcome back.
+
+    ``warm_starts`` optionally holds, per segment, previously solved unknowns used as the initial guess.
+
+    Messages sent over ``connection``:
+        ("segment_started", index, tag)            a segment began solving
+        ("segment_finished", index, tag, info)     a segment finished solving; ``info`` holds its tag and
+                                                   conditions ("segment"), "elapsed" seconds, "residual_norm"
+                                                   and "converged"
+        ("profile", rows)                          ``SolveProfiler.rows()`` of the (possibly failed) solve
+        ("finished", results_bytes)                pickled results of ``mission.evaluate()``
+        ("failed", traceback_text)                 formatted traceback of the exception raised
+    """
+    try:
+        mission = pickle.loads(mission_bytes)
+        profiler = SolveProfiler()
+        timed_steps = profiler.install(mission)
+        originals = _install_segment_steps(mission, connection, warm_starts)
+        try:
+            # Let solver output stream directly to terminal so native progress bar rendering is preserved.
+            results = mission.evaluate()
+        finally:
+            _restore_segment_processes(originals)
+            profiler.restore(timed_steps)
+            connection.send(("profile", profiler.rows()))
+        connection.send(("finished", pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL)))
+    except Exception:
+        connection.send(("failed", traceback.format_exc()))
+    finally:
+        connection.close()
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Parent side
+# ----------------------------------------------------------------------------------------------------------------------
+class MissionSolveProcess:
+    """Runs ``mission.evaluate()`` in a separate (spawned) process so the solve does not share the GIL with Qt.
+
+    The solve can be cancelled from any thread with ``cancel()`` and is bounded by the ``time_budget`` passed
+    to ``wait()``. In both cases the child is terminated, which releases all of its memory.
+    """
+
+    def __init__(self, mission, warm_starts=None):
+        self._mission = mission
+        self._warm_starts = warm_starts
+        self._process = None
+        self._connection = None
+        self._cancel_event = threading.Event()
+        self.segment_tags = [segment.tag for segment in mission.segments.values()]
+        # (index, tag) of the segment the child is currently solving.
+        self.in_flight_segment = None
+        # Step timings sent by the child once the mission has been evaluated.
+        self.profile = None
+
+    def start(self):
+        # Pickle the built mission in the parent; the child only has to unpickle and evaluate it.
+        mission_bytes = pickle.dumps(self._mission, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # Spawn keeps the child free of the parent's Qt state on every platform.
+        context = multiprocessing.get_context("spawn")
+        parent_connection, child_connection = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=solve_mission_in_process,
+            args=(child_connection, mission_bytes, self._warm_starts),
+            daemon=True,
+        )
+        self._process.start()
+        # Only the child writes to the pipe; close our copy of its end so EOF is detected if it dies.
+        child_connection.close()
+        self._connection = parent_connection
+
+    def cancel(self):
+        # Safe to call from the GUI thread; the waiting thread terminates the child.
+        self._cancel_event.set()
+
+    def describe_in_flight_segment(self):
+        if self.in_flight_segment is None:
+            return "before the first segment started"
+        index, tag = self.in_flight_segment
+        return f"on segment {index + 1}/{len(self.segment_tags)} '{tag}'"
+
+    def wait(self, time_budget=None, on_message=None, cancel_event=None):
+        """Block until the child reports back, the solve is cancelled or ``time_budget`` seconds elapse.
+
+        Returns ("finished", results), ("failed", message) or ("cancelled", message). Progress messages
+        are forwarded to ``on_message`` as they arrive. Setting ``cancel_event``, which may be shared with
+        other processes, cancels the solve like ``cancel()``.
+        """
+        start_time = time.monotonic()
+        message = None
+        while message is None:
+            # Stop on user request or once the wall-clock budget is spent.
+            if self._cancel_event.is_set() or (cancel_event is not None and cancel_event.is_set()):
+                self.terminate()
+                return "cancelled", f"Mission simulation cancelled {self.describe_in_flight_segment()}."
+            if time_budget is not None and time.monotonic() - start_time > time_budget:
+                self.terminate()
+                return "cancelled", (
+                    f"Mission simulation exceeded its {time_budget:.0f} s time budget "
+                    f"{self.describe_in_flight_segment()}."
+                )
+
+            if self._connection.poll(POLL_INTERVAL):
+                try:
+                    received = self._connection.recv()
+                except EOFError:
+                    break
+                if received[0] in ("finished", "failed"):
+                    message = received
+                    break
+                if received[0] == "profile":
+                    self.profile = received[1]
+                    continue
+                self._track_progress(received)
+                if on_message is not None:
+                    on_message(received)
+            elif not self._process.is_alive():
+                # Drain anything sent right before the child exited.
+                if self._connection.poll():
+                    continue
+                break
+
+        self.close()
+
+        if message is None:
+            return "failed", (
+                f"Mission solve process exited unexpectedly (exit code {self._process.exitcode}) "
+                f"{self.describe_in_flight_segment()}."
+            )
+
+        status, payload = message
+        if status == "finished":
+            return status, pickle.loads(payload)
+        return status, payload
+
+    def _track_progress(self, message):
+        event, index, tag = message[:3]
+        if event == "segment_started":
+            self.in_flight_segment = (index, tag)
+        elif event == "segment_finished" and index + 1 < len(self.segment_tags):
+            # The next segment is considered in flight as soon as the previous one has finished.
+            self.in_flight_segment = (index + 1, self.segment_tags[index + 1])
+
+    def terminate(self):
+        # Kill the child (escalating if it ignores SIGTERM) and release the pipe.
+        if self._process is not None and self._process.is_alive():
+            self._process.terminate()
+            self._process.join(TERMINATE_TIMEOUT)
+            if self._process.is_alive():
+                self._process.kill()
+        self.close()
+
+    def close(self):
+        # Release the pipe and reap the child process.
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        if self._process is not None:
+            self._process.join()
@@ -0,0 +1,132 @@
+# RCAIDE_GUI/tabs/solve/solve_profiler.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import json
+import os
+import time
+
+# File name of the profile written next to saved results.
+PROFILE_FILE_NAME = "solve_profile.json"
+# Scope used for the mission-level steps (pre-processing of the analyses, segment loop).
+MISSION_SCOPE = "mission"
+# Scope of the rows that sum each segment step over all segments.
+ALL_SEGMENTS_SCOPE = "all segments"
+# Step reported for the time converge spends outside of the iterate process, i.e. in the nonlinear solver.
+SOLVER_OVERHEAD_STEP = "converge (solver overhead)"
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Profiler
+# ----------------------------------------------------------------------------------------------------------------------
+class _TimedStep:
+    """Process step wrapper that adds its call count and wall time to the profiler."""
+
+    def __init__(self, profiler, scope, path, step):
+        self.profiler = profiler
+        self.scope = scope
+        self.path = path
+        self.step = step
+
+    def __call__(self, *args, **kwargs):
+        start_time = time.perf_counter()
+        try:
+            return self.step(*args, **kwargs)
+        finally:
+            self.profiler.record(self.scope, self.path, time.perf_counter() - start_time)
+
+
+class SolveProfiler:
+    """Call counts and cumulative wall time of every mission and segment process step.
+
+    The analyses (aerodynamics, stability, weights, energy, ...) are reached through these steps, so each
+    analysis shows up under the step that evaluates it, e.g. ``iterate.conditions.aerodynamics``.
+    """
+
+    def __init__(self):
+        # (scope, step path) -> [calls, seconds]
+        self.timings = {}
+
+    def record(self, scope, path, seconds):
+        entry = self.timings.setdefault((scope, path), [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def install(self, mission):
+        """Wrap the steps of the mission process and of every segment process. Returns what ``restore`` needs."""
+        originals = []
+        self._wrap(mission.process, MISSION_SCOPE, (), originals)
+        for segment in mission.segments.values():
+            self._wrap(segment.process, segment.tag, (), originals)
+        return originals
+
+    @staticmethod
+    def restore(originals):
+        # Put the unwrapped steps back, innermost first.
+        for process, key, step in reversed(originals):
+            process[key] = step
+
+    def _wrap(self, process, scope, prefix, originals):
+        for key, step in list(process.items()):
+            path = prefix + (key,)
+            if hasattr(step, "items"):
+                # Nested processes stay in place (RCAIDE reaches into them by key); only their steps are timed.
+                self._wrap(step, scope, path, originals)
+            elif callable(step):
+                originals.append((process, key, step))
+                process[key] = _TimedStep(self, scope, ".".join(path), step)
+
+    def rows(self):
+        """List of {"scope", "step", "calls", "total_seconds", "mean_seconds"}, slowest first.
+
+        Besides one row per recorded step, there is a solver overhead row per segment and every segment step is
+        also summed over all segments.
+        """
+        timings = dict(self.timings)
+        iterate_time = {}
+        converge_time = {}
+        for (scope, path), (calls, seconds) in self.timings.items():
+            if path.startswith("iterate."):
+                iterate_time[scope] = iterate_time.get(scope, 0.0) + seconds
+            elif path == "converge" and scope != MISSION_SCOPE:
+                # The mission's converge step is the segment loop, not a solver.
+                converge_time[scope] = seconds
+
+        # Converge wraps the solver; whatever it did not spend iterating was spent in the solver itself.
+        for scope, seconds in converge_time.items():
+            overhead = max(seconds - iterate_time.get(scope, 0.0), 0.0)
+            timings[(scope, SOLVER_OVERHEAD_STEP)] = [self.timings[(scope, "converge")][0], overhead]
+
+        # Totals over all segments show which analysis dominates the mission as a whole.
+        totals = {}
+        for (scope, path), (calls, seconds) in timings.items():
+            if scope == MISSION_SCOPE:
+                continue
+            entry = totals.setdefault((ALL_SEGMENTS_SCOPE, path), [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+        timings.update(totals)
+
+        rows = [_row(scope, path, calls, seconds) for (scope, path), (calls, seconds) in timings.items()]
+        rows.sort(key=lambda row: row["total_seconds"], reverse=True)
+        return rows
+
+
+def _row(scope, step, calls, seconds):
+    return {
+        "scope": scope,
+        "step": step,
+        "calls": calls,
+        "total_seconds": seconds,
+        "mean_seconds": seconds / calls if calls else 0.0,
+    }
+
+
+def write_profile(rows, directory):
+    """Write profile rows as JSON into ``directory``. Returns the file path."""
+    path = os.path.join(directory, PROFILE_FILE_NAME)
+    with open(path, "w") as file:
+        json.dump(rows, file, indent=4)
+    return path
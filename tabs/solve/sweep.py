@@ -0,0 +1,296 @@
+# RCAIDE_GUI/tabs/solve/sweep.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import copy
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+# Saved mission segment keys that are selectors rather than physical inputs.
+_NON_SWEEPABLE_SEGMENT_KEYS = ("top dropdown", "nested dropdown", "config")
+# Metrics reported for every sweep point (see ``batch.mission_metrics``).
+SWEEP_METRICS = ("flight_time", "range", "final_altitude", "final_mass", "mass_burned")
+# Interval at which a running pool is checked for a cancel request.
+CANCEL_POLL_INTERVAL = 0.1
+
+# Cancel event of the pool this worker process belongs to (see ``init_pool_worker``).
+_pool_cancel_event = None
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Sweep parameters
+# ----------------------------------------------------------------------------------------------------------------------
+class SweepParameter:
+    """A numeric input of the saved project and the values it is swept over.
+
+    ``source`` is "geometry" (a field of ``geometry_data[0]``) or "mission" (a field of ``mission_data[segment]``).
+    Values are in the unit the field is saved in.
+    """
+
+    def __init__(self, source, label, segment_index=None, values=(), name=None):
+        self.source = source
+        self.label = label
+        self.segment_index = segment_index
+        self.values = list(values)
+        self.name = name or label
+
+    def entry(self, project_data):
+        # Dictionary that holds the field in ``project_data``.
+        if self.source == "geometry":
+            return project_data["geometry_data"][0]
+        return project_data["mission_data"][self.segment_index]
+
+    def apply(self, project_data, value):
+        entry = self.entry(project_data)
+        saved = entry[self.label]
+        if isinstance(saved, list):
+            saved[0] = int(round(value)) if isinstance(saved[0], int) else float(value)
+        else:
+            entry[self.label] = int(round(value)) if isinstance(saved, int) else float(value)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _saved_number(saved):
+    # (value, unit index) of a saved numeric field, or None when the field is not a single number.
+    if _is_number(saved):
+        return saved, None
+    if isinstance(saved, list) and len(saved) == 2 and _is_number(saved[0]) and isinstance(saved[1], int):
+        return saved
+    return None
+
+
+def _unit_suffix(unit_classes, label, unit_index):
+    unit_class = unit_classes.get(label)
+    if unit_class is None or unit_index is None:
+        return ""
+    try:
+        return f" [{unit_class.unit_list[unit_index][0]}]"
+    except (AttributeError, IndexError):
+        return ""
+
+
+def sweepable_parameters(project_data):
+    """Every numeric field of the vehicle and of each mission segment, as ``SweepParameter`` without values."""
+    from tabs.geometry.frames.vehicle_frame import VehicleFrame
+    from tabs.mission.widgets.mission_segment_helper import segment_data_fields
+
+    parameters = []
+
+    vehicle = project_data["geometry_data"][0] if project_data.get("geometry_data") else None
+    if vehicle:
+        unit_classes = {label: unit_class for label, unit_class, *_ in VehicleFrame.data_units_labels}
+        for label, saved in vehicle.items():
+            number = _saved_number(saved)
+            if number is not None:
+                name = f"Vehicle: {label}{_unit_suffix(unit_classes, label, number[1])}"
+                parameters.append(SweepParameter("geometry", label, name=name))
+
+    for index, segment in enumerate(project_data.get("mission_data") or []):
+        try:
+            fields = segment_data_fields[segment["top dropdown"]][segment["nested dropdown"]]
+            unit_classes = {label: unit_class for label, unit_class, _ in fields}
+        except (KeyError, IndexError, TypeError):
+            unit_classes = {}
+        for label, saved in segment.items():
+            number = _saved_number(saved)
+            if number is None or label in _NON_SWEEPABLE_SEGMENT_KEYS:
+                continue
+            name = (f"Segment {index + 1} '{segment.get('Segment Name', '')}': "
+                    f"{label}{_unit_suffix(unit_classes, label, number[1])}")
+            parameters.append(SweepParameter("mission", label, segment_index=index, name=name))
+
+    return parameters
+
+
+def sweep_range(start, stop, count):
+    """``count`` evenly spaced values from ``start`` to ``stop`` (inclusive)."""
+    return [float(value) for value in np.linspace(start, stop, max(int(count), 1))]
+
+
+def sweep_points(parameters):
+    """Full-factorial grid of sweep coordinates (one tuple of values per variant)."""
+    return list(itertools.product(*(parameter.values for parameter in parameters)))
+
+
+def apply_sweep_point(project_data, parameters, coordinates):
+    """Copy of ``project_data`` with every swept field set to its coordinate."""
+    variant = copy.deepcopy(project_data)
+    for parameter, value in zip(parameters, coordinates):
+        parameter.apply(variant, value)
+    return variant
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Sweep results
+# ----------------------------------------------------------------------------------------------------------------------
+class SweepResults:
+    """Tabular store of a sweep: one row per point, keyed by its coordinates."""
+
+    def __init__(self, parameter_names):
+        self.parameter_names = list(parameter_names)
+        # coordinates tuple -> row dictionary (coordinates, "status", "message", "elapsed_seconds", metrics)
+        self.rows = {}
+
+    def add(self, coordinates, row):
+        self.rows[tuple(coordinates)] = row
+
+    def __len__(self):
+        return len(self.rows)
+
+    def columns(self):
+        return self.parameter_names + ["status", "elapsed_seconds"] + list(SWEEP_METRICS) + ["message"]
+
+    def table(self):
+        """Rows as lists in ``columns()`` order, sorted by coordinates."""
+        table = []
+        for coordinates in sorted(self.rows):
+            row = self.rows[coordinates]
+            table.append(list(coordinates) + [row.get(column) for column in self.columns()[len(coordinates):]])
+        return table
+
+    def axis_values(self, parameter_index):
+        return sorted({coordinates[parameter_index] for coordinates in self.rows})
+
+    def grid(self, metric, x_index=0, y_index=1):
+        """(x values, y values, Z) with ``Z[i, j]`` the metric at x[i], y[j]; missing or failed points are NaN.
+
+        With a single parameter, y values are ``[None]`` and Z has one column.
+        """
+        x_values = self.axis_values(x_index)
+        y_values = self.axis_values(y_index) if len(self.parameter_names) > 1 else [None]
+        z = np.full((len(x_values), len(y_values)), np.nan)
+        x_lookup = {value: i for i, value in enumerate(x_values)}
+        y_lookup = {value: j for j, value in enumerate(y_values)}
+        for coordinates, row in self.rows.items():
+            value = row.get(metric)
+            if value is None or row.get("status") != "finished":
+                continue
+            y_key = coordinates[y_index] if len(coordinates) > 1 else None
+            z[x_lookup[coordinates[x_index]], y_lookup[y_key]] = value
+        return x_values, y_values, z
+
+    def write_csv(self, path):
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(self.columns())
+            writer.writerows(self.table())
+
+    def write_json(self, path):
+        with open(path, "w") as file:
+            json.dump({"columns": self.columns(), "rows": self.table()}, file, indent=4)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Solve
+# ----------------------------------------------------------------------------------------------------------------------
+def _sweep_row(parameters, coordinates, message=""):
+    # Row of a sweep point, failed until its solve finishes.
+    row = {name: value for name, value in zip([p.name for p in parameters], coordinates)}
+    row.update({"status": "failed", "message": message, "elapsed_seconds": 0.0})
+    return row
+
+
+def solve_sweep_point(project_data, parameters, coordinates, time_budget=None, cancel_event=None):
+    """Rebuild and solve one variant of the project. Runs in a sweep pool worker; returns its row.
+
+    ``cancel_event`` defaults to the event of the pool the worker belongs to.
+    """
+    from tabs.solve.batch import build_mission_from_values, load_project_data, mission_metrics
+    from tabs.solve.solve_process import MissionSolveProcess
+
+    cancel_event = pool_cancel_event() if cancel_event is None else cancel_event
+    row = _sweep_row(parameters, coordinates)
+    if cancel_event is not None and cancel_event.is_set():
+        row.update({"status": "cancelled", "message": "Sweep cancelled before the variant was solved."})
+        return row
+    start_time = time.monotonic()
+    try:
+        load_project_data(apply_sweep_point(project_data, parameters, coordinates))
+        solve_process = MissionSolveProcess(build_mission_from_values())
+        solve_process.start()
+        status, payload = solve_process.wait(time_budget, cancel_event=cancel_event)
+        row["status"] = status
+        if status == "finished":
+            row.update(mission_metrics(payload))
+        else:
+            row["message"] = payload
+    except Exception:
+        row["message"] = traceback.format_exc()
+    row["elapsed_seconds"] = time.monotonic() - start_time
+    return row
+
+
+def init_pool_worker(cancel_event):
+    # Pool initializer: events can only reach a spawned worker when it is created.
+    global _pool_cancel_event
+    _pool_cancel_event = cancel_event
+
+
+def pool_cancel_event():
+    """Cancel event of the pool the calling worker belongs to, or None outside a pool."""
+    return _pool_cancel_event
+
+
+def as_completed_until_cancelled(futures, cancel_event, worker_cancel_event):
+    """Yield ``futures`` as they finish. Once ``cancel_event`` is set, futures not yet started are dropped and
+    ``worker_cancel_event`` is set so the pool workers stop the solves they are running.
+    """
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+        for future in done:
+            if not future.cancelled():
+                yield future
+        if cancel_event is not None and cancel_event.is_set() and not worker_cancel_event.is_set():
+            worker_cancel_event.set()
+            for future in pending:
+                future.cancel()
+
+
+def default_sweep_jobs():
+    # One variant per core; each pool worker mostly waits on its own solve process.
+    return max(os.cpu_count() or 1, 1)
+
+
+def run_sweep(project_data, parameters, jobs=None, time_budget=None, on_row=None, cancel_event=None):
+    """Solve every point of the full-factorial sweep on a process pool. Returns the ``SweepResults``.
+
+    ``on_row(coordinates, row)`` is called as points finish. Each solve is limited to ``time_budget`` seconds;
+    setting ``cancel_event`` drops the points not yet started and stops the ones being solved.
+    """
+    results = SweepResults([parameter.name for parameter in parameters])
+    points = sweep_points(parameters)
+    jobs = min(jobs or default_sweep_jobs(), max(len(points), 1))
+
+    # Spawned workers rebuild each variant from plain data, so they never share ``values`` or Qt state.
+    context = multiprocessing.get_context("spawn")
+    worker_cancel_event = context.Event()
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=init_pool_worker,
+                             initargs=(worker_cancel_event,)) as executor:
+        futures = {
+            executor.submit(solve_sweep_point, project_data, parameters, coordinates, time_budget): coordinates
+            for coordinates in points
+        }
+        for future in as_completed_until_cancelled(futures, cancel_event, worker_cancel_event):
+            coordinates = futures[future]
+            try:
+                row = future.result()
+            except BrokenProcessPool:
+                # A worker died in native code; the points it took down are reported, not raised.
+                row = _sweep_row(parameters, coordinates, traceback.format_exc())
+            results.add(coordinates, row)
+            if on_row is not None:
+                on_row(coordinates, row)
+    return results
@@ -0,0 +1,128 @@
+# RCAIDE_GUI/tabs/solve/warm_start.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Seeds from previous results
+# ----------------------------------------------------------------------------------------------------------------------
+def _control_points(segment):
+    # Dimensionless control point locations (0 to 1) of a segment, or None when they are not available.
+    try:
+        points = np.asarray(segment.state.numerics.dimensionless.control_points, dtype=float).ravel()
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return points if points.size else None
+
+
+def _array_leaves(data, prefix=()):
+    # (key path, array) pairs of every numeric array in a nested unknowns container.
+    for key, value in data.items():
+        if key == "tag":
+            continue
+        if isinstance(value, np.ndarray):
+            yield prefix + (key,), value
+        elif hasattr(value, "items"):
+            yield from _array_leaves(value, prefix + (key,))
+
+
+def previous_unknowns(results):
+    """Solved unknowns of every segment in ``results``, keyed by segment tag."""
+    seeds = {}
+    if results is None:
+        return seeds
+    for segment in results.segments.values():
+        unknowns = getattr(segment.state, "unknowns", None)
+        if unknowns is None:
+            continue
+        seeds[segment.tag] = {
+            "control_points": _control_points(segment),
+            "unknowns": {path: np.array(value) for path, value in _array_leaves(unknowns)},
+        }
+    return seeds
+
+
+def warm_start_seeds(mission, results):
+    """Seed for each segment of ``mission`` from the matching (same tag) segment of ``results``, or None."""
+    seeds = previous_unknowns(results)
+    return [seeds.get(segment.tag) for segment in mission.segments.values()]
+
+
+def resample(values, old_points, new_points):
+    """Linearly resample a (control points, columns) array onto new dimensionless control points."""
+    if old_points is None or new_points is None or len(old_points) != values.shape[0]:
+        return None
+    if len(old_points) == len(new_points) and np.allclose(old_points, new_points):
+        return values.copy()
+    if len(old_points) < 2:
+        return np.repeat(values[:1], len(new_points), axis=0)
+    order = np.argsort(old_points)
+    return np.column_stack([
+        np.interp(new_points, old_points[order], values[order, column]) for column in range(values.shape[1])
+    ])
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Segment process steps
+# ----------------------------------------------------------------------------------------------------------------------
+class WarmStartUnknowns:
+    """Segment step run before ``converge`` that overwrites the default unknowns with a previous solution.
+
+    Unknowns are matched by name; anything missing or of a different shape keeps its default guess.
+    """
+
+    def __init__(self, seed):
+        self.seed = seed
+
+    def __call__(self, segment):
+        new_points = _control_points(segment)
+        seeded = 0
+        for path, default in list(_array_leaves(segment.state.unknowns)):
+            previous = self.seed["unknowns"].get(path)
+            if previous is None or previous.ndim != 2 or default.ndim != 2 or previous.shape[1] != default.shape[1]:
+                continue
+            if previous.shape[0] == default.shape[0]:
+                guess = previous.copy()
+            else:
+                # Control Points changed since the previous solve.
+                guess = resample(previous, self.seed["control_points"], new_points)
+                if guess is None or guess.shape != default.shape:
+                    continue
+            container = segment.state.unknowns
+            for key in path[:-1]:
+                container = container[key]
+            container[path[-1]] = guess
+            seeded += 1
+        segment.state.numerics.solver.warm_started_unknowns = seeded
+
+
+def count_residual_evaluation(segment):
+    """First step of ``segment.process.iterate``: counts the solver's residual evaluations."""
+    solver = segment.state.numerics.solver
+    solver.residual_evaluations = solver.get("residual_evaluations", 0) + 1
+
+
+def residual_evaluations(segment):
+    """Residual evaluations recorded for a solved segment, or None if they were not counted."""
+    solver = getattr(segment.state.numerics, "solver", None)
+    return solver.get("residual_evaluations") if solver is not None else None
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Reporting
+# ----------------------------------------------------------------------------------------------------------------------
+def evaluation_savings(results, previous_results):
+    """(tag, warm evaluations, previous evaluations) for every warm-started segment of ``results``."""
+    previous = {}
+    if previous_results is not None:
+        previous = {segment.tag: residual_evaluations(segment) for segment in previous_results.segments.values()}
+
+    savings = []
+    for segment in results.segments.values():
+        solver = getattr(segment.state.numerics, "solver", None)
+        if solver is None or not solver.get("warm_started_unknowns"):
+            continue
+        savings.append((segment.tag, residual_evaluations(segment), previous.get(segment.tag)))
+    return savings
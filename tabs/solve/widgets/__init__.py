@@ -0,0 +1,5 @@
+from tabs.solve.widgets.solve_profile_widget import SolveProfileWidget
+from tabs.solve.widgets.sweep_widget import SweepWidget
+from tabs.solve.widgets.payload_range_widget import PayloadRangeWidget
+from tabs.solve.widgets.run_history_widget import RunHistoryWidget
+from tabs.solve.widgets.plot_slot import PlotCurve, PlotSlot, set_level_of_detail, update_curve, trim_curves
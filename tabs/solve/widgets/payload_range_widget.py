@@ -0,0 +1,175 @@
+# RCAIDE_GUI/tabs/solve/widgets/payload_range_widget.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import json
+import threading
+import traceback
+
+import pyqtgraph as pg
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QDoubleSpinBox, QPushButton, QMessageBox
+
+from tabs.solve.payload_range import run_payload_range
+import values
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Worker
+# ----------------------------------------------------------------------------------------------------------------------
+class _PayloadRangeWorker(QObject):
+    corner_finished = pyqtSignal(object)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, project_data, reserve_fraction, cache, time_budget=None):
+        super().__init__()
+        self._project_data = project_data
+        self._reserve_fraction = reserve_fraction
+        self._cache = cache
+        self._time_budget = time_budget
+        self._cancel_event = threading.Event()
+
+    def run(self):
+        try:
+            corners = run_payload_range(self._project_data, self._reserve_fraction, cache=self._cache,
+                                        time_budget=self._time_budget, on_corner=self.corner_finished.emit,
+                                        cancel_event=self._cancel_event)
+        except Exception:
+            self.failed.emit(traceback.format_exc())
+            return
+        self.finished.emit(corners)
+
+    def cancel(self):
+        # Corners being solved are stopped; the rest are dropped.
+        self._cancel_event.set()
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  PayloadRangeWidget
+# ----------------------------------------------------------------------------------------------------------------------
+class PayloadRangeWidget(QWidget):
+    """Builds the payload-range diagram of the saved vehicle and mission."""
+
+    def __init__(self, time_budget=None):
+        super(PayloadRangeWidget, self).__init__()
+        self.setWindowTitle("Payload-Range Diagram")
+        self.resize(800, 600)
+
+        # Wall-clock limit of each mission solve, in seconds.
+        self._time_budget = time_budget
+        self._thread = None
+        self._worker = None
+        # Solved corners by input hash; kept for the lifetime of the window so re-plotting is instant.
+        self._cache = {}
+
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Fuel Reserve (%)"))
+        self.reserve_spin = QDoubleSpinBox()
+        self.reserve_spin.setRange(0.0, 50.0)
+        self.reserve_spin.setValue(5.0)
+        controls.addWidget(self.reserve_spin)
+        self.run_button = QPushButton("Compute Payload-Range")
+        self.run_button.clicked.connect(self.run_payload_range)
+        controls.addWidget(self.run_button)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_payload_range)
+        controls.addWidget(self.cancel_button)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setBackground("#0e141b")
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.15)
+        self.plot_widget.setLabel("bottom", "Range (nmi)")
+        self.plot_widget.setLabel("left", "Payload (kg)")
+        self.plot_widget.setTitle("Payload-Range", color="#9fb8ff")
+        layout.addWidget(self.plot_widget, 1)
+
+    def run_payload_range(self):
+        # Ignore clicks while corners are being solved.
+        if self._thread is not None and self._thread.isRunning():
+            return
+
+        project_data = json.loads(values.write_to_json())
+        self._set_running(True)
+        self.status_label.setText("Solving corner points...")
+        self.plot_widget.clear()
+
+        self._thread = QThread(self)
+        self._worker = _PayloadRangeWorker(project_data, self.reserve_spin.value() / 100.0, self._cache,
+                                           self._time_budget)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.corner_finished.connect(self._on_corner_finished)
+        self._worker.finished.connect(self._on_finished)
+        self._worker.failed.connect(self._on_failed)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.failed.connect(self._thread.quit)
+        self._thread.finished.connect(self._cleanup_worker)
+        self._thread.start()
+
+    def cancel_payload_range(self):
+        if self._worker is not None:
+            self.status_label.setText("Cancelling: stopping the corners being solved...")
+            self._worker.cancel()
+
+    def closeEvent(self, event):
+        # Closing the window stops the solves; the thread then finishes on its own.
+        self.cancel_payload_range()
+        super().closeEvent(event)
+
+    def _set_running(self, running):
+        self.run_button.setEnabled(not running)
+        self.reserve_spin.setEnabled(not running)
+        self.cancel_button.setEnabled(running)
+
+    def _cleanup_worker(self):
+        if self._worker is not None:
+            self._worker.deleteLater()
+            self._worker = None
+        if self._thread is not None:
+            self._thread.deleteLater()
+            self._thread = None
+
+    def _on_corner_finished(self, corner):
+        if corner["status"] != "finished":
+            print(f"Payload-range corner {corner['name']} {corner['status']}:\n{corner['message']}")
+        elif corner["message"]:
+            print(f"Payload-range corner {corner['name']}: {corner['message']}")
+
+    def _on_finished(self, corners):
+        self._set_running(False)
+        messages = []
+        for status in ("failed", "cancelled"):
+            names = [corner["name"] for corner in corners if corner["status"] == status]
+            if names:
+                messages.append(f"{status.capitalize()} corners: " + ", ".join(names))
+        self.status_label.setText("; ".join(messages))
+        self.render_diagram(corners)
+
+    def _on_failed(self, error_message):
+        self._set_running(False)
+        self.status_label.setText("Payload-range failed.")
+        print(error_message)
+        QMessageBox.critical(self, "Payload-Range Failed", error_message)
+
+    def render_diagram(self, corners):
+        from RCAIDE.Framework.Core import Units
+        self.plot_widget.clear()
+        solved = [corner for corner in corners if corner["status"] == "finished"]
+        ranges = [corner["range"] / Units.nmi for corner in solved]
+        payloads = [corner["payload"] for corner in solved]
+        self.plot_widget.plot(ranges, payloads, pen=pg.mkPen("#5fb0ff", width=3), symbol="o",
+                              symbolBrush="#5fb0ff", symbolSize=9)
+        for corner, x, y in zip(solved, ranges, payloads):
+            label = pg.TextItem(f"{corner['name']}  ({x:.0f} nmi, {y:.0f} kg)", color="#d9ecff", anchor=(0, 1))
+            label.setPos(x, y)
+            self.plot_widget.addItem(label)
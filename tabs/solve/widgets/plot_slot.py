@@ -0,0 +1,154 @@
+# RCAIDE_GUI/tabs/solve/widgets/plot_slot.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from collections import namedtuple
+from functools import partial
+
+import numpy as np
+from PyQt6.QtCore import QSize
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+# Size of every dynamic Solve tab plot, and of its placeholder.
+PLOT_SIZE = QSize(620, 380)
+# Plots with more points than this are drawn with peak-preserving downsampling, clipped to the view.
+DOWNSAMPLE_POINT_THRESHOLD = 2000
+# Markers are only drawn while at most this many points are in view.
+MARKER_POINT_LIMIT = 400
+
+# One curve of a plot. ``source`` names the arrays (compared by identity) and rows the data was sliced from,
+# so an unchanged curve is not re-set; None means the data is always re-set.
+PlotCurve = namedtuple("PlotCurve", ["x", "y", "pen", "symbol", "brush", "symbol_size", "name", "source"])
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Curve updates
+# ----------------------------------------------------------------------------------------------------------------------
+def _same_curve_source(previous, current):
+    # True when both curve sources name the same arrays (by identity) and rows.
+    if previous is None or current is None or len(previous) != len(current):
+        return False
+    return all(a is b if isinstance(a, np.ndarray) else a == b for a, b in zip(previous, current))
+
+
+def update_curve(widget, index, curve):
+    """Make curve ``index`` of ``widget`` show ``curve``, reusing the existing PlotDataItem when its style matches."""
+    style = (curve.pen.color().name(), curve.pen.widthF(), curve.symbol, str(curve.brush), curve.symbol_size,
+             curve.name)
+    items = widget.listDataItems()
+    if index < len(items):
+        item = items[index]
+        if getattr(item, "_render_style", None) == style:
+            if not _same_curve_source(getattr(item, "_render_source", None), curve.source):
+                item.setData(curve.x, curve.y)
+                item._render_source = curve.source
+            return item
+        # Style or legend name changed: replace this curve and the ones after it, keeping legend order.
+        for stale in items[index:]:
+            widget.removeItem(stale)
+    item = widget.plot(curve.x, curve.y, pen=curve.pen, symbol=curve.symbol, symbolBrush=curve.brush,
+                       symbolSize=curve.symbol_size, name=curve.name)
+    item._render_style = style
+    item._render_source = curve.source
+    return item
+
+
+def trim_curves(widget, count):
+    """Remove the curves of ``widget`` after the first ``count``."""
+    for item in widget.listDataItems()[count:]:
+        widget.removeItem(item)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Level of detail
+# ----------------------------------------------------------------------------------------------------------------------
+def set_level_of_detail(widget, enabled=True):
+    """Pick how ``widget`` draws its curves from their point count.
+
+    Call after the curves' markers were set: those become the markers shown whenever few enough points are
+    in view. Dense plots are downsampled (peak mode keeps the extremes of every bin) and clipped to the view.
+    """
+    items = widget.listDataItems()
+    total_points = sum(len(item.xData) for item in items if item.xData is not None)
+    dense = enabled and total_points > DOWNSAMPLE_POINT_THRESHOLD
+    plot_item = widget.getPlotItem()
+    if dense:
+        plot_item.setDownsampling(auto=True, mode="peak")
+    else:
+        plot_item.setDownsampling(ds=1, auto=False)
+    plot_item.setClipToView(dense)
+
+    widget._lod_enabled = enabled
+    for item in items:
+        item._lod_symbol = item.opts["symbol"]
+    if not getattr(widget, "_lod_connected", False):
+        plot_item.getViewBox().sigRangeChanged.connect(partial(_update_markers, widget))
+        widget._lod_connected = True
+    _update_markers(widget)
+
+
+def _update_markers(widget, *args):
+    # Hide markers while too many points are in view; restore them when zoomed in.
+    items = widget.listDataItems()
+    show = True
+    if getattr(widget, "_lod_enabled", False):
+        (x_min, x_max), _ = widget.getPlotItem().getViewBox().viewRange()
+        visible = 0
+        for item in items:
+            if item.xData is not None:
+                visible += np.count_nonzero((item.xData >= x_min) & (item.xData <= x_max))
+        show = visible <= MARKER_POINT_LIMIT
+    for item in items:
+        symbol = getattr(item, "_lod_symbol", item.opts["symbol"]) if show else None
+        if item.opts["symbol"] != symbol:
+            item.setSymbol(symbol)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  PlotSlot
+# ----------------------------------------------------------------------------------------------------------------------
+class PlotSlot(QWidget):
+    """Fixed-size place of one plot in the Solve tab plot list.
+
+    The slot keeps the plot's title, labels and curves. A ``pg.PlotWidget`` is attached only while the slot
+    is near the visible part of the list; detached slots are empty placeholders of the same size.
+    """
+
+    def __init__(self, title, y_label, x_label):
+        super(PlotSlot, self).__init__()
+        self.setFixedSize(PLOT_SIZE)
+        self.title = title
+        self.y_label = y_label
+        self.x_label = x_label
+        self.curves = []
+        self.plot_widget = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def attach(self, plot_widget):
+        # Show this slot's plot in a (possibly reused) plot widget.
+        self.plot_widget = plot_widget
+        self.layout().addWidget(plot_widget)
+        plot_widget.setLabel("left", self.y_label, color="white", size="18px")
+        plot_widget.setLabel("bottom", self.x_label, color="white", size="18px")
+        plot_widget.setTitle(self.title, color="#9fb8ff", size="14pt")
+        plot_widget.show()
+        self.refresh()
+
+    def detach(self):
+        # Give back the plot widget; the slot stays in the layout as a placeholder.
+        plot_widget = self.plot_widget
+        if plot_widget is not None:
+            self.layout().removeWidget(plot_widget)
+            plot_widget.setParent(None)
+            self.plot_widget = None
+        return plot_widget
+
+    def refresh(self):
+        # Bring the attached plot widget up to date with the recorded curves.
+        if self.plot_widget is None:
+            return
+        for index, curve in enumerate(self.curves):
+            update_curve(self.plot_widget, index, curve)
+        trim_curves(self.plot_widget, len(self.curves))
@@ -0,0 +1,67 @@
+# RCAIDE_GUI/tabs/solve/widgets/run_history_widget.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QListWidgetItem, QPushButton
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  RunHistoryWidget
+# ----------------------------------------------------------------------------------------------------------------------
+class RunHistoryWidget(QWidget):
+    """Checkable list of previous solves; the checked runs are overlaid on the mission plots."""
+
+    # Run ids of the checked runs, in the order they were solved.
+    overlay_requested = pyqtSignal(list)
+    latest_requested = pyqtSignal()
+
+    def __init__(self):
+        super(RunHistoryWidget, self).__init__()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        title = QLabel("Run History")
+        title.setStyleSheet("font-weight: bold; color: white;")
+        layout.addWidget(title)
+
+        self.run_list = QListWidget()
+        layout.addWidget(self.run_list)
+
+        buttons = QHBoxLayout()
+        self.overlay_button = QPushButton("Overlay Selected")
+        self.overlay_button.clicked.connect(self._request_overlay)
+        buttons.addWidget(self.overlay_button)
+        self.latest_button = QPushButton("Show Latest")
+        self.latest_button.clicked.connect(self.latest_requested.emit)
+        buttons.addWidget(self.latest_button)
+        layout.addLayout(buttons)
+
+    def set_runs(self, records):
+        # Rebuild the list, keeping the check state of runs that are still in the history.
+        checked = set(self.checked_runs())
+        self.run_list.clear()
+        for record in records:
+            location = "" if record.in_memory else " (on disk)"
+            item = QListWidgetItem(f"{record.label}  {record.created:%H:%M:%S}  "
+                                   f"{record.segment_count} segments{location}")
+            item.setData(Qt.ItemDataRole.UserRole, record.run_id)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Checked if record.run_id in checked else Qt.CheckState.Unchecked)
+            self.run_list.addItem(item)
+
+    def checked_runs(self):
+        run_ids = []
+        for row in range(self.run_list.count()):
+            item = self.run_list.item(row)
+            if item.checkState() == Qt.CheckState.Checked:
+                run_ids.append(item.data(Qt.ItemDataRole.UserRole))
+        return run_ids
+
+    def _request_overlay(self):
+        run_ids = self.checked_runs()
+        if run_ids:
+            self.overlay_requested.emit(run_ids)
@@ -0,0 +1,64 @@
+# RCAIDE_GUI/tabs/solve/widgets/solve_profile_widget.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  SolveProfileWidget
+# ----------------------------------------------------------------------------------------------------------------------
+class SolveProfileWidget(QWidget):
+    """Sortable table of the call counts and wall time of each mission and segment step of the last solve."""
+
+    # (header, row key, display scale, decimals); numeric cells sort by value.
+    _COLUMNS = (
+        ("Scope", "scope", None, None),
+        ("Step", "step", None, None),
+        ("Calls", "calls", 1, 0),
+        ("Total (s)", "total_seconds", 1, 3),
+        ("Mean (ms)", "mean_seconds", 1000, 3),
+    )
+
+    def __init__(self):
+        super(SolveProfileWidget, self).__init__()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        title = QLabel("Solve Profile")
+        title.setStyleSheet("font-weight: bold; color: white;")
+        layout.addWidget(title)
+
+        self.table = QTableWidget(0, len(self._COLUMNS))
+        self.table.setHorizontalHeaderLabels([column[0] for column in self._COLUMNS])
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setStretchLastSection(True)
+        layout.addWidget(self.table)
+
+    def set_profile(self, rows):
+        # Disable sorting while filling, otherwise rows move between setItem calls.
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            for column_index, (_, key, scale, decimals) in enumerate(self._COLUMNS):
+                item = QTableWidgetItem()
+                value = row.get(key)
+                if scale is None:
+                    item.setText(str(value))
+                else:
+                    item.setData(Qt.ItemDataRole.DisplayRole, round(value * scale, decimals) if decimals else value)
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row_index, column_index, item)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(3, Qt.SortOrder.DescendingOrder)
+
+    def clear(self):
+        self.table.setRowCount(0)
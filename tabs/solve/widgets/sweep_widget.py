@@ -0,0 +1,339 @@
+# RCAIDE_GUI/tabs/solve/widgets/sweep_widget.py
+#
+# Created: Oct 2024, Laboratory for Electric Aircraft Design and Sustainabiltiy
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+import json
+import threading
+import traceback
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QComboBox, QDoubleSpinBox, \
+    QSpinBox, QPushButton, QProgressBar, QFileDialog, QMessageBox
+
+from tabs.solve.sweep import SWEEP_METRICS, default_sweep_jobs, run_sweep, sweep_range, sweepable_parameters
+import values
+
+# Horizontal offset between consecutive constant-Y lines of a carpet plot, as a fraction of the X span.
+CARPET_SHIFT = 0.35
+# Number of contour levels drawn over the contour image.
+CONTOUR_LEVELS = 8
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Worker
+# ----------------------------------------------------------------------------------------------------------------------
+class _SweepWorker(QObject):
+    point_finished = pyqtSignal(object, object)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, project_data, parameters, jobs, time_budget=None):
+        super().__init__()
+        self._project_data = project_data
+        self._parameters = parameters
+        self._jobs = jobs
+        self._time_budget = time_budget
+        self._cancel_event = threading.Event()
+
+    def run(self):
+        try:
+            results = run_sweep(self._project_data, self._parameters, jobs=self._jobs,
+                                time_budget=self._time_budget, on_row=self.point_finished.emit,
+                                cancel_event=self._cancel_event)
+        except Exception:
+            self.failed.emit(traceback.format_exc())
+            return
+        self.finished.emit(results)
+
+    def cancel(self):
+        # Points being solved are stopped; the rest are dropped.
+        self._cancel_event.set()
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  SweepWidget
+# ----------------------------------------------------------------------------------------------------------------------
+class SweepWidget(QWidget):
+    """Sets up a one- or two-parameter sweep of the saved project, solves it and shows carpet/contour views."""
+
+    def __init__(self, time_budget=None):
+        super(SweepWidget, self).__init__()
+        self.setWindowTitle("Parameter Sweep")
+        self.resize(900, 700)
+
+        # Wall-clock limit of each variant's solve, in seconds.
+        self._time_budget = time_budget
+        self._parameters = []
+        self._project_data = None
+        self._thread = None
+        self._worker = None
+        self.results = None
+        self._point_count = 0
+        self._completed_rows = {}
+
+        layout = QVBoxLayout(self)
+
+        # Parameter selectors: X is required, Y is optional.
+        grid = QGridLayout()
+        for column, text in enumerate(("", "Parameter", "Start", "Stop", "Points")):
+            grid.addWidget(QLabel(text), 0, column)
+        self._axis_controls = []
+        for row, axis in enumerate(("X", "Y"), start=1):
+            combo = QComboBox()
+            combo.setMinimumWidth(360)
+            start, stop = QDoubleSpinBox(), QDoubleSpinBox()
+            for spin in (start, stop):
+                spin.setRange(-1e12, 1e12)
+                spin.setDecimals(4)
+            count = QSpinBox()
+            count.setRange(1, 100)
+            count.setValue(5)
+            combo.currentIndexChanged.connect(lambda _, index=row - 1: self._on_parameter_changed(index))
+            for column, widget in enumerate((QLabel(axis), combo, start, stop, count)):
+                grid.addWidget(widget, row, column)
+            self._axis_controls.append((combo, start, stop, count))
+        layout.addLayout(grid)
+
+        run_layout = QHBoxLayout()
+        run_layout.addWidget(QLabel("Parallel jobs"))
+        self.jobs_spin = QSpinBox()
+        self.jobs_spin.setRange(1, 256)
+        self.jobs_spin.setValue(default_sweep_jobs())
+        run_layout.addWidget(self.jobs_spin)
+        self.reload_button = QPushButton("Reload Inputs")
+        self.reload_button.clicked.connect(self.load_parameters)
+        run_layout.addWidget(self.reload_button)
+        self.run_button = QPushButton("Run Sweep")
+        self.run_button.clicked.connect(self.run_sweep)
+        run_layout.addWidget(self.run_button)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel_sweep)
+        run_layout.addWidget(self.cancel_button)
+        self.export_button = QPushButton("Export CSV")
+        self.export_button.setEnabled(False)
+        self.export_button.clicked.connect(self.export_results)
+        run_layout.addWidget(self.export_button)
+        layout.addLayout(run_layout)
+
+        self.progress_bar = QProgressBar()
+        layout.addWidget(self.progress_bar)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        view_layout = QHBoxLayout()
+        view_layout.addWidget(QLabel("Metric"))
+        self.metric_combo = QComboBox()
+        self.metric_combo.addItems(SWEEP_METRICS)
+        self.metric_combo.currentIndexChanged.connect(self.render_results)
+        view_layout.addWidget(self.metric_combo)
+        view_layout.addWidget(QLabel("View"))
+        self.view_combo = QComboBox()
+        self.view_combo.addItems(["Carpet", "Contour"])
+        self.view_combo.currentIndexChanged.connect(self.render_results)
+        view_layout.addWidget(self.view_combo)
+        view_layout.addStretch()
+        layout.addLayout(view_layout)
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setBackground("#0e141b")
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.15)
+        layout.addWidget(self.plot_widget, 1)
+
+        self.load_parameters()
+
+    def load_parameters(self):
+        # Offer every numeric input of the project as it is currently saved.
+        self._project_data = json.loads(values.write_to_json())
+        self._parameters = sweepable_parameters(self._project_data)
+        for index, (combo, _, _, _) in enumerate(self._axis_controls):
+            combo.blockSignals(True)
+            combo.clear()
+            if index > 0:
+                combo.addItem("(none)")
+            combo.addItems([parameter.name for parameter in self._parameters])
+            combo.blockSignals(False)
+            self._on_parameter_changed(index)
+
+    def _selected_parameter(self, index):
+        combo = self._axis_controls[index][0]
+        position = combo.currentIndex() - (1 if index > 0 else 0)
+        if position < 0 or position >= len(self._parameters):
+            return None
+        return self._parameters[position]
+
+    def _on_parameter_changed(self, index):
+        # Default range: the saved value +/- 10 %.
+        parameter = self._selected_parameter(index)
+        _, start, stop, count = self._axis_controls[index]
+        for widget in (start, stop, count):
+            widget.setEnabled(parameter is not None)
+        if parameter is None:
+            return
+        saved = parameter.entry(self._project_data)[parameter.label]
+        value = float(saved[0] if isinstance(saved, list) else saved)
+        start.setValue(value * 0.9)
+        stop.setValue(value * 1.1 if value else 1.0)
+
+    def run_sweep(self):
+        # Ignore clicks while a sweep is running.
+        if self._thread is not None and self._thread.isRunning():
+            return
+
+        parameters = []
+        for index in range(len(self._axis_controls)):
+            parameter = self._selected_parameter(index)
+            if parameter is None:
+                continue
+            if any(parameter is chosen for chosen in parameters):
+                QMessageBox.warning(self, "Parameter Sweep", "Choose two different parameters.")
+                return
+            _, start, stop, count = self._axis_controls[index]
+            parameter.values = sweep_range(start.value(), stop.value(), count.value())
+            parameters.append(parameter)
+        if not parameters:
+            QMessageBox.warning(self, "Parameter Sweep", "Choose a parameter to sweep.")
+            return
+
+        self._point_count = int(np.prod([len(parameter.values) for parameter in parameters]))
+        self._completed_rows = {}
+        self.results = None
+        self.progress_bar.setRange(0, self._point_count)
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"Solving {self._point_count} variants on {self.jobs_spin.value()} jobs...")
+        self._set_running(True)
+
+        self._thread = QThread(self)
+        self._worker = _SweepWorker(self._project_data, parameters, self.jobs_spin.value(), self._time_budget)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.point_finished.connect(self._on_point_finished)
+        self._worker.finished.connect(self._on_sweep_finished)
+        self._worker.failed.connect(self._on_sweep_failed)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.failed.connect(self._thread.quit)
+        self._thread.finished.connect(self._cleanup_worker)
+        self._thread.start()
+
+    def cancel_sweep(self):
+        if self._worker is not None:
+            self.status_label.setText("Cancelling: stopping the variants being solved...")
+            self._worker.cancel()
+
+    def _set_running(self, running):
+        for widget in (self.run_button, self.reload_button, self.jobs_spin):
+            widget.setEnabled(not running)
+        self.cancel_button.setEnabled(running)
+
+    def _cleanup_worker(self):
+        if self._worker is not None:
+            self._worker.deleteLater()
+            self._worker = None
+        if self._thread is not None:
+            self._thread.deleteLater()
+            self._thread = None
+
+    def _on_point_finished(self, coordinates, row):
+        self._completed_rows[tuple(coordinates)] = row
+        self.progress_bar.setValue(len(self._completed_rows))
+        if row["status"] != "finished":
+            print(f"Sweep point {coordinates} {row['status']}: {row['message']}")
+
+    def _on_sweep_finished(self, results):
+        self._set_running(False)
+        self.results = results
+        statuses = [row["status"] for row in results.rows.values()]
+        failed = statuses.count("failed")
+        # Points dropped by a cancel have no row.
+        cancelled = statuses.count("cancelled") + self._point_count - len(results)
+        self.status_label.setText(
+            f"Solved {statuses.count('finished')}/{self._point_count} variants"
+            + (f" ({failed} failed)" if failed else "") + (f" ({cancelled} cancelled)" if cancelled else ""))
+        self.export_button.setEnabled(len(results) > 0)
+        self.render_results()
+
+    def _on_sweep_failed(self, error_message):
+        self._set_running(False)
+        self.status_label.setText("Sweep failed.")
+        print(error_message)
+        QMessageBox.critical(self, "Parameter Sweep Failed", error_message)
+
+    def export_results(self):
+        if self.results is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Sweep Results", "sweep_results.csv", "CSV (*.csv)")
+        if path:
+            self.results.write_csv(path)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    #  Views
+    # ------------------------------------------------------------------------------------------------------------------
+    def render_results(self):
+        self.plot_widget.clear()
+        if self.results is None or len(self.results) == 0:
+            return
+        metric = self.metric_combo.currentText()
+        x_values, y_values, z = self.results.grid(metric)
+        names = self.results.parameter_names
+        self.plot_widget.setTitle(metric, color="#9fb8ff")
+
+        if len(names) == 1:
+            self._render_line(names[0], metric, x_values, z[:, 0])
+        elif self.view_combo.currentText() == "Contour" and len(x_values) > 1 and len(y_values) > 1:
+            self._render_contour(names, metric, x_values, y_values, z)
+        else:
+            self._render_carpet(names, metric, x_values, y_values, z)
+
+    def _render_line(self, x_name, metric, x_values, z):
+        self.plot_widget.setLabel("bottom", x_name)
+        self.plot_widget.setLabel("left", metric)
+        self.plot_widget.plot(x_values, z, pen=pg.mkPen("#5fb0ff", width=2), symbol="o", symbolBrush="#5fb0ff")
+
+    def _render_carpet(self, names, metric, x_values, y_values, z):
+        # Constant-X and constant-Y lines; each constant-Y line is shifted right so the lines form a carpet.
+        x = np.asarray(x_values, dtype=float)
+        x_span = (x.max() - x.min()) or 1.0
+        shift = CARPET_SHIFT * x_span * np.arange(len(y_values))
+        carpet_x = x[:, None] + shift[None, :]
+
+        self.plot_widget.setLabel("bottom", f"{names[0]} (shifted by {names[1]})")
+        self.plot_widget.setLabel("left", metric)
+        for j, y_value in enumerate(y_values):
+            self.plot_widget.plot(carpet_x[:, j], z[:, j], pen=pg.mkPen("#5fb0ff", width=2), symbol="o",
+                                  symbolSize=6, symbolBrush="#5fb0ff", connect="finite")
+            self._label_line(carpet_x[:, j], z[:, j], f"{y_value:g}", "#5fb0ff", last=True)
+        for i, x_value in enumerate(x_values):
+            self.plot_widget.plot(carpet_x[i, :], z[i, :], pen=pg.mkPen("#ffb347", width=1.5), connect="finite")
+            self._label_line(carpet_x[i, :], z[i, :], f"{x_value:g}", "#ffb347", last=False)
+
+    def _label_line(self, x, y, text, color, last):
+        # Put the line value next to its first or last finite point.
+        finite = np.flatnonzero(np.isfinite(y))
+        if finite.size == 0:
+            return
+        k = finite[-1] if last else finite[0]
+        label = pg.TextItem(text, color=color, anchor=(0, 0.5) if last else (0.5, 0))
+        label.setPos(x[k], y[k])
+        self.plot_widget.addItem(label)
+
+    def _render_contour(self, names, metric, x_values, y_values, z):
+        x0, x1 = float(x_values[0]), float(x_values[-1])
+        y0, y1 = float(y_values[0]), float(y_values[-1])
+        image = pg.ImageItem(z)
+        image.setColorMap(pg.colormap.get("viridis"))
+        image.setRect(x0, y0, (x1 - x0) or 1.0, (y1 - y0) or 1.0)
+        self.plot_widget.addItem(image)
+
+        finite = z[np.isfinite(z)]
+        if finite.size:
+            # Isocurves need a gap-free field; failed points take the mean so they do not create false contours.
+            filled = np.where(np.isfinite(z), z, finite.mean())
+            for level in np.linspace(finite.min(), finite.max(), CONTOUR_LEVELS + 2)[1:-1]:
+                curve = pg.IsocurveItem(data=filled, level=level, pen=pg.mkPen("w", width=1))
+                curve.setParentItem(image)
+
+        self.plot_widget.setLabel("bottom", names[0])
+        self.plot_widget.setLabel("left", names[1])
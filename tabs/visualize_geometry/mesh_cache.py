@@ -0,0 +1,93 @@
+# ===================================
+# Component Mesh Cache
+# ===================================
+# Meshes of the geometry preview, keyed by a hash of the component parameters they were generated from,
+# so a redraw only regenerates the components that changed.
+
+from collections import OrderedDict
+import hashlib
+import threading
+
+import numpy as np
+
+from tabs.visualize_geometry.vehicle import generate_vtk_polydata
+
+
+def _feed(digest, value, parents):
+    # Add a canonical form of a parameter tree to the digest.
+    if isinstance(value, dict):
+        if id(value) in parents:
+            digest.update(b"<cycle>")
+            return
+        parents.add(id(value))
+        digest.update(b"{" + type(value).__name__.encode())
+        # Data iterates over its values, so walk the items.
+        for key, item in sorted(value.items(), key=lambda pair: str(pair[0])):
+            digest.update(str(key).encode() + b":")
+            _feed(digest, item, parents)
+        digest.update(b"}")
+        parents.discard(id(value))
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _feed(digest, item, parents)
+        digest.update(b"]")
+    elif isinstance(value, np.ndarray):
+        if value.dtype == object:
+            _feed(digest, value.tolist(), parents)
+        else:
+            digest.update(f"{value.dtype.str}{value.shape}".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif value is None or isinstance(value, (str, bytes, bool, int, float, complex, np.generic)):
+        digest.update(repr(value).encode() + b";")
+    else:
+        # Functions, surrogates and other objects do not shape the mesh.
+        digest.update(type(value).__name__.encode() + b";")
+
+
+def parameter_key(*parts):
+    """Stable hash of component parameters (RCAIDE Data trees, arrays and plain values)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        _feed(digest, part, set())
+    return digest.hexdigest()
+
+
+class MeshCache:
+    """Least recently used component meshes: key -> (GEOM.PTS, VTK polydata).
+
+    Meshes are generated in the UI thread and in background rebuilds, so the entries are guarded by a lock.
+    Generation itself runs outside the lock.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._meshes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._meshes)
+
+    def get(self, key, generate):
+        """Mesh of ``key``; ``generate()`` returns the points of a mesh that is not cached."""
+        with self._lock:
+            mesh = self._meshes.get(key)
+            if mesh is not None:
+                self._meshes.move_to_end(key)
+                return mesh
+        pts = generate()
+        mesh = (pts, generate_vtk_polydata(pts))
+        with self._lock:
+            self._meshes[key] = mesh
+            while len(self._meshes) > self.max_entries:
+                self._meshes.popitem(last=False)
+        return mesh
+
+    def memory_kib(self):
+        """Approximate memory held by the cached points and polydata, in KiB."""
+        with self._lock:
+            return sum(pts.nbytes // 1024 + polydata.GetActualMemorySize() for pts, polydata in self._meshes.values())
+
+    def clear(self):
+        with self._lock:
+            self._meshes.clear()
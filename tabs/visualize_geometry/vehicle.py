@@ -1,30 +1,37 @@
 import numpy as np
 import vtk
+from vtkmodules.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray
 
 def generate_vtk_object(pts):
+    return make_vtk_actor(generate_vtk_polydata(pts))
+
+
+def generate_vtk_polydata(pts):
     comp = vtk.vtkPolyData()
     points = vtk.vtkPoints()
     polys = vtk.vtkCellArray()
-    scalars = vtk.vtkFloatArray()
 
     size = np.shape(pts)
     n_r = size[0]
     n_a = size[1]
     n = n_a * (n_r - 1)  # total number of cells
-    X = pts.reshape(n_r * n_a, 3)
+    X = np.ascontiguousarray(np.reshape(pts, (n_r * n_a, 3)), dtype=float)
     geom_pts = write_azimuthal_cell_values(X, n, n_a)
 
-    size = np.shape(X)
-    for i, fxi in enumerate(X):
-        points.InsertPoint(i, fxi)
-        scalars.InsertTuple1(i, i)
-    for pt in geom_pts:
-        polys.InsertNextCell(mkVtkIdList(pt))
+    # Hand each array to VTK in one bulk copy. Zero-copy arrays are not safe here: the numpy buffer is only
+    # referenced from the Python wrapper of the VTK array, which is dropped once this function returns.
+    points.SetData(numpy_to_vtk(X, deep=True))
+    polys.SetData(4, numpy_to_vtkIdTypeArray(geom_pts.reshape(-1), deep=True))
+    scalars = numpy_to_vtk(np.arange(n_r * n_a, dtype=np.float32), deep=True)
 
     comp.SetPoints(points)
     comp.SetPolys(polys)
     comp.GetPointData().SetScalars(scalars)
+    return comp
+
 
+def make_vtk_actor(comp):
+    # Polydata can be shared: several actors may draw the same mesh.
     mapper = vtk.vtkPolyDataMapper()
     mapper.SetInputData(comp)
     mapper.SetScalarRange(comp.GetScalarRange())
@@ -35,29 +42,66 @@ def generate_vtk_object(pts):
     return actor
 
 
-def mkVtkIdList(it):
-    vil = vtk.vtkIdList()
-    for i in it:
-        vil.InsertNextId(int(i))
-    return vil
+def make_vtk_instances(comp, placements):
+    # One actor per 4x4 placement matrix (None keeps the mesh in place). The actors share a mapper, so the
+    # mesh is stored and uploaded to the GPU once however many copies are drawn.
+    mapper = make_vtk_actor(comp).GetMapper()
+    actors = []
+    for placement in placements:
+        actor = vtk.vtkActor()
+        actor.SetMapper(mapper)
+        place_vtk_actor(actor, placement)
+        actors.append(actor)
+    return actors
+
+
+def place_vtk_actor(actor, placement):
+    # Set the 4x4 placement matrix of an actor; None draws the mesh where it is.
+    if placement is None:
+        actor.SetUserMatrix(None)
+        return
+    matrix = vtk.vtkMatrix4x4()
+    matrix.DeepCopy(np.asarray(placement, dtype=float).reshape(-1))
+    actor.SetUserMatrix(matrix)
+
+
+def mirror_placements(yz_plane_symmetric=False, xz_plane_symmetric=False, xy_plane_symmetric=False):
+    # A mesh and its mirror images. The symmetry planes apply in turn, each image reflecting the previous one.
+    placements = [None]
+    scale = np.ones(4)
+    for axis, symmetric in enumerate((yz_plane_symmetric, xz_plane_symmetric, xy_plane_symmetric)):
+        if symmetric:
+            scale[axis] = -scale[axis]
+            placements.append(np.diag(scale))
+    return placements
+
+
+def blade_placements(rotor):
+    # Every blade of a rotor is blade 0, generated at the origin, turned about the rotor axis and moved to
+    # the rotor origin.
+    num_B = int(rotor.number_of_blades)
+    body = rotor.prop_vel_to_body(np.zeros((1, 1)))[0][0]
+    origin = np.asarray(rotor.origin, dtype=float).reshape(-1)[:3]
+    placements = []
+    for i in range(num_B):
+        angle = 2 * np.pi * i / num_B
+        turn = np.array([[1, 0, 0],
+                         [0, np.cos(angle), -np.sin(angle)],
+                         [0, np.sin(angle), np.cos(angle)]])
+        placement = np.eye(4)
+        placement[:3, :3] = body.T @ turn @ body
+        placement[:3, 3] = origin
+        placements.append(placement)
+    return placements
 
 
 def write_azimuthal_cell_values(f, n_cells, n_a):
-    rlap = 0
-    adjacent_cells = np.zeros((n_cells, 4))
-
-    for i in range(n_cells):
-        if i == (n_a - 1 + n_a * rlap):
-            b = i - (n_a - 1)
-            c = i + 1
-            rlap += 1
-        else:
-            b = i + 1
-            c = i + n_a + 1
-        a = i
-        d = i + n_a
-        adjacent_cells[i, 0] = a
-        adjacent_cells[i, 1] = b
-        adjacent_cells[i, 2] = c
-        adjacent_cells[i, 3] = d
-    return adjacent_cells
\ No newline at end of file
+    # Quad (a, b, c, d) of every cell between azimuthal stations j and j + 1 of rings r and r + 1;
+    # the last station of a ring wraps around to the first.
+    i = np.arange(n_cells, dtype=np.int64)
+    ring_start = i - i % n_a
+    a = i
+    b = ring_start + (i + 1) % n_a
+    c = b + n_a
+    d = i + n_a
+    return np.stack((a, b, c, d), axis=1)
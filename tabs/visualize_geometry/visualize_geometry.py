@@ -10,17 +10,20 @@ from RCAIDE.Library.Methods.Geometry.Planform                   import  fuselage
 from RCAIDE.Library.Methods.Geometry.LOPA                       import  compute_layout_of_passenger_accommodations 
  
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QTreeWidget, QPushButton, QTreeWidgetItem, QHeaderView, QLabel, QToolBar, QColorDialog, QSpacerItem, QSizePolicy, QFrame, QLineEdit
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QThread, pyqtSignal
 from tabs import TabWidget
 from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
 from tabs.visualize_geometry import vehicle
+from tabs.visualize_geometry.mesh_cache import MeshCache, parameter_key
 from PyQt6.QtGui import QIcon
 
 import matplotlib.colors as mcolors 
 import vtk
 import values
 import os
-from copy import deepcopy 
+import traceback
+from collections import namedtuple
+from copy import copy, deepcopy 
 
 class CustomInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
     def __init__(self, parent=None):
@@ -182,6 +185,24 @@ class CustomPanInteractorStyle(vtk.vtkInteractorStyleTrackballCamera):
 
         interactor.GetRenderWindow().Render()  
 
+class _MeshWorker(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, geometry, mesh_cache):
+        super().__init__()
+        self._geometry = geometry
+        self._mesh_cache = mesh_cache
+
+    def run(self):
+        # Geometry analysis and meshing only; actors are made on the UI thread.
+        try:
+            meshes = generate_vehicle_meshes(self._geometry, self._mesh_cache)
+        except Exception:
+            self.failed.emit(traceback.format_exc())
+            return
+        self.finished.emit(meshes)
+
 class VisualizeGeometryWidget(TabWidget):
     def __init__(self):
         super(VisualizeGeometryWidget, self).__init__()
@@ -205,6 +226,15 @@ class VisualizeGeometryWidget(TabWidget):
         self.rotor_actors  = []
         self.boom_actors = []
         self.fuel_tank_actors = []     
+        # Component meshes of previous displays, so unchanged components are not regenerated.
+        self.mesh_cache = MeshCache()
+        # Background rebuilds started by request_update.
+        self._prepared_meshes = None
+        self._mesh_thread = None
+        self._mesh_worker = None
+        self._update_pending = False
+        # Actors of every mesh of the scene, updated in place on each redraw: (mesh, actors) per mesh.
+        self._scene_slots = []
 
         solve_button = QPushButton("Display")
         solve_button.clicked.connect(self.run_solve)
@@ -299,6 +329,11 @@ class VisualizeGeometryWidget(TabWidget):
         self.toolbar.addWidget(self.top_button)
         self.toolbar.addWidget(self.isometric_button)
 
+        # Scene size readout, to check that redraws do not accumulate renderers or actors
+        self.scene_readout = QLabel()
+        self.scene_readout.setStyleSheet("color: grey; padding-left: 8px;")
+        self.toolbar.addWidget(self.scene_readout)
+
         return self.toolbar
     
     def enable_pan_mode(self):
@@ -388,227 +423,100 @@ class VisualizeGeometryWidget(TabWidget):
         self.selected_option = item.text(0)       
      
     def run_solve(self):
-        wing_color                  = 'grey'  
-        fuselage_color              = 'grey'  
-        nacelle_color               = 'grey' 
-        boom_color                  = 'grey' 
-        fuel_tank_color             = 'orange'  
-        rotor_color                 = 'black'      
-        wing_opacity                = 0.5  
-        fuselage_opacity            = 0.5 
-        nacelle_opacity             = 1.0 
-        fuel_tank_opacity           = 0.5 
-        rotor_opacity               = 1.0  
-        number_of_airfoil_points    = 101 
-        tessellation                = 96 
-        boom_opacity                = 1.0
         camera_eye_x  = -1 
         camera_eye_y  = -1 
         camera_eye_z  = 0.35  
         
-        fuel_tank_rgb_color         = mcolors.to_rgb(fuel_tank_color)     
-        wing_rgb_color              = mcolors.to_rgb(wing_color)
-        fuselage_rgb_color          = mcolors.to_rgb(fuselage_color) 
-        nacelle_rgb_color           = mcolors.to_rgb(nacelle_color) 
-        rotor_rgb_color             = mcolors.to_rgb(rotor_color)
-        boom_rgb_color              = mcolors.to_rgb(boom_color)
-        
-        self.renderer = vtk.vtkRenderer()
-        self.vtkWidget.GetRenderWindow().AddRenderer(self.renderer)
-        self.render_window_interactor = self.vtkWidget.GetRenderWindow().GetInteractor()
-
-        # Number of points for airfoil
-        geometry =  deepcopy(values.vehicle)
-
-        # -------------------------------------------------------------------------
-        # Run Geoemtry Analysis Functions
-        # -------------------------------------------------------------------------   
-        for wing in geometry.wings:  
-            if isinstance(wing, RCAIDE.Library.Components.Wings.Blended_Wing_Body): 
-                bwb_wing_planform(wing) 
-            else: 
-                wing_planform(wing)  
-                         
-        compute_fuel_volume(geometry)
-
-        for fuselage in  geometry.fuselages:               
-            compute_layout_of_passenger_accommodations(fuselage)
-            fuselage_planform(fuselage) 
-    
-        # -------------------------------------------------------------------------  
-        # Plot wings
-        # -------------------------------------------------------------------------
-        for wing in geometry.wings:
-            n_segments = len(wing.segments)
-            dim        = n_segments if n_segments > 0 else 2
-            GEOM       = generate_3d_wing_points(wing, number_of_airfoil_points, dim)
-            make_object(self.renderer,self.wing_actors, GEOM,wing_rgb_color,wing_opacity)
-            if wing.yz_plane_symmetric: 
-                GEOM.PTS[:, :, 0] = -GEOM.PTS[:, :, 0]
-                make_object(self.renderer, self.wing_actors,GEOM,wing_rgb_color,wing_opacity)
-            if wing.xz_plane_symmetric: 
-                GEOM.PTS[:, :, 1] = -GEOM.PTS[:, :, 1]
-                make_object(self.renderer,self.wing_actors, GEOM,wing_rgb_color,wing_opacity)
-            if wing.xy_plane_symmetric: 
-                GEOM.PTS[:, :, 2] = -GEOM.PTS[:, :, 2]
-                make_object(self.renderer,self.wing_actors, GEOM,wing_rgb_color,wing_opacity)
-    
-        # -------------------------------------------------------------------------  
-        # Plot fuselage
-        # -------------------------------------------------------------------------  
-        for fuselage in geometry.fuselages:
-            GEOM = generate_3d_fuselage_points(fuselage, tessellation)
-            make_object(self.renderer, self.fuselage_actors,GEOM, fuselage_rgb_color,fuselage_opacity)
-            
-        # -------------------------------------------------------------------------  
-        # Plot boom
-        # -------------------------------------------------------------------------  
-        for boom in geometry.booms:
-            GEOM = generate_3d_fuselage_points(boom, tessellation)
-            make_object(self.renderer, self.boom_actors, GEOM, boom_rgb_color,boom_opacity)
-    
-        # -------------------------------------------------------------------------  
-        # Plot Nacelle, Rotors and Fuel Tanks 
-        # ------------------------------------------------------------------------- 
-        # print(geometry.networks)
-
-        #plotting top-level nacelles (not attached to propulsors)
-        for nacelle in geometry.nacelles:
-            # if type(nacelle) == RCAIDE.Library.Components.Nacelles.Stack_Nacelle:
-            #     GEOM = generate_3d_stack_nacelle_points(nacelle, tessellation=tessellation, number_of_airfoil_points=number_of_airfoil_points)
-            # elif type(nacelle) == RCAIDE.Library.Components.Nacelles.Body_of_Revolution_Nacelle:
-            GEOM = generate_3d_BOR_nacelle_points(nacelle, tessellation=tessellation, number_of_airfoil_points=number_of_airfoil_points)
-            # else:
-            #     GEOM = generate_3d_basic_nacelle_points(nacelle, tessellation=tessellation, number_of_airfoil_points=number_of_airfoil_points)
-            make_object(self.renderer, self.nacelle_actors, GEOM, nacelle_rgb_color, nacelle_opacity)
-        
-        for network in geometry.networks: 
-            for propulsor in network.propulsors:  
-                if 'nacelle' in propulsor: 
-                    if propulsor.nacelle !=  None: 
-                        
-                        if type(propulsor.nacelle) == RCAIDE.Library.Components.Nacelles.Stack_Nacelle: 
-                            GEOM = generate_3d_stack_nacelle_points(propulsor.nacelle,tessellation = tessellation,number_of_airfoil_points = number_of_airfoil_points)
-                        elif type(propulsor.nacelle) == RCAIDE.Library.Components.Nacelles.Body_of_Revolution_Nacelle: 
-                            GEOM = generate_3d_BOR_nacelle_points(propulsor.nacelle,tessellation = tessellation,number_of_airfoil_points = number_of_airfoil_points)
-                        else:
-                            GEOM= generate_3d_basic_nacelle_points(propulsor.nacelle,tessellation = tessellation,number_of_airfoil_points = number_of_airfoil_points)
-                        make_object(self.renderer,self.nacelle_actors,  GEOM, nacelle_rgb_color,nacelle_opacity)
-                        
-                if 'rotor' in propulsor:  
-                    rot       = propulsor.rotor
-                    rot_x     = rot.orientation_euler_angles[0]
-                    rot_y     = rot.orientation_euler_angles[1]
-                    rot_z     = rot.orientation_euler_angles[2]
-                    num_B     = int(rot.number_of_blades) 
-                    if rot.radius_distribution is None:
-                        make_actuator_disc(self.renderer, rot.hub_radius, rot.tip_radius, rot.origin, rot_x,rot_y,rot_z, rotor_rgb_color,rotor_opacity) 
-                    else:
-                        dim       = len(rot.radius_distribution) 
-                        for i in range(num_B):
-                            GEOM = generate_3d_blade_points(rot,number_of_airfoil_points,dim,i)
-                            make_object(self.renderer,self.rotor_actors,  GEOM, rotor_rgb_color,rotor_opacity) 
-    
-                if 'propeller' in propulsor:
-                    prop      = propulsor.propeller
-                    rot_x     = prop.orientation_euler_angles[0]
-                    rot_y     = np.pi / 2 +  prop.orientation_euler_angles[1]
-                    rot_z     = prop.orientation_euler_angles[2]
-                    num_B     = int(prop.number_of_blades) 
-                    if prop.radius_distribution is None:
-                        make_actuator_disc(self.renderer, prop.hub_radius, prop.tip_radius, prop.origin, rot_x,rot_y,rot_z,rotor_rgb_color,rotor_opacity) 
-                    else:
-                        dim       = len(prop.radius_distribution)
-                        for i in range(num_B):
-                            GEOM = generate_3d_blade_points(prop,number_of_airfoil_points,dim,i) 
-                            make_object(self.renderer,self.rotor_actors, GEOM, rotor_rgb_color,rotor_opacity) 
-    
-            for fuel_line in network.fuel_lines:        
-                for fuel_tank in fuel_line.fuel_tanks:   
-                    if fuel_tank.wing_tag != None:
-                        wing = geometry.wings[fuel_tank.wing_tag]
-                        
-                        if issubclass(type(fuel_tank), RCAIDE.Library.Components.Powertrain.Sources.Fuel_Tanks.Non_Integral_Tank):
-                            GEOM  = generate_non_integral_fuel_tank_points(fuel_tank,tessellation ) 
-                            make_object(self.renderer,self.fuel_tank_actors, GEOM,  fuel_tank_rgb_color, fuel_tank_opacity) 
-        
-                            if wing.xz_plane_symmetric: 
-                                GEOM.PTS[:, :, 1] = -GEOM.PTS[:, :, 1] 
-                                make_object(self.renderer,self.fuel_tank_actors, GEOM,  fuel_tank_rgb_color, fuel_tank_opacity)
-                            
-                        if type(fuel_tank) == RCAIDE.Library.Components.Powertrain.Sources.Fuel_Tanks.Integral_Tank: 
-                            segment_list = [] 
-                            segment_tags = list(wing.segments.keys())     
-                            for i in range(len(wing.segments) - 1):
-                                seg =  wing.segments[segment_tags[i]]
-                                next_seg =  wing.segments[segment_tags[i+1]]
-                                if seg.has_fuel_tank:
-                                    if seg.tag not in segment_list:
-                                        segment_list.append(seg.tag)
-                                    if next_seg.tag not in segment_list:
-                                        segment_list.append(next_seg.tag) 
-    
-                            if len(wing.segments)>0:
-                                dim =  len(segment_list)
-                            else:
-                                dim = 2 
-    
-                            if  len(segment_list) == 0 and len(wing.segments) > 0:
-                                raise AttributeError('Fuel tank defined on segmented wing but no segments have "tank" attribute = True') 
-                            else:   
-                                GEOM = generate_integral_wing_tank_points(wing,5,dim,segment_list)
-                                make_object(self.renderer, self.fuel_tank_actors,GEOM, fuel_tank_rgb_color, fuel_tank_opacity)  
-                                if wing.xz_plane_symmetric:
-                                    GEOM.PTS[:, :, 1] = -GEOM.PTS[:, :, 1] 
-                                    make_object(self.renderer,self.fuel_tank_actors, GEOM,fuel_tank_rgb_color, fuel_tank_opacity) 
-    
-                    elif fuel_tank.fuselage_tag != None:
-                        fuselage = geometry.fuselages[fuel_tank.fuselage_tag]
-                        if type(fuel_tank) == RCAIDE.Library.Components.Powertrain.Sources.Fuel_Tanks.Integral_Tank:  
-                            segment_list = [] 
-                            segment_tags = list(fuselage.segments.keys())     
-                            for i in range(len(fuselage.segments) - 1):
-                                seg =  fuselage.segments[segment_tags[i]]
-                                next_seg =  fuselage.segments[segment_tags[i+1]]
-                                if seg.has_fuel_tank: 
-                                    segment_list.append(seg.tag)
-                                    if next_seg.tag not in segment_list:
-                                        segment_list.append(next_seg.tag)  
-    
-                            GEOM  = generate_integral_fuel_tank_points(fuselage,fuel_tank, segment_list,tessellation )
-                            make_object(self.renderer,self.fuel_tank_actors, GEOM,  fuel_tank_rgb_color, fuel_tank_opacity) 
-    
-                    elif issubclass(type(fuel_tank), RCAIDE.Library.Components.Powertrain.Sources.Fuel_Tanks.Non_Integral_Tank):
-                        GEOM  = generate_non_integral_fuel_tank_points(fuel_tank,tessellation ) 
-                        make_object(self.renderer,self.fuel_tank_actors, GEOM,  fuel_tank_rgb_color, fuel_tank_opacity) 
-    
-                        if wing.xz_plane_symmetric: 
-                            GEOM.PTS[:, :, 1] = -GEOM.PTS[:, :, 1] 
-                            make_object(self.renderer, self.fuel_tank_actors, GEOM,  fuel_tank_rgb_color, fuel_tank_opacity)         
+        # One renderer for the lifetime of the widget; redraws update its actors in place.
+        if self.renderer is None:
+            self.renderer = vtk.vtkRenderer()
+            self.vtkWidget.GetRenderWindow().AddRenderer(self.renderer)
+            self.render_window_interactor = self.vtkWidget.GetRenderWindow().GetInteractor()
+
+            # Use the custom interactor style
+            custom_style = CustomInteractorStyle()
+            self.render_window_interactor.SetInteractorStyle(custom_style)
+
+            # self.vtkWidget.show()
+            # Start the VTK interactor
+            self.render_window_interactor.Initialize()
+            self.render_window_interactor.Start()
+            self.update_toolbar()
+
+        # Use the meshes of a finished background rebuild, or generate them now.
+        meshes = self._prepared_meshes
+        self._prepared_meshes = None
+        if meshes is None:
+            meshes = generate_vehicle_meshes(deepcopy(values.vehicle), self.mesh_cache)
+        self.update_scene(meshes)
                         
         # Set camera and background
-        camera = vtk.vtkCamera()
+        camera = self.renderer.GetActiveCamera()
         camera.SetPosition(camera_eye_x, camera_eye_y, camera_eye_z)
         camera.SetFocalPoint(0, 0, 0)
         camera.SetViewUp(0, 0, 1)
 
-        self.renderer.SetActiveCamera(camera)
         self.renderer.ResetCamera()
         self.renderer.SetBackground(1.0, 1.0, 1.0)  # Background color
 
-        # Use the custom interactor style
-        custom_style = CustomInteractorStyle()
-        self.render_window_interactor.SetInteractorStyle(custom_style)
-
-        # self.vtkWidget.show()
-        # Start the VTK interactor
-        self.render_window_interactor.Initialize()
-        self.render_window_interactor.Start()
         self.get_camera=self.renderer.GetActiveCamera()
-        self.update_toolbar()
         if values.vehicle.wings:
             self.colorbar_widget.update_parts(self.part_actors)
         self.isometric_function()
+        self.update_scene_readout()
+
+    def update_scene(self, meshes):
+        # Show ``meshes`` with the actors of the previous redraw where possible. A slot keeps its actors while
+        # it shows the same polydata the same number of times; they are only re-placed and re-styled.
+        slots = []
+        for index, mesh in enumerate(meshes):
+            previous = self._scene_slots[index] if index < len(self._scene_slots) else None
+            if (previous is not None and isinstance(mesh, ComponentMesh) and isinstance(previous[0], ComponentMesh)
+                    and previous[0].actor_group == mesh.actor_group and previous[0].polydata is mesh.polydata
+                    and len(previous[1]) == len(mesh.placements)):
+                actors = previous[1]
+                for actor, placement in zip(actors, mesh.placements):
+                    # Drop offsets from dragging the aircraft, as a new actor would.
+                    actor.SetPosition(0, 0, 0)
+                    vehicle.place_vtk_actor(actor, placement)
+                    style_object(actor, mesh.rgb_color, mesh.opacity)
+            else:
+                if previous is not None:
+                    for actor in previous[1]:
+                        self.renderer.RemoveActor(actor)
+                if isinstance(mesh, ActuatorDisc):
+                    actors = [make_actuator_disc(self.renderer, *mesh)]
+                else:
+                    actors = make_object(self.renderer, [], mesh.polydata, mesh.rgb_color, mesh.opacity,
+                                         mesh.placements)
+            slots.append((mesh, actors))
+        for mesh, actors in self._scene_slots[len(meshes):]:
+            for actor in actors:
+                self.renderer.RemoveActor(actor)
+        self._scene_slots = slots
+
+        # The actor groups are shared with the colorbar and other tools, so refill them in place.
+        for actor_group in ("wing_actors", "fuselage_actors", "nacelle_actors", "rotor_actors", "boom_actors",
+                            "fuel_tank_actors"):
+            getattr(self, actor_group).clear()
+        for mesh, actors in slots:
+            if isinstance(mesh, ComponentMesh):
+                getattr(self, mesh.actor_group).extend(actors)
+
+    def scene_statistics(self):
+        # Renderer, actor and cached mesh counts; they stay flat across redraws of the same vehicle.
+        render_window = self.vtkWidget.GetRenderWindow()
+        return {
+            "renderers": render_window.GetRenderers().GetNumberOfItems(),
+            "actors": self.renderer.GetActors().GetNumberOfItems() if self.renderer is not None else 0,
+            "meshes": len(self.mesh_cache),
+            "mesh_memory_kib": self.mesh_cache.memory_kib(),
+        }
+
+    def update_scene_readout(self):
+        stats = self.scene_statistics()
+        self.scene_readout.setText(f"Renderers: {stats['renderers']}  Actors: {stats['actors']}  "
+                                   f"Meshes: {stats['meshes']} ({stats['mesh_memory_kib'] / 1024:.1f} MB)")
 
     def update_toolbar(self):
         self.zoom_out_button.clicked.connect(self.zoom_out)
@@ -622,6 +530,54 @@ class VisualizeGeometryWidget(TabWidget):
     def update_layout(self):
         self.run_solve()
 
+    def request_update(self):
+        # Rebuild the scene from meshes generated in a background thread. Requests made while a rebuild is
+        # running coalesce into one more rebuild of the latest vehicle.
+        self._update_pending = True
+        if self._mesh_thread is None:
+            self._start_mesh_worker()
+
+    def _start_mesh_worker(self):
+        self._update_pending = False
+        # Snapshot the vehicle now: it keeps being edited while the worker runs.
+        self._mesh_thread = QThread(self)
+        self._mesh_worker = _MeshWorker(deepcopy(values.vehicle), self.mesh_cache)
+        self._mesh_worker.moveToThread(self._mesh_thread)
+        self._mesh_thread.started.connect(self._mesh_worker.run)
+        self._mesh_worker.finished.connect(self._on_meshes_ready)
+        self._mesh_worker.failed.connect(self._on_meshes_failed)
+        self._mesh_worker.finished.connect(self._mesh_thread.quit)
+        self._mesh_worker.failed.connect(self._mesh_thread.quit)
+        self._mesh_thread.finished.connect(self._cleanup_mesh_worker)
+        self._mesh_thread.start()
+
+    def stop_updates(self):
+        # Drop pending rebuilds and wait for a running one, e.g. before the render window is finalized.
+        self._update_pending = False
+        if self._mesh_thread is not None:
+            self._mesh_worker.finished.disconnect(self._on_meshes_ready)
+            self._mesh_thread.quit()
+            self._mesh_thread.wait()
+
+    def _on_meshes_ready(self, meshes):
+        # Meshes of an outdated vehicle are dropped; the pending rebuild replaces them.
+        if self._update_pending:
+            return
+        self._prepared_meshes = meshes
+        self.run_solve()
+
+    def _on_meshes_failed(self, error_message):
+        # Keep showing the last vehicle that could be meshed.
+        print(f"Geometry preview update failed:\n{error_message}")
+
+    def _cleanup_mesh_worker(self):
+        self._mesh_worker.deleteLater()
+        self._mesh_worker = None
+        self._mesh_thread.deleteLater()
+        self._mesh_thread = None
+        if self._update_pending:
+            self._start_mesh_worker()
+
     plot_options = {
         "Pre Built": [
             "Concorde",
@@ -630,9 +586,235 @@ class VisualizeGeometryWidget(TabWidget):
 def get_widget() -> QWidget:
     return VisualizeGeometryWidget()
 
-def make_object(renderer, actor_group,  GEOM,  rgb_color, opacity): 
+# Mesh of a component: the actors of ``actor_group`` (a VisualizeGeometryWidget attribute) draw ``polydata``
+# once per placement.
+ComponentMesh = namedtuple("ComponentMesh", ["actor_group", "polydata", "placements", "rgb_color", "opacity"])
+# Arguments of make_actuator_disc after the renderer.
+ActuatorDisc = namedtuple("ActuatorDisc", ["inner_radius", "outer_radius", "origin", "rot_x", "rot_y", "rot_z",
+                                           "rgb_color", "opacity"])
+
+def generate_vehicle_meshes(geometry, mesh_cache):
+    """Run the geometry analysis on ``geometry``, a copy of the vehicle, and generate every component mesh.
+
+    Touches no widget or renderer, so it can run in a background thread. Returns the ComponentMesh and
+    ActuatorDisc records that ``VisualizeGeometryWidget.run_solve`` turns into actors.
+    """
+    wing_color                  = 'grey'  
+    fuselage_color              = 'grey'  
+    nacelle_color               = 'grey' 
+    boom_color                  = 'grey' 
+    fuel_tank_color             = 'orange'  
+    rotor_color                 = 'black'      
+    wing_opacity                = 0.5  
+    fuselage_opacity            = 0.5 
+    nacelle_opacity             = 1.0 
+    fuel_tank_opacity           = 0.5 
+    rotor_opacity               = 1.0  
+    number_of_airfoil_points    = 101 
+    tessellation                = 96 
+    boom_opacity                = 1.0
+    
+    fuel_tank_rgb_color         = mcolors.to_rgb(fuel_tank_color)     
+    wing_rgb_color              = mcolors.to_rgb(wing_color)
+    fuselage_rgb_color          = mcolors.to_rgb(fuselage_color) 
+    nacelle_rgb_color           = mcolors.to_rgb(nacelle_color) 
+    rotor_rgb_color             = mcolors.to_rgb(rotor_color)
+    boom_rgb_color              = mcolors.to_rgb(boom_color)
+
+    meshes = []
+
+    # -------------------------------------------------------------------------
+    # Run Geoemtry Analysis Functions
+    # -------------------------------------------------------------------------   
+    for wing in geometry.wings:  
+        if isinstance(wing, RCAIDE.Library.Components.Wings.Blended_Wing_Body): 
+            bwb_wing_planform(wing) 
+        else: 
+            wing_planform(wing)  
+                     
+    compute_fuel_volume(geometry)
+
+    for fuselage in  geometry.fuselages:               
+        compute_layout_of_passenger_accommodations(fuselage)
+        fuselage_planform(fuselage) 
+
+    # -------------------------------------------------------------------------  
+    # Plot wings
+    # -------------------------------------------------------------------------
+    for wing in geometry.wings:
+        n_segments = len(wing.segments)
+        dim        = n_segments if n_segments > 0 else 2
+        key        = parameter_key('wing', wing, number_of_airfoil_points, dim)
+        placements = vehicle.mirror_placements(wing.yz_plane_symmetric, wing.xz_plane_symmetric, wing.xy_plane_symmetric)
+        meshes.append(cached_mesh(mesh_cache, 'wing_actors', key,
+                                  lambda: generate_3d_wing_points(wing, number_of_airfoil_points, dim).PTS,
+                                  wing_rgb_color, wing_opacity, placements))
+
+    # -------------------------------------------------------------------------  
+    # Plot fuselage
+    # -------------------------------------------------------------------------  
+    for fuselage in geometry.fuselages:
+        key = parameter_key('fuselage', fuselage, tessellation)
+        meshes.append(cached_mesh(mesh_cache, 'fuselage_actors', key,
+                                  lambda: generate_3d_fuselage_points(fuselage, tessellation).PTS, fuselage_rgb_color, fuselage_opacity))
+        
+    # -------------------------------------------------------------------------  
+    # Plot boom
+    # -------------------------------------------------------------------------  
+    for boom in geometry.booms:
+        key = parameter_key('fuselage', boom, tessellation)
+        meshes.append(cached_mesh(mesh_cache, 'boom_actors', key,
+                                  lambda: generate_3d_fuselage_points(boom, tessellation).PTS, boom_rgb_color, boom_opacity))
+
+    # -------------------------------------------------------------------------  
+    # Plot Nacelle, Rotors and Fuel Tanks 
+    # ------------------------------------------------------------------------- 
+    # print(geometry.networks)
+
+    #plotting top-level nacelles (not attached to propulsors)
+    for nacelle in geometry.nacelles:
+        # if type(nacelle) == RCAIDE.Library.Components.Nacelles.Stack_Nacelle:
+        #     GEOM = generate_3d_stack_nacelle_points(nacelle, tessellation=tessellation, number_of_airfoil_points=number_of_airfoil_points)
+        # elif type(nacelle) == RCAIDE.Library.Components.Nacelles.Body_of_Revolution_Nacelle:
+        # else:
+        #     GEOM = generate_3d_basic_nacelle_points(nacelle, tessellation=tessellation, number_of_airfoil_points=number_of_airfoil_points)
+        key = parameter_key('BOR nacelle', nacelle, tessellation, number_of_airfoil_points)
+        meshes.append(cached_mesh(mesh_cache, 'nacelle_actors', key,
+                                  lambda: generate_3d_BOR_nacelle_points(nacelle, tessellation=tessellation, number_of_airfoil_points=number_of_airfoil_points).PTS,
+                                  nacelle_rgb_color, nacelle_opacity))
+    
+    for network in geometry.networks: 
+        for propulsor in network.propulsors:  
+            if 'nacelle' in propulsor: 
+                if propulsor.nacelle !=  None: 
+                    
+                    nacelle = propulsor.nacelle
+                    if type(nacelle) == RCAIDE.Library.Components.Nacelles.Stack_Nacelle: 
+                        generate_nacelle_points = generate_3d_stack_nacelle_points
+                    elif type(nacelle) == RCAIDE.Library.Components.Nacelles.Body_of_Revolution_Nacelle: 
+                        generate_nacelle_points = generate_3d_BOR_nacelle_points
+                    else:
+                        generate_nacelle_points = generate_3d_basic_nacelle_points
+                    key = parameter_key('nacelle', nacelle, tessellation, number_of_airfoil_points)
+                    meshes.append(cached_mesh(mesh_cache, 'nacelle_actors', key,
+                                              lambda: generate_nacelle_points(nacelle, tessellation = tessellation, number_of_airfoil_points = number_of_airfoil_points).PTS,
+                                              nacelle_rgb_color, nacelle_opacity))
+                    
+            if 'rotor' in propulsor:  
+                rot       = propulsor.rotor
+                rot_x     = rot.orientation_euler_angles[0]
+                rot_y     = rot.orientation_euler_angles[1]
+                rot_z     = rot.orientation_euler_angles[2]
+                if rot.radius_distribution is None:
+                    meshes.append(ActuatorDisc(rot.hub_radius, rot.tip_radius, rot.origin, rot_x,rot_y,rot_z, rotor_rgb_color,rotor_opacity)) 
+                else:
+                    meshes.append(blade_mesh(mesh_cache, 'rotor_actors', rot, number_of_airfoil_points,
+                                             rotor_rgb_color, rotor_opacity))
+
+            if 'propeller' in propulsor:
+                prop      = propulsor.propeller
+                rot_x     = prop.orientation_euler_angles[0]
+                rot_y     = np.pi / 2 +  prop.orientation_euler_angles[1]
+                rot_z     = prop.orientation_euler_angles[2]
+                if prop.radius_distribution is None:
+                    meshes.append(ActuatorDisc(prop.hub_radius, prop.tip_radius, prop.origin, rot_x,rot_y,rot_z,rotor_rgb_color,rotor_opacity)) 
+                else:
+                    meshes.append(blade_mesh(mesh_cache, 'rotor_actors', prop, number_of_airfoil_points,
+                                             rotor_rgb_color, rotor_opacity))
+
+        for fuel_line in network.fuel_lines:        
+            for fuel_tank in fuel_line.fuel_tanks:   
+                if fuel_tank.wing_tag != None:
+                    wing = geometry.wings[fuel_tank.wing_tag]
+                    
+                    if issubclass(type(fuel_tank), RCAIDE.Library.Components.Powertrain.Sources.Fuel_Tanks.Non_Integral_Tank):
+                        key = parameter_key('non-integral tank', fuel_tank, tessellation)
+                        placements = vehicle.mirror_placements(xz_plane_symmetric=wing.xz_plane_symmetric)
+                        meshes.append(cached_mesh(mesh_cache, 'fuel_tank_actors', key,
+                                                  lambda: generate_non_integral_fuel_tank_points(fuel_tank, tessellation).PTS,
+                                                  fuel_tank_rgb_color, fuel_tank_opacity, placements))
+                        
+                    if type(fuel_tank) == RCAIDE.Library.Components.Powertrain.Sources.Fuel_Tanks.Integral_Tank: 
+                        segment_list = [] 
+                        segment_tags = list(wing.segments.keys())     
+                        for i in range(len(wing.segments) - 1):
+                            seg =  wing.segments[segment_tags[i]]
+                            next_seg =  wing.segments[segment_tags[i+1]]
+                            if seg.has_fuel_tank:
+                                if seg.tag not in segment_list:
+                                    segment_list.append(seg.tag)
+                                if next_seg.tag not in segment_list:
+                                    segment_list.append(next_seg.tag) 
 
-    actor = vehicle.generate_vtk_object(GEOM.PTS)
+                        if len(wing.segments)>0:
+                            dim =  len(segment_list)
+                        else:
+                            dim = 2 
+
+                        if  len(segment_list) == 0 and len(wing.segments) > 0:
+                            raise AttributeError('Fuel tank defined on segmented wing but no segments have "tank" attribute = True') 
+                        else:   
+                            key = parameter_key('integral wing tank', wing, dim, segment_list)
+                            placements = vehicle.mirror_placements(xz_plane_symmetric=wing.xz_plane_symmetric)
+                            meshes.append(cached_mesh(mesh_cache, 'fuel_tank_actors', key,
+                                                      lambda: generate_integral_wing_tank_points(wing, 5, dim, segment_list).PTS,
+                                                      fuel_tank_rgb_color, fuel_tank_opacity, placements))
+
+                elif fuel_tank.fuselage_tag != None:
+                    fuselage = geometry.fuselages[fuel_tank.fuselage_tag]
+                    if type(fuel_tank) == RCAIDE.Library.Components.Powertrain.Sources.Fuel_Tanks.Integral_Tank:  
+                        segment_list = [] 
+                        segment_tags = list(fuselage.segments.keys())     
+                        for i in range(len(fuselage.segments) - 1):
+                            seg =  fuselage.segments[segment_tags[i]]
+                            next_seg =  fuselage.segments[segment_tags[i+1]]
+                            if seg.has_fuel_tank: 
+                                segment_list.append(seg.tag)
+                                if next_seg.tag not in segment_list:
+                                    segment_list.append(next_seg.tag)  
+
+                        key = parameter_key('integral fuselage tank', fuselage, fuel_tank, segment_list, tessellation)
+                        meshes.append(cached_mesh(mesh_cache, 'fuel_tank_actors', key,
+                                                  lambda: generate_integral_fuel_tank_points(fuselage, fuel_tank, segment_list, tessellation).PTS,
+                                                  fuel_tank_rgb_color, fuel_tank_opacity))
+
+                elif issubclass(type(fuel_tank), RCAIDE.Library.Components.Powertrain.Sources.Fuel_Tanks.Non_Integral_Tank):
+                    key = parameter_key('non-integral tank', fuel_tank, tessellation)
+                    placements = vehicle.mirror_placements(xz_plane_symmetric=wing.xz_plane_symmetric)
+                    meshes.append(cached_mesh(mesh_cache, 'fuel_tank_actors', key,
+                                              lambda: generate_non_integral_fuel_tank_points(fuel_tank, tessellation).PTS,
+                                              fuel_tank_rgb_color, fuel_tank_opacity, placements))
+
+    return meshes
+
+
+def cached_mesh(mesh_cache, actor_group, key, generate, rgb_color, opacity, placements=(None,)):
+    # Mesh of a component, generated only when it is not in the cache.
+    pts, polydata = mesh_cache.get(key, generate)
+    return ComponentMesh(actor_group, polydata, placements, rgb_color, opacity)
+
+def blade_mesh(mesh_cache, actor_group, rotor, number_of_airfoil_points, rgb_color, opacity):
+    # All blades of a rotor are instances of one blade mesh generated at the origin, so rotors that only
+    # differ in tag and origin share a single mesh.
+    dim      = len(rotor.radius_distribution)
+    design   = {tag: value for tag, value in rotor.items() if tag not in ('tag', 'origin')}
+    key      = parameter_key('blade', type(rotor).__name__, design, number_of_airfoil_points, dim)
+    centered = copy(rotor)
+    centered.origin = [[0.0, 0.0, 0.0]]
+    return cached_mesh(mesh_cache, actor_group, key,
+                       lambda: generate_3d_blade_points(centered, number_of_airfoil_points, dim, 0).PTS,
+                       rgb_color, opacity, vehicle.blade_placements(rotor))
+
+def make_object(renderer, actor_group,  polydata,  rgb_color, opacity, placements=(None,)): 
+
+    actors = vehicle.make_vtk_instances(polydata, placements)
+    for actor in actors:
+        style_object(actor, rgb_color, opacity)
+        renderer.AddActor(actor)
+        actor_group.append(actor) 
+    return actors
+
+def style_object(actor, rgb_color, opacity):
 
     # Set color of fuselage
     mapper = actor.GetMapper()
@@ -644,9 +826,6 @@ def make_object(renderer, actor_group,  GEOM,  rgb_color, opacity):
     prop.SetSpecular(0.3)     # gives a soft highlight
     prop.SetSpecularPower(20)
     prop.SetOpacity(opacity)
-    renderer.AddActor(actor)
-    actor_group.append(actor) 
-    return
 
 def make_actuator_disc(renderer, inner_radius, outer_radius, origin, rot_x,rot_y,rot_z, rgb_color, opacity): 
     
@@ -678,7 +857,7 @@ def make_actuator_disc(renderer, inner_radius, outer_radius, origin, rot_x,rot_y
     actor.GetProperty().SetOpacity(opacity)
     actor.SetPosition( origin[0][0],  origin[0][1],  origin[0][2]) 
     renderer.AddActor(actor)
-    return
+    return actor
 
 # ---------------------------------------
 # Load Visualize Geometry feature plugins
@@ -212,3 +212,35 @@ class Units:
 
     class String:
         pass
+
+
+# Units whose saved values are stored as-is (no conversion to SI).
+_UNCONVERTED_UNITS = (Units.Boolean, Units.Count, Units.Heading, Units.File, Units.String)
+# (scale, offset) pairs per unit class, filled on first use.
+_unit_conversion_tables = {}
+
+
+def unit_conversion_table(unit_class):
+    """Return the (scale, offset) to-SI conversion of each entry of ``unit_class.unit_list``."""
+    table = _unit_conversion_tables.get(unit_class)
+    if table is None:
+        # Every conversion is affine, so sampling it at 0 and 1 recovers its scale and offset.
+        table = []
+        for _, to_si in unit_class.unit_list:
+            offset = float(to_si(0.0))
+            table.append((float(to_si(1.0)) - offset, offset))
+        _unit_conversion_tables[unit_class] = table
+    return table
+
+
+def convert_to_si(unit_class, value, unit_index=0):
+    """Convert a saved ``(value, unit_index)`` entry to SI without going through a DataEntryWidget."""
+    if unit_class in _UNCONVERTED_UNITS:
+        return value
+    if unit_class is Units.Position:
+        # Positions are saved as [[x, y, z]] with a length unit.
+        scale, offset = unit_conversion_table(Units.Length)[unit_index]
+        return [[coordinate * scale + offset for coordinate in point] for point in value]
+
+    scale, offset = unit_conversion_table(unit_class)[unit_index]
+    return value * scale + offset
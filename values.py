@@ -18,6 +18,8 @@ rcaide_analyses = RCAIDE.Framework.Analyses.Analysis.Container() # type: ignore
 # Mission Data
 mission_data = []
 rcaide_mission = RCAIDE.Framework.Mission.Sequential_Segments()
+# Solved mission results (saved next to the project file, see tabs/solve/results_store.py)
+rcaide_results = None
 
 
 def write_to_json():